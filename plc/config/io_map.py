@@ -28,7 +28,7 @@ class SignalType(Enum):
     PULSE_IN = "PI"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IOPoint:
     """Single I/O point definition."""
     tag: str
@@ -44,6 +44,18 @@ class IOPoint:
     # For Modbus
     modbus_unit_id: int = 1
     modbus_register: int = 0
+    # Input scaling folded to raw * scale + offset (set in __post_init__)
+    _in_scale: float = field(default=0.0, init=False, repr=False, compare=False)
+    _in_offset: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        raw_range = self.raw_max - self.raw_min
+        if raw_range == 0:
+            scale = 0.0
+        else:
+            scale = (self.eng_max - self.eng_min) / raw_range
+        object.__setattr__(self, "_in_scale", scale)
+        object.__setattr__(self, "_in_offset", self.eng_min - self.raw_min * scale)
 
 
 @dataclass
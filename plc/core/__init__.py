@@ -1,7 +1,15 @@
-from plc.core.data_store import DataStore
-from plc.core.state_machine import LACTStateMachine, LACTState
-from plc.core.safety import SafetyManager
-from plc.core.controller import PLCController
+import importlib
+
+# Imported on first access (PEP 562). Loading the controller eagerly
+# here would import every process module, which in turn imports
+# plc.core.data_store, a cycle when a process module is imported first.
+_LAZY = {
+    "DataStore": "plc.core.data_store",
+    "LACTStateMachine": "plc.core.state_machine",
+    "LACTState": "plc.core.state_machine",
+    "SafetyManager": "plc.core.safety",
+    "PLCController": "plc.core.controller",
+}
 
 __all__ = [
     "DataStore",
@@ -10,3 +18,15 @@ __all__ = [
     "SafetyManager",
     "PLCController",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
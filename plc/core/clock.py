@@ -0,0 +1,14 @@
+"""
+Process Clock
+=============
+Monotonic time source for state and lockout timers. Timers call it
+through this module (``clock.monotonic()``) so tests can substitute
+a fake clock and step time instead of back-dating timer fields.
+
+Wall-clock stamps (batch start, proving runs, tag timestamps) keep
+using time.time().
+"""
+
+import time
+
+monotonic = time.monotonic
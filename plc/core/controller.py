@@ -23,6 +23,7 @@ from typing import Optional
 from plc.config.io_map import IOMap
 from plc.config.setpoints import Setpoints
 from plc.config.alarms import AlarmConfig
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.core.state_machine import LACTStateMachine, LACTState
 from plc.core.safety import SafetyManager
@@ -74,6 +75,15 @@ class PLCController:
         self.pressure = PressureMonitor(self.ds, self.sp)
         self.temperature = TemperatureMonitor(self.ds, self.sp)
 
+        # Unconditional per-scan module steps, bound once, in scan order:
+        # pressure, temperature (CTL), flow, BS&W. The state-dependent
+        # sampler/proving steps run between the two tuples.
+        self._scan_fns_pre = (
+            self.pressure.execute, self.temperature.execute,
+            self.flow.execute, self.bsw.execute,
+        )
+        self._scan_fns_post = (self.divert.execute, self.pump.execute)
+
         # Runtime state
         self._running = False
         self._scan_count = 0
@@ -178,21 +188,21 @@ class PLCController:
         # Phase 4: State machine
         self.state_machine.execute()
 
-        # Phase 5: Process modules
+        # Phase 5: Process modules against one clock.monotonic() reading;
+        # modules that store wall-clock stamps call time.time() themselves
         current_state = self.state_machine.state
-        self.pressure.execute()
-        self.temperature.execute()
-        self.flow.execute()
-        self.bsw.execute()
+        now = clock.monotonic()
+        for fn in self._scan_fns_pre:
+            fn(now)
 
         if current_state in (LACTState.RUNNING, LACTState.DIVERT):
-            self.sampler.execute(current_state)
+            self.sampler.execute(current_state, now)
 
         if current_state == LACTState.PROVING:
-            self.proving.execute()
+            self.proving.execute(now)
 
-        self.divert.execute()
-        self.pump.execute()
+        for fn in self._scan_fns_post:
+            fn(now)
 
         # Phase 6: Write outputs to physical I/O
         self.io.write_outputs(self.ds, self.io_map)
@@ -275,15 +285,15 @@ class PLCController:
             "scan_count": self._scan_count,
             "scan_time_ms": round(self._scan_time_ms, 1),
             "max_scan_time_ms": round(self._max_scan_time_ms, 1),
-            "flow_rate_bph": self.ds.read("FLOW_RATE_BPH"),
-            "flow_total_bbl": self.ds.read("FLOW_TOTAL_BBL"),
+            "flow_rate_bph": round(self.ds.read("FLOW_RATE_BPH"), 2),
+            "flow_total_bbl": round(self.ds.read("FLOW_TOTAL_BBL"), 4),
             "bsw_pct": self.ds.read("BSW_PCT"),
             "meter_temp_f": self.ds.read("AI_METER_TEMP"),
             "inlet_press_psi": self.ds.read("AI_INLET_PRESS"),
             "outlet_press_psi": self.ds.read("AI_OUTLET_PRESS"),
             "meter_factor": self.ds.read("METER_FACTOR"),
-            "batch_gross_bbl": self.ds.read("BATCH_GROSS_BBL"),
-            "batch_net_bbl": self.ds.read("BATCH_NET_BBL"),
+            "batch_gross_bbl": round(self.ds.read("BATCH_GROSS_BBL"), 4),
+            "batch_net_bbl": round(self.ds.read("BATCH_NET_BBL"), 4),
             "batch_elapsed_sec": self.ds.read("BATCH_ELAPSED_SEC"),
             "pump_running": self.ds.read("DI_PUMP_RUNNING"),
             "divert_active": self.ds.read("DO_DIVERT_CMD"),
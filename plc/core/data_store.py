@@ -11,15 +11,22 @@ import threading
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+# Tag quality codes. Plain strings, so they compare and display as the
+# names the HMI shows; every write shares these same interned objects.
+QUALITY_GOOD = "GOOD"
+QUALITY_BAD = "BAD"
+QUALITY_UNCERTAIN = "UNCERTAIN"
+QUALITY_STALE = "STALE"
 
-@dataclass
+
+@dataclass(slots=True)
 class TagValue:
     """A single tagged process value with metadata."""
     value: Any = 0
     timestamp: float = 0.0
-    quality: str = "GOOD"  # GOOD, BAD, UNCERTAIN, STALE
+    quality: str = QUALITY_GOOD  # one of the QUALITY_* codes
 
-    def set(self, value: Any, quality: str = "GOOD"):
+    def set(self, value: Any, quality: str = QUALITY_GOOD):
         self.value = value
         self.timestamp = time.time()
         self.quality = quality
@@ -136,7 +143,7 @@ class DataStore:
         with self._lock:
             return self._tags.get(tag)
 
-    def write(self, tag: str, value: Any, quality: str = "GOOD"):
+    def write(self, tag: str, value: Any, quality: str = QUALITY_GOOD):
         """Write a value to a tag."""
         with self._lock:
             if tag not in self._tags:
@@ -144,21 +151,54 @@ class DataStore:
             self._tags[tag].set(value, quality)
 
     def read_multiple(self, tags: list) -> dict:
-        """Read multiple tags atomically."""
+        """Read multiple tags atomically; unknown tags are omitted."""
+        get = self._tags.get
         with self._lock:
             return {
-                tag: self._tags[tag].value
+                tag: tv.value
                 for tag in tags
-                if tag in self._tags
+                if (tv := get(tag)) is not None
             }
 
-    def write_multiple(self, values: dict, quality: str = "GOOD"):
-        """Write multiple tags atomically."""
+    def write_multiple(self, values: dict, quality: str = QUALITY_GOOD):
+        """Write multiple tags atomically, with one shared timestamp."""
+        ts = time.time()
+        tags = self._tags
         with self._lock:
             for tag, value in values.items():
-                if tag not in self._tags:
-                    self._tags[tag] = TagValue()
-                self._tags[tag].set(value, quality)
+                tv = tags.get(tag)
+                if tv is None:
+                    tv = tags[tag] = TagValue()
+                tv.value = value
+                tv.timestamp = ts
+                tv.quality = quality
+
+    def key_handle(self, tag: str) -> TagValue:
+        """
+        Resolve a tag name once, for modules that read it every scan.
+        The handle is the tag's TagValue record, which stays in place
+        for the life of the store; unknown tags are registered.
+        """
+        with self._lock:
+            tv = self._tags.get(tag)
+            if tv is None:
+                tv = self._tags[tag] = TagValue()
+            return tv
+
+    def read_handles(self, handles: tuple) -> tuple:
+        """Read the values behind several handles atomically."""
+        with self._lock:
+            return tuple(tv.value for tv in handles)
+
+    def write_handles(self, handles: tuple, values: tuple,
+                      quality: str = QUALITY_GOOD):
+        """Write values to several handles atomically, one timestamp."""
+        ts = time.time()
+        with self._lock:
+            for tv, value in zip(handles, values):
+                tv.value = value
+                tv.timestamp = ts
+                tv.quality = quality
 
     def get_all_tags(self) -> dict:
         """Return a snapshot of all tag values."""
@@ -171,3 +211,18 @@ class DataStore:
     def tag_exists(self, tag: str) -> bool:
         with self._lock:
             return tag in self._tags
+
+    def clone(self) -> "DataStore":
+        """
+        Return an independent store holding a copy of every tag.
+        Cheaper than building a fresh store and replaying writes;
+        handles from this store do not refer into the clone.
+        """
+        new = DataStore.__new__(DataStore)
+        new._lock = threading.Lock()
+        with self._lock:
+            new._tags = {
+                tag: TagValue(tv.value, tv.timestamp, tv.quality)
+                for tag, tv in self._tags.items()
+            }
+        return new
@@ -10,7 +10,7 @@ import time
 import logging
 from typing import Optional
 
-from plc.core.data_store import DataStore
+from plc.core.data_store import DataStore, QUALITY_BAD
 from plc.config.setpoints import Setpoints
 from plc.config.alarms import (
     AlarmConfig, AlarmState, AlarmAction, AlarmPriority,
@@ -18,6 +18,9 @@ from plc.config.alarms import (
 
 logger = logging.getLogger(__name__)
 
+# Alarm summary tags, in the order _update_alarm_summary() writes them
+_SUMMARY_TAGS = ("ALARM_ACTIVE_COUNT", "ALARM_UNACK_COUNT", "HIGHEST_ALARM_PRI")
+
 
 class SafetyManager:
     """
@@ -44,6 +47,19 @@ class SafetyManager:
             for tag, defn in alarm_config.definitions.items()
         }
 
+        # Bumped whenever an alarm enters or leaves the active or
+        # unacknowledged set; the lists below are rebuilt only then.
+        # Alarm states must therefore change through this class.
+        self._alarm_version = 0
+        self._lists_version = -1
+        self._active_cache: list[AlarmState] = []
+        self._unack_cache: list[AlarmState] = []
+        self._highest_pri = AlarmPriority.INFO
+        self._summary_version = -1
+        self._summary_handles = tuple(
+            data_store.key_handle(tag) for tag in _SUMMARY_TAGS
+        )
+
         self._horn_silence_time: Optional[float] = None
         self._shutdown_requested = False
         self._divert_requested = False
@@ -71,14 +87,16 @@ class SafetyManager:
         self._check_sampler()
         self._check_air_eliminator()
 
-        self._update_alarm_summary()
-        self._drive_annunciators()
+        active, unack = self._alarm_lists()
+        self._update_alarm_summary(active, unack)
+        self._drive_annunciators(unack)
 
     def acknowledge_alarm(self, tag: str) -> bool:
         """Acknowledge a specific alarm."""
         state = self.alarm_states.get(tag)
         if state and state.active:
             state.acknowledge()
+            self._alarm_version += 1
             logger.info("Alarm acknowledged: %s", tag)
             return True
         return False
@@ -88,6 +106,7 @@ class SafetyManager:
         for state in self.alarm_states.values():
             if state.active:
                 state.acknowledge()
+                self._alarm_version += 1
 
     def silence_horn(self):
         """Silence the alarm horn (beacon stays on)."""
@@ -95,14 +114,33 @@ class SafetyManager:
 
     def get_active_alarms(self) -> list[AlarmState]:
         """Return list of currently active alarms."""
-        return [s for s in self.alarm_states.values() if s.active]
+        return list(self._alarm_lists()[0])
 
     def get_unacknowledged_alarms(self) -> list[AlarmState]:
         """Return alarms that are active but not acknowledged."""
-        return [
-            s for s in self.alarm_states.values()
-            if s.active and not s.acknowledged
-        ]
+        return list(self._alarm_lists()[1])
+
+    def is_alarm_active(self, tag: str) -> bool:
+        """True if the alarm with this tag is currently active."""
+        state = self.alarm_states.get(tag)
+        return state is not None and state.active
+
+    def unacknowledged_count(self) -> int:
+        """Number of active, unacknowledged alarms, without copying a list."""
+        return len(self._alarm_lists()[1])
+
+    def _alarm_lists(self) -> tuple:
+        """(active, unacknowledged) alarm lists, rebuilt only after a change."""
+        if self._lists_version != self._alarm_version:
+            active = [s for s in self.alarm_states.values() if s.active]
+            self._active_cache = active
+            self._unack_cache = [s for s in active if not s.acknowledged]
+            self._highest_pri = max(
+                (s.definition.priority for s in active),
+                default=AlarmPriority.INFO,
+            )
+            self._lists_version = self._alarm_version
+        return self._active_cache, self._unack_cache
 
     # ── Safety Check Functions ───────────────────────────────
 
@@ -111,7 +149,9 @@ class SafetyManager:
         state = self.alarm_states.get(tag)
         if state is None:
             return
-        state.activate(value)
+        if not state.active:
+            state.activate(value)
+            self._alarm_version += 1
         action = state.definition.action
         if action == AlarmAction.SHUTDOWN or action == AlarmAction.EMERGENCY_STOP:
             self._shutdown_requested = True
@@ -122,7 +162,10 @@ class SafetyManager:
         """Clear an alarm condition."""
         state = self.alarm_states.get(tag)
         if state:
+            was_active = state.active
             state.deactivate()
+            if was_active and not state.active:
+                self._alarm_version += 1
 
     def _check_estop(self):
         if self.ds.read("DI_ESTOP"):
@@ -149,87 +192,95 @@ class SafetyManager:
             self._deactivate("ALM_PUMP_FAIL_START")
 
     def _check_bsw(self):
-        bsw = self.ds.read("AI_BSW_PROBE")
-        bsw_quality = self.ds.read_with_quality("AI_BSW_PROBE")
+        sp = self.sp
+        # Value and quality from one lookup
+        probe = self.ds.read_with_quality("AI_BSW_PROBE")
+        bsw = probe.value
 
         # Probe failure (signal out of range)
-        if bsw_quality and bsw_quality.quality == "BAD":
+        if probe.quality == QUALITY_BAD:
             self._activate("ALM_BSW_PROBE_FAIL")
         else:
             self._deactivate("ALM_BSW_PROBE_FAIL")
 
         # High alarm
-        if bsw >= self.sp.bsw_alarm_pct:
+        if bsw >= sp.bsw_alarm_pct:
             self._activate("ALM_BSW_HIGH", bsw)
         else:
             self._deactivate("ALM_BSW_HIGH")
 
         # Divert threshold
-        if bsw >= self.sp.bsw_divert_pct:
+        if bsw >= sp.bsw_divert_pct:
             self._activate("ALM_BSW_DIVERT", bsw)
             self._divert_requested = True
         else:
             self._deactivate("ALM_BSW_DIVERT")
 
     def _check_pressures(self):
-        inlet_p = self.ds.read("AI_INLET_PRESS")
-        loop_p = self.ds.read("AI_LOOP_HI_PRESS")
-        outlet_p = self.ds.read("AI_OUTLET_PRESS")
-        strainer_dp = self.ds.read("AI_STRAINER_DP")
+        read = self.ds.read
+        sp = self.sp
+        inlet_p = read("AI_INLET_PRESS")
+        loop_p = read("AI_LOOP_HI_PRESS")
+        outlet_p = read("AI_OUTLET_PRESS")
+        strainer_dp = read("AI_STRAINER_DP")
 
         # Only check pressures when pump is running
-        pump_running = self.ds.read("DI_PUMP_RUNNING")
+        pump_running = read("DI_PUMP_RUNNING")
 
         if pump_running:
-            if inlet_p < self.sp.inlet_press_lo_psi:
+            if inlet_p < sp.inlet_press_lo_psi:
                 self._activate("ALM_INLET_PRESS_LO", inlet_p)
             else:
                 self._deactivate("ALM_INLET_PRESS_LO")
 
-        if inlet_p > self.sp.inlet_press_hi_psi:
+        if inlet_p > sp.inlet_press_hi_psi:
             self._activate("ALM_INLET_PRESS_HI", inlet_p)
         else:
             self._deactivate("ALM_INLET_PRESS_HI")
 
-        if loop_p > self.sp.loop_press_hi_psi:
+        if loop_p > sp.loop_press_hi_psi:
             self._activate("ALM_LOOP_PRESS_HI", loop_p)
         else:
             self._deactivate("ALM_LOOP_PRESS_HI")
 
         if pump_running:
-            if outlet_p < self.sp.outlet_press_lo_psi:
+            if outlet_p < sp.outlet_press_lo_psi:
                 self._activate("ALM_OUTLET_PRESS_LO", outlet_p)
             else:
                 self._deactivate("ALM_OUTLET_PRESS_LO")
 
-        if strainer_dp > self.sp.strainer_dp_hi_psi:
+        if strainer_dp > sp.strainer_dp_hi_psi:
             self._activate("ALM_STRAINER_DP_HI", strainer_dp)
         else:
             self._deactivate("ALM_STRAINER_DP_HI")
 
     def _check_temperatures(self):
-        meter_temp = self.ds.read("AI_METER_TEMP")
-        test_temp = self.ds.read("AI_TEST_THERMO")
+        read = self.ds.read
+        sp = self.sp
+        meter_temp = read("AI_METER_TEMP")
+        test_temp = read("AI_TEST_THERMO")
 
-        if meter_temp < self.sp.temp_lo_alarm_f:
+        if meter_temp < sp.temp_lo_alarm_f:
             self._activate("ALM_TEMP_LO", meter_temp)
         else:
             self._deactivate("ALM_TEMP_LO")
 
-        if meter_temp > self.sp.temp_hi_alarm_f:
+        if meter_temp > sp.temp_hi_alarm_f:
             self._activate("ALM_TEMP_HI", meter_temp)
         else:
             self._deactivate("ALM_TEMP_HI")
 
         delta = abs(meter_temp - test_temp)
-        if delta > self.sp.temp_max_delta_f:
+        if delta > sp.temp_max_delta_f:
             self._activate("ALM_TEMP_DELTA", delta)
         else:
             self._deactivate("ALM_TEMP_DELTA")
 
     def _check_flow(self):
-        flow_rate = self.ds.read("FLOW_RATE_BPH")
-        pump_running = self.ds.read("DI_PUMP_RUNNING")
+        read = self.ds.read
+        sp = self.sp
+        flow_rate = read("FLOW_RATE_BPH")
+        pump_running = read("DI_PUMP_RUNNING")
 
         if not pump_running:
             self._deactivate("ALM_FLOW_LO")
@@ -237,12 +288,12 @@ class SafetyManager:
             self._deactivate("ALM_NO_FLOW")
             return
 
-        if flow_rate < self.sp.meter_min_flow_bph and flow_rate > 0:
+        if flow_rate < sp.meter_min_flow_bph and flow_rate > 0:
             self._activate("ALM_FLOW_LO", flow_rate)
         else:
             self._deactivate("ALM_FLOW_LO")
 
-        if flow_rate > self.sp.meter_max_flow_bph:
+        if flow_rate > sp.meter_max_flow_bph:
             self._activate("ALM_FLOW_HI", flow_rate)
         else:
             self._deactivate("ALM_FLOW_HI")
@@ -250,23 +301,25 @@ class SafetyManager:
         # No flow with pump running
         if flow_rate == 0 and pump_running:
             pump_tag = self.ds.read_with_quality("DI_PUMP_RUNNING")
-            if pump_tag and (time.time() - pump_tag.timestamp) > self.sp.meter_no_flow_timeout_sec:
+            if pump_tag and (time.time() - pump_tag.timestamp) > sp.meter_no_flow_timeout_sec:
                 self._activate("ALM_NO_FLOW")
         else:
             self._deactivate("ALM_NO_FLOW")
 
     def _check_divert_valve(self):
-        cmd = self.ds.read("DO_DIVERT_CMD")
-        at_sales = self.ds.read("DI_DIVERT_SALES")
-        at_divert = self.ds.read("DI_DIVERT_DIVERT")
+        read = self.ds.read
+        sp = self.sp
+        cmd = read("DO_DIVERT_CMD")
+        at_sales = read("DI_DIVERT_SALES")
+        at_divert = read("DI_DIVERT_DIVERT")
 
         # Check for travel timeout (only when command has been actively written)
         cmd_tag = self.ds.read_with_quality("DO_DIVERT_CMD")
         if cmd_tag and cmd_tag.timestamp > 0:
             elapsed = time.time() - cmd_tag.timestamp
-            if cmd and not at_divert and elapsed > self.sp.divert_travel_timeout_sec:
+            if cmd and not at_divert and elapsed > sp.divert_travel_timeout_sec:
                 self._activate("ALM_DIVERT_FAIL")
-            elif not cmd and not at_sales and elapsed > self.sp.divert_travel_timeout_sec:
+            elif not cmd and not at_sales and elapsed > sp.divert_travel_timeout_sec:
                 self._activate("ALM_DIVERT_FAIL")
             else:
                 self._deactivate("ALM_DIVERT_FAIL")
@@ -287,20 +340,17 @@ class SafetyManager:
 
     # ── Alarm Summary & Annunciators ─────────────────────────
 
-    def _update_alarm_summary(self):
-        active = self.get_active_alarms()
-        unack = self.get_unacknowledged_alarms()
-        highest = max(
-            (a.definition.priority for a in active),
-            default=AlarmPriority.INFO,
-        )
-        self.ds.write("ALARM_ACTIVE_COUNT", len(active))
-        self.ds.write("ALARM_UNACK_COUNT", len(unack))
-        self.ds.write("HIGHEST_ALARM_PRI", int(highest))
+    def _update_alarm_summary(self, active: list, unack: list):
+        """Publish counts and highest priority, only when they may differ."""
+        if self._summary_version == self._alarm_version:
+            return
+        self.ds.write_handles(self._summary_handles, (
+            len(active), len(unack), int(self._highest_pri),
+        ))
+        self._summary_version = self._alarm_version
 
-    def _drive_annunciators(self):
+    def _drive_annunciators(self, unack: list):
         """Control beacon and horn based on alarm state."""
-        unack = self.get_unacknowledged_alarms()
         has_annunciate = any(
             a.definition.action.value >= AlarmAction.ANNUNCIATE.value
             for a in unack
@@ -21,6 +21,7 @@ from enum import Enum
 import time
 import logging
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
 
@@ -49,6 +50,26 @@ _TRANSITIONS = {
     LACTState.E_STOP:   [LACTState.IDLE],
 }
 
+# Legality as bitmasks: bit i of _LEGAL[src] set means src may move to
+# the state whose bit is _STATE_BIT[dst] == 1 << i
+_STATE_BIT = {state: 1 << i for i, state in enumerate(LACTState)}
+_LEGAL = {
+    src: sum(_STATE_BIT[dst] for dst in targets)
+    for src, targets in _TRANSITIONS.items()
+}
+
+# Outputs forced every scan in IDLE and E_STOP: (tags, values)
+_IDLE_OUTPUTS = (
+    ("DO_PUMP_START", "DO_SAMPLE_SOL", "DO_SAMPLE_MIX_PUMP", "DO_STATUS_GREEN"),
+    (False, False, False, False),
+)
+_ESTOP_OUTPUTS = (
+    ("DO_PUMP_START", "DO_DIVERT_CMD", "DO_SAMPLE_SOL", "DO_SAMPLE_MIX_PUMP",
+     "DO_PROVER_VLV_CMD", "DO_STATUS_GREEN", "DO_ALARM_BEACON", "DO_ALARM_HORN"),
+    # Divert for safety; beacon and horn on
+    (False, True, False, False, False, False, True, True),
+)
+
 
 class LACTStateMachine:
     """
@@ -63,14 +84,26 @@ class LACTStateMachine:
         self.ds = data_store
         self.sp = setpoints
         self.state = LACTState.IDLE
-        self._state_entry_time = time.time()
+        self._state_entry_time = clock.monotonic()
         self._startup_step = 0
         self._shutdown_step = 0
         self._request_state: LACTState = None
+        # Tags touched on every scan are resolved once, not hashed per read
+        self._estop_handle = data_store.key_handle("DI_ESTOP")
+        self._state_handles = (
+            data_store.key_handle("PREV_STATE"),
+            data_store.key_handle("LACT_STATE"),
+        )
+        self._idle_handles = tuple(
+            data_store.key_handle(tag) for tag in _IDLE_OUTPUTS[0]
+        )
+        self._estop_handles = tuple(
+            data_store.key_handle(tag) for tag in _ESTOP_OUTPUTS[0]
+        )
 
     @property
     def time_in_state(self) -> float:
-        return time.time() - self._state_entry_time
+        return clock.monotonic() - self._state_entry_time
 
     def request_transition(self, target: LACTState):
         """Request a state change (validated on next scan)."""
@@ -78,7 +111,7 @@ class LACTStateMachine:
 
     def _transition(self, target: LACTState) -> bool:
         """Execute a validated state transition."""
-        if target not in _TRANSITIONS.get(self.state, []):
+        if not _LEGAL.get(self.state, 0) & _STATE_BIT.get(target, 0):
             logger.warning(
                 "Illegal transition %s -> %s", self.state.value, target.value
             )
@@ -86,14 +119,14 @@ class LACTStateMachine:
 
         prev = self.state
         logger.info("State transition: %s -> %s", prev.value, target.value)
-        self.ds.write("PREV_STATE", prev.value)
 
         self.state = target
-        self._state_entry_time = time.time()
+        self._state_entry_time = clock.monotonic()
         self._startup_step = 0
         self._shutdown_step = 0
 
-        self.ds.write("LACT_STATE", target.value)
+        # Both names published together, so readers never see a mix
+        self.ds.write_handles(self._state_handles, (prev.value, target.value))
         return True
 
     def execute(self):
@@ -108,7 +141,7 @@ class LACTStateMachine:
             self._request_state = None
 
         # E-Stop override from any state
-        if self.ds.read("DI_ESTOP") and self.state != LACTState.E_STOP:
+        if self._estop_handle.value and self.state != LACTState.E_STOP:
             transitioned = self._transition(LACTState.E_STOP)
 
         # Skip handler on the scan where we just transitioned,
@@ -130,14 +163,23 @@ class LACTStateMachine:
         if handler:
             handler()
 
+    def run_until(self, target: LACTState, max_scans: int = 10) -> int:
+        """
+        Scan until the machine reaches target (bench testing and
+        commissioning). Returns the number of scans taken, or 0 if
+        target was not reached within max_scans.
+        """
+        for scan in range(1, max_scans + 1):
+            self.execute()
+            if self.state == target:
+                return scan
+        return 0
+
     # ── State Handlers ───────────────────────────────────────
 
     def _handle_idle(self):
         """IDLE: All outputs off, waiting for start command."""
-        self.ds.write("DO_PUMP_START", False)
-        self.ds.write("DO_SAMPLE_SOL", False)
-        self.ds.write("DO_SAMPLE_MIX_PUMP", False)
-        self.ds.write("DO_STATUS_GREEN", False)
+        self.ds.write_handles(self._idle_handles, _IDLE_OUTPUTS[1])
 
     def _handle_startup(self):
         """
@@ -261,16 +303,9 @@ class LACTStateMachine:
 
     def _handle_estop(self):
         """E_STOP: Immediate halt of all outputs."""
-        self.ds.write("DO_PUMP_START", False)
-        self.ds.write("DO_DIVERT_CMD", True)  # Divert for safety
-        self.ds.write("DO_SAMPLE_SOL", False)
-        self.ds.write("DO_SAMPLE_MIX_PUMP", False)
-        self.ds.write("DO_PROVER_VLV_CMD", False)
-        self.ds.write("DO_STATUS_GREEN", False)
-        self.ds.write("DO_ALARM_BEACON", True)
-        self.ds.write("DO_ALARM_HORN", True)
+        self.ds.write_handles(self._estop_handles, _ESTOP_OUTPUTS[1])
 
         # Reset only when E-STOP is released
-        if not self.ds.read("DI_ESTOP"):
+        if not self._estop_handle.value:
             if self.time_in_state > 2.0:  # Debounce
                 self._transition(LACTState.IDLE)
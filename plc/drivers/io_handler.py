@@ -16,14 +16,22 @@ independent of the physical I/O mechanism.
 import logging
 from typing import Protocol
 
-from plc.core.data_store import DataStore
+from plc.core.data_store import DataStore, QUALITY_BAD
 from plc.config.io_map import IOMap, IOPoint, SignalType
 
 logger = logging.getLogger(__name__)
 
 
 class IOBackend(Protocol):
-    """Protocol for I/O backend implementations."""
+    """
+    Protocol for I/O backend implementations.
+
+    A backend may also provide block transfers over consecutive
+    addresses -- ``read_digital_block(start, count)``,
+    ``read_analog_block(start, count)`` and
+    ``write_digital_block(start, values)`` -- which IOHandler then
+    uses in place of one call per point.
+    """
 
     def read_digital(self, address: int) -> bool: ...
     def write_digital(self, address: int, value: bool) -> None: ...
@@ -32,6 +40,23 @@ class IOBackend(Protocol):
     def read_pulse_count(self, address: int) -> int: ...
 
 
+def _address_runs(points: dict, batched: bool) -> tuple:
+    """
+    Group I/O points into runs of consecutive addresses, as
+    ((start, ((tag, point), ...)), ...). Without block transfers
+    every point is its own run.
+    """
+    runs = []
+    last = None
+    for tag, point in sorted(points.items(), key=lambda item: item[1].address):
+        if batched and runs and point.address == last + 1:
+            runs[-1][1].append((tag, point))
+        else:
+            runs.append((point.address, [(tag, point)]))
+        last = point.address
+    return tuple((start, tuple(members)) for start, members in runs)
+
+
 class IOHandler:
     """
     Bridges the DataStore to physical I/O via a pluggable backend.
@@ -43,27 +68,60 @@ class IOHandler:
 
     def __init__(self, backend: IOBackend):
         self.backend = backend
+        # Per-section transfer functions over (start, count) / (start, values)
+        self._read_di = getattr(backend, "read_digital_block", None)
+        self._read_ai = getattr(backend, "read_analog_block", None)
+        self._write_do = getattr(backend, "write_digital_block", None)
+        self._batched = {
+            "DI": self._read_di is not None,
+            "AI": self._read_ai is not None,
+            "DO": self._write_do is not None,
+        }
+        if self._read_di is None:
+            self._read_di = lambda start, count: (backend.read_digital(start),)
+        if self._read_ai is None:
+            self._read_ai = lambda start, count: (backend.read_analog(start),)
+        if self._write_do is None:
+            self._write_do = lambda start, values: backend.write_digital(start, values[0])
+        # Address runs per IOMap section, rebuilt whenever a point is
+        # added, removed or replaced (IOPoint equality covers its address)
+        self._runs: dict = {}  # section → (((tag, point), ...), runs)
+
+    def _section_runs(self, section: str, points: dict) -> tuple:
+        """Cached address runs for one IOMap section."""
+        key = tuple(points.items())
+        cached = self._runs.get(section)
+        if cached is None or cached[0] != key:
+            cached = (key, _address_runs(points, self._batched[section]))
+            self._runs[section] = cached
+        return cached[1]
 
     def read_inputs(self, ds: DataStore, io_map: IOMap):
         """Read all physical inputs into the DataStore."""
         # Digital inputs
-        for tag, point in io_map.digital_inputs.items():
+        for start, members in self._section_runs("DI", io_map.digital_inputs):
             try:
-                raw = self.backend.read_digital(point.address)
-                ds.write(tag, bool(raw))
+                raw = self._read_di(start, len(members))
+                ds.write_multiple({
+                    tag: bool(value) for (tag, _), value in zip(members, raw)
+                })
             except Exception:
-                ds.write(tag, False, quality="BAD")
-                logger.warning("DI read failed: %s", tag)
+                ds.write_multiple({tag: False for tag, _ in members}, quality=QUALITY_BAD)
+                for tag, _ in members:
+                    logger.warning("DI read failed: %s", tag)
 
         # Analog inputs
-        for tag, point in io_map.analog_inputs.items():
+        for start, members in self._section_runs("AI", io_map.analog_inputs):
             try:
-                raw = self.backend.read_analog(point.address)
-                eng = self._scale_input(raw, point)
-                ds.write(tag, round(eng, 3))
+                raw = self._read_ai(start, len(members))
+                ds.write_multiple({
+                    tag: round(self._scale_input(value, point), 3)
+                    for (tag, point), value in zip(members, raw)
+                })
             except Exception:
-                ds.write(tag, 0.0, quality="BAD")
-                logger.warning("AI read failed: %s", tag)
+                ds.write_multiple({tag: 0.0 for tag, _ in members}, quality=QUALITY_BAD)
+                for tag, _ in members:
+                    logger.warning("AI read failed: %s", tag)
 
         # Pulse inputs
         for tag, point in io_map.pulse_inputs.items():
@@ -71,18 +129,19 @@ class IOHandler:
                 count = self.backend.read_pulse_count(point.address)
                 ds.write(tag, count)
             except Exception:
-                ds.write(tag, 0, quality="BAD")
+                ds.write(tag, 0, quality=QUALITY_BAD)
                 logger.warning("PI read failed: %s", tag)
 
     def write_outputs(self, ds: DataStore, io_map: IOMap):
         """Write DataStore outputs to physical I/O."""
         # Digital outputs
-        for tag, point in io_map.digital_outputs.items():
+        for start, members in self._section_runs("DO", io_map.digital_outputs):
             try:
-                value = bool(ds.read(tag))
-                self.backend.write_digital(point.address, value)
+                values = ds.read_multiple([tag for tag, _ in members])
+                self._write_do(start, [bool(values.get(tag)) for tag, _ in members])
             except Exception:
-                logger.warning("DO write failed: %s", tag)
+                for tag, _ in members:
+                    logger.warning("DO write failed: %s", tag)
 
         # Analog outputs
         for tag, point in io_map.analog_outputs.items():
@@ -96,12 +155,7 @@ class IOHandler:
     @staticmethod
     def _scale_input(raw: int, point: IOPoint) -> float:
         """Scale raw ADC value to engineering units."""
-        raw_range = point.raw_max - point.raw_min
-        eng_range = point.eng_max - point.eng_min
-        if raw_range == 0:
-            return point.eng_min
-        proportion = (raw - point.raw_min) / raw_range
-        return point.eng_min + (proportion * eng_range)
+        return raw * point._in_scale + point._in_offset
 
     @staticmethod
     def _scale_output(eng_value: float, point: IOPoint) -> int:
@@ -21,6 +21,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+SIM_K_FACTOR = 100.0  # simulated meter pulses per barrel
+
 
 class HardwareSimulator:
     """
@@ -44,6 +46,7 @@ class HardwareSimulator:
 
         self._flow_rate_bph = 0.0
         self._pulse_count = 0
+        self._pulse_residual = 0.0  # fraction of a pulse carried between ticks
         self._last_pulse_time = time.time()
 
         self._bsw_base = 0.3  # Base BS&W percentage
@@ -83,6 +86,21 @@ class HardwareSimulator:
         """Write an analog output."""
         self._ao[address] = value
 
+    def read_digital_block(self, start: int, count: int) -> list:
+        """Read consecutive digital inputs on one simulation tick."""
+        self._update_simulation()
+        return [self._get_di(address) for address in range(start, start + count)]
+
+    def write_digital_block(self, start: int, values: list) -> None:
+        """Write consecutive digital outputs."""
+        for address, value in enumerate(values, start):
+            self.write_digital(address, value)
+
+    def read_analog_block(self, start: int, count: int) -> list:
+        """Read consecutive analog inputs on one simulation tick."""
+        self._update_simulation()
+        return [self._get_ai_raw(address) for address in range(start, start + count)]
+
     def read_pulse_count(self, address: int) -> int:
         """Read the accumulated pulse count from the meter."""
         self._update_simulation()
@@ -140,12 +158,14 @@ class HardwareSimulator:
             if self._flow_rate_bph < 1.0:
                 self._flow_rate_bph = 0.0
 
-        # Generate meter pulses based on flow
+        # Generate meter pulses based on flow. Every I/O read ticks the
+        # simulation, so dt is often a small fraction of a pulse; the
+        # remainder is carried rather than truncated away.
         if self._flow_rate_bph > 0:
-            k_factor = 100.0  # pulses per barrel
-            bbl_per_sec = self._flow_rate_bph / 3600.0
-            pulses_per_sec = bbl_per_sec * k_factor
-            new_pulses = int(pulses_per_sec * dt)
+            pulses = (self._pulse_residual
+                      + self._flow_rate_bph * SIM_K_FACTOR * dt / 3600.0)
+            new_pulses = int(pulses)
+            self._pulse_residual = pulses - new_pulses
             self._pulse_count += new_pulses
 
         # Divert valve travel
@@ -191,35 +211,16 @@ class HardwareSimulator:
 
     def _get_di(self, address: int) -> bool:
         """Map address to simulated digital input state."""
-        di_map = {
-            0: True,   # DI_INLET_VLV_OPEN (always open in sim)
-            1: False,  # DI_INLET_VLV_CLOSED
-            2: False,  # DI_STRAINER_HI_DP
-            3: self._pump_run_feedback,  # DI_PUMP_RUNNING
-            4: self._pump_overload,      # DI_PUMP_OVERLOAD
-            5: self._divert_position < 0.1,   # DI_DIVERT_SALES
-            6: self._divert_position > 0.9,   # DI_DIVERT_DIVERT
-            7: self._sample_pot_level >= 15.0,  # DI_SAMPLE_POT_HI
-            8: self._sample_pot_level <= 0.5,   # DI_SAMPLE_POT_LO
-            9: self._prover_valve_open,   # DI_PROVER_VLV_OPEN
-            10: False,  # DI_AIR_ELIM_FLOAT
-            11: True,   # DI_OUTLET_VLV_OPEN (always open in sim)
-            12: self._estop,  # DI_ESTOP
-        }
-        return di_map.get(address, False)
+        if 0 <= address < len(_DI_CHANNELS):
+            return _DI_CHANNELS[address](self)
+        return False
 
     def _get_ai_raw(self, address: int) -> int:
         """Map address to simulated analog input (raw 0-4095)."""
-        ai_map = {
-            0: self._psi_to_raw(self._inlet_pressure, 0, 300),
-            1: self._psi_to_raw(self._inlet_pressure * 0.95, 0, 300),
-            2: self._psi_to_raw(random.gauss(2.0, 0.3), 0, 50),  # Strainer DP
-            3: self._pct_to_raw(self._bsw_base + random.gauss(0, 0.01), 0, 5),
-            4: self._temp_to_raw(self._temperature, -20, 200),
-            5: self._temp_to_raw(self._temperature + random.gauss(0, 0.3), -20, 200),
-            6: self._psi_to_raw(self._outlet_pressure, 0, 300),
-        }
-        return ai_map.get(address, 0)
+        # Only the requested channel is evaluated (and draws its noise)
+        if 0 <= address < len(_AI_CHANNELS):
+            return _AI_CHANNELS[address](self)
+        return 0
 
     @staticmethod
     def _psi_to_raw(psi: float, eng_min: float, eng_max: float) -> int:
@@ -238,3 +239,33 @@ class HardwareSimulator:
         """Convert temperature °F to raw ADC (0-4095)."""
         proportion = (temp_f - eng_min) / (eng_max - eng_min)
         return int(max(0, min(4095, proportion * 4095)))
+
+
+# ── Channel Tables ────────────────────────────────────────────
+# Indexed by I/O address; each entry maps the simulator to one input.
+
+_DI_CHANNELS = (
+    lambda s: True,   # DI_INLET_VLV_OPEN (always open in sim)
+    lambda s: False,  # DI_INLET_VLV_CLOSED
+    lambda s: False,  # DI_STRAINER_HI_DP
+    lambda s: s._pump_run_feedback,  # DI_PUMP_RUNNING
+    lambda s: s._pump_overload,      # DI_PUMP_OVERLOAD
+    lambda s: s._divert_position < 0.1,   # DI_DIVERT_SALES
+    lambda s: s._divert_position > 0.9,   # DI_DIVERT_DIVERT
+    lambda s: s._sample_pot_level >= 15.0,  # DI_SAMPLE_POT_HI
+    lambda s: s._sample_pot_level <= 0.5,   # DI_SAMPLE_POT_LO
+    lambda s: s._prover_valve_open,   # DI_PROVER_VLV_OPEN
+    lambda s: False,  # DI_AIR_ELIM_FLOAT
+    lambda s: True,   # DI_OUTLET_VLV_OPEN (always open in sim)
+    lambda s: s._estop,  # DI_ESTOP
+)
+
+_AI_CHANNELS = (
+    lambda s: s._psi_to_raw(s._inlet_pressure, 0, 300),
+    lambda s: s._psi_to_raw(s._inlet_pressure * 0.95, 0, 300),
+    lambda s: s._psi_to_raw(random.gauss(2.0, 0.3), 0, 50),  # Strainer DP
+    lambda s: s._pct_to_raw(s._bsw_base + random.gauss(0, 0.01), 0, 5),
+    lambda s: s._temp_to_raw(s._temperature, -20, 200),
+    lambda s: s._temp_to_raw(s._temperature + random.gauss(0, 0.3), -20, 200),
+    lambda s: s._psi_to_raw(s._outlet_pressure, 0, 300),
+)
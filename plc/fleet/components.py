@@ -76,7 +76,7 @@ class PowerRating(Enum):
 
 # ── Component Definitions ────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IOSignature:
     """Defines what I/O signals a component needs."""
     digital_inputs: tuple = ()   # Tag name templates
@@ -86,7 +86,7 @@ class IOSignature:
     pulse_inputs: tuple = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeterSpec:
     """Positive displacement or turbine flow meter."""
     manufacturer: str
@@ -108,7 +108,7 @@ class MeterSpec:
         return f"{self.manufacturer} {self.model} ({self.size_inches}\")"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PumpSpec:
     """Transfer pump specification."""
     manufacturer: str
@@ -124,7 +124,7 @@ class PumpSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DivertValveSpec:
     """Divert valve (sales/reject routing)."""
     manufacturer: str
@@ -139,7 +139,7 @@ class DivertValveSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BSWProbeSpec:
     """BS&W probe specification."""
     manufacturer: str
@@ -152,7 +152,7 @@ class BSWProbeSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SamplerSpec:
     """Sampler system specification."""
     manufacturer: str
@@ -167,7 +167,7 @@ class SamplerSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProverSpec:
     """Meter prover specification."""
     manufacturer: str
@@ -180,7 +180,7 @@ class ProverSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackpressureValveSpec:
     """Backpressure control valve."""
     manufacturer: str
@@ -192,7 +192,7 @@ class BackpressureValveSpec:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PressureTransmitterSpec:
     """Pressure transmitter."""
     manufacturer: str
@@ -201,7 +201,7 @@ class PressureTransmitterSpec:
     output_ma: str = "4-20"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrainerSpec:
     """Inlet strainer."""
     manufacturer: str
@@ -11,6 +11,10 @@ running PLC controller. A unit profile goes in; a ready-to-run
 configuration comes out.
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
 from plc.config.io_map import IOMap, IOPoint, SignalType
 from plc.config.setpoints import Setpoints
 from plc.config.alarms import AlarmConfig, AlarmDefinition, AlarmPriority, AlarmAction
@@ -22,6 +26,205 @@ from plc.fleet.components import (
 )
 
 
+# ── Tag Names ────────────────────────────────────────────────
+# Interned once at import so every generated IOMap shares the same
+# key objects for its dict keys and IOPoint.tag values.
+
+# Digital inputs
+TAG_DI_INLET_VLV_OPEN = sys.intern("DI_INLET_VLV_OPEN")
+TAG_DI_INLET_VLV_CLOSED = sys.intern("DI_INLET_VLV_CLOSED")
+TAG_DI_STRAINER_HI_DP = sys.intern("DI_STRAINER_HI_DP")
+TAG_DI_PUMP_RUNNING = sys.intern("DI_PUMP_RUNNING")
+TAG_DI_PUMP_OVERLOAD = sys.intern("DI_PUMP_OVERLOAD")
+TAG_DI_DIVERT_SALES = sys.intern("DI_DIVERT_SALES")
+TAG_DI_DIVERT_DIVERT = sys.intern("DI_DIVERT_DIVERT")
+TAG_DI_SAMPLE_POT_HI = sys.intern("DI_SAMPLE_POT_HI")
+TAG_DI_SAMPLE_POT_LO = sys.intern("DI_SAMPLE_POT_LO")
+TAG_DI_PROVER_VLV_OPEN = sys.intern("DI_PROVER_VLV_OPEN")
+TAG_DI_AIR_ELIM_FLOAT = sys.intern("DI_AIR_ELIM_FLOAT")
+TAG_DI_OUTLET_VLV_OPEN = sys.intern("DI_OUTLET_VLV_OPEN")
+TAG_DI_ESTOP = sys.intern("DI_ESTOP")
+
+# Digital outputs
+TAG_DO_PUMP_START = sys.intern("DO_PUMP_START")
+TAG_DO_DIVERT_CMD = sys.intern("DO_DIVERT_CMD")
+TAG_DO_SAMPLE_SOL = sys.intern("DO_SAMPLE_SOL")
+TAG_DO_SAMPLE_MIX_PUMP = sys.intern("DO_SAMPLE_MIX_PUMP")
+TAG_DO_PROVER_VLV_CMD = sys.intern("DO_PROVER_VLV_CMD")
+TAG_DO_ALARM_BEACON = sys.intern("DO_ALARM_BEACON")
+TAG_DO_ALARM_HORN = sys.intern("DO_ALARM_HORN")
+TAG_DO_STATUS_GREEN = sys.intern("DO_STATUS_GREEN")
+
+# Analog inputs
+TAG_AI_INLET_PRESS = sys.intern("AI_INLET_PRESS")
+TAG_AI_LOOP_HI_PRESS = sys.intern("AI_LOOP_HI_PRESS")
+TAG_AI_STRAINER_DP = sys.intern("AI_STRAINER_DP")
+TAG_AI_BSW_PROBE = sys.intern("AI_BSW_PROBE")
+TAG_AI_METER_TEMP = sys.intern("AI_METER_TEMP")
+TAG_AI_TEST_THERMO = sys.intern("AI_TEST_THERMO")
+TAG_AI_OUTLET_PRESS = sys.intern("AI_OUTLET_PRESS")
+
+# Pulse inputs
+TAG_PI_METER_PULSE = sys.intern("PI_METER_PULSE")
+
+# Analog outputs
+TAG_AO_BP_SALES_SP = sys.intern("AO_BP_SALES_SP")
+TAG_AO_BP_DIVERT_SP = sys.intern("AO_BP_DIVERT_SP")
+
+# ── I/O Point Templates ──────────────────────────────────────
+# Feature bits for the optional I/O points. A unit's feature mask
+# fully determines which points it gets and their addresses.
+
+_F_STRAINER = 1 << 0
+_F_AIR_ELIMINATOR = 1 << 1
+_F_TEST_THERMOWELL = 1 << 2
+_F_LOOP_PRESS = 1 << 3       # >= 2 pressure transmitters
+_F_OUTLET_PRESS = 1 << 4     # >= 3 pressure transmitters
+_F_BP_SALES = 1 << 5         # >= 1 backpressure valve
+_F_BP_DIVERT = 1 << 6        # >= 2 backpressure valves
+_F_MIX_PUMP = 1 << 7
+_F_PROVER = 1 << 8
+_F_METER_TEMP = 1 << 9
+_F_METER_PULSE = 1 << 10
+
+# First Modbus register for each signal type
+_REGISTER_BASE = {
+    SignalType.DIGITAL_IN: 0,
+    SignalType.DIGITAL_OUT: 100,
+    SignalType.ANALOG_IN: 200,
+    SignalType.PULSE_IN: 300,
+    SignalType.ANALOG_OUT: 400,
+}
+
+_PSI = {"unit": "PSI", "eng_min": 0.0, "eng_max": 300.0}
+_DEG_F = {"unit": "°F", "eng_min": -20.0, "eng_max": 200.0}
+_BP_PSI = {"unit": "PSI", "eng_min": 0.0, "eng_max": 150.0}
+
+# (tag, signal type, required feature bit or 0, IOPoint fields)
+# Within each signal type, entries are listed in address order.
+_IO_TEMPLATES = (
+    # Inlet
+    (TAG_DI_INLET_VLV_OPEN, SignalType.DIGITAL_IN, 0,
+     {"description": "Inlet ball valve - open limit switch"}),
+    (TAG_DI_INLET_VLV_CLOSED, SignalType.DIGITAL_IN, 0,
+     {"description": "Inlet ball valve - closed limit switch"}),
+    # Strainer (description filled in per unit with the mesh size)
+    (TAG_DI_STRAINER_HI_DP, SignalType.DIGITAL_IN, _F_STRAINER, {}),
+    # Pump
+    (TAG_DI_PUMP_RUNNING, SignalType.DIGITAL_IN, 0,
+     {"description": "Transfer pump motor running feedback"}),
+    (TAG_DI_PUMP_OVERLOAD, SignalType.DIGITAL_IN, 0,
+     {"description": "Transfer pump motor overload relay trip"}),
+    (TAG_DO_PUMP_START, SignalType.DIGITAL_OUT, 0,
+     {"description": "Transfer pump motor contactor coil"}),
+    # Divert valve
+    (TAG_DI_DIVERT_SALES, SignalType.DIGITAL_IN, 0,
+     {"description": "Divert valve at SALES position"}),
+    (TAG_DI_DIVERT_DIVERT, SignalType.DIGITAL_IN, 0,
+     {"description": "Divert valve at DIVERT position"}),
+    (TAG_DO_DIVERT_CMD, SignalType.DIGITAL_OUT, 0,
+     {"description": "Divert valve command (0=SALES, 1=DIVERT)"}),
+    # Sampler
+    (TAG_DI_SAMPLE_POT_HI, SignalType.DIGITAL_IN, 0,
+     {"description": "Sample receiver pot high level"}),
+    (TAG_DI_SAMPLE_POT_LO, SignalType.DIGITAL_IN, 0,
+     {"description": "Sample receiver pot low level"}),
+    (TAG_DO_SAMPLE_SOL, SignalType.DIGITAL_OUT, 0,
+     {"description": "Sample solenoid valve"}),
+    (TAG_DO_SAMPLE_MIX_PUMP, SignalType.DIGITAL_OUT, _F_MIX_PUMP,
+     {"description": "Sample pot mixing pump"}),
+    # Prover
+    (TAG_DI_PROVER_VLV_OPEN, SignalType.DIGITAL_IN, _F_PROVER,
+     {"description": "Prover DBB valve - open"}),
+    (TAG_DO_PROVER_VLV_CMD, SignalType.DIGITAL_OUT, _F_PROVER,
+     {"description": "Prover DBB valve open command"}),
+    # Air eliminator
+    (TAG_DI_AIR_ELIM_FLOAT, SignalType.DIGITAL_IN, _F_AIR_ELIMINATOR,
+     {"description": "Air eliminator float switch (gas detected)"}),
+    # Outlet
+    (TAG_DI_OUTLET_VLV_OPEN, SignalType.DIGITAL_IN, 0,
+     {"description": "Outlet ball valve - open limit switch"}),
+    # E-Stop
+    (TAG_DI_ESTOP, SignalType.DIGITAL_IN, 0,
+     {"description": "Emergency stop pushbutton (NC contact)"}),
+    # Annunciation
+    (TAG_DO_ALARM_BEACON, SignalType.DIGITAL_OUT, 0,
+     {"description": "Alarm beacon (visual)"}),
+    (TAG_DO_ALARM_HORN, SignalType.DIGITAL_OUT, 0,
+     {"description": "Alarm horn (audible)"}),
+    (TAG_DO_STATUS_GREEN, SignalType.DIGITAL_OUT, 0,
+     {"description": "Running status light (green)"}),
+    # Analog inputs
+    (TAG_AI_INLET_PRESS, SignalType.ANALOG_IN, 0,
+     {"description": "Inlet pressure transmitter", **_PSI}),
+    (TAG_AI_LOOP_HI_PRESS, SignalType.ANALOG_IN, _F_LOOP_PRESS,
+     {"description": "Loop high-point pressure", **_PSI}),
+    (TAG_AI_STRAINER_DP, SignalType.ANALOG_IN, _F_STRAINER,
+     {"description": "Strainer differential pressure",
+      "unit": "PSI", "eng_min": 0.0, "eng_max": 50.0}),
+    # BS&W range (eng_max) filled in per unit from the probe spec
+    (TAG_AI_BSW_PROBE, SignalType.ANALOG_IN, 0,
+     {"description": "BS&W probe", "unit": "%", "eng_min": 0.0}),
+    (TAG_AI_METER_TEMP, SignalType.ANALOG_IN, _F_METER_TEMP,
+     {"description": "Meter TA probe temperature", **_DEG_F}),
+    (TAG_AI_TEST_THERMO, SignalType.ANALOG_IN, _F_TEST_THERMOWELL,
+     {"description": "Test thermowell downstream of meter", **_DEG_F}),
+    (TAG_AI_OUTLET_PRESS, SignalType.ANALOG_IN, _F_OUTLET_PRESS,
+     {"description": "Outlet pressure transmitter", **_PSI}),
+    # Pulse inputs (description filled in per unit with the meter name)
+    (TAG_PI_METER_PULSE, SignalType.PULSE_IN, _F_METER_PULSE,
+     {"unit": "pulses"}),
+    # Analog outputs
+    (TAG_AO_BP_SALES_SP, SignalType.ANALOG_OUT, _F_BP_SALES,
+     {"description": "Backpressure valve setpoint - sales", **_BP_PSI}),
+    (TAG_AO_BP_DIVERT_SP, SignalType.ANALOG_OUT, _F_BP_DIVERT,
+     {"description": "Backpressure valve setpoint - divert", **_BP_PSI}),
+)
+
+
+@lru_cache(maxsize=None)
+def _address_table(mask: int) -> dict:
+    """Map tag → address for every template point enabled by ``mask``."""
+    next_address = dict.fromkeys(_REGISTER_BASE, 0)
+    addresses = {}
+    for tag, signal_type, feature, _ in _IO_TEMPLATES:
+        if feature and not mask & feature:
+            continue
+        addresses[tag] = next_address[signal_type]
+        next_address[signal_type] += 1
+    return addresses
+
+
+@lru_cache(maxsize=None)
+def _io_counts(mask: int) -> dict:
+    """Number of I/O points per signal type enabled by ``mask``."""
+    counts = dict.fromkeys(_REGISTER_BASE, 0)
+    for tag, signal_type, feature, _ in _IO_TEMPLATES:
+        if not feature or mask & feature:
+            counts[signal_type] += 1
+    return counts
+
+
+@lru_cache(maxsize=None)
+def _strainer_description(mesh: int) -> str:
+    return f"Strainer high DP switch ({mesh} mesh)"
+
+
+@lru_cache(maxsize=None)
+def _meter_pulse_description(meter) -> str:
+    return f"{meter.display_name} pulse output"
+
+
+@lru_cache(maxsize=128)
+def _io_sections(comp) -> tuple:
+    """
+    I/O section dicts for one component selection (hashed on its
+    signature_tuple). IOPoint is frozen and callers only see
+    read-only views, so every unit with the same selection shares them.
+    """
+    return ConfigGenerator(UnitProfile(components=comp))._build_io_sections()
+
+
 class ConfigGenerator:
     """
     Generates IOMap, Setpoints, and AlarmConfig from a UnitProfile.
@@ -35,6 +238,14 @@ class ConfigGenerator:
         self.profile = profile
         self.comp = profile.components
 
+        # Resolve catalog entries once; None when the key is unknown
+        self.meter = KNOWN_METERS.get(self.comp.meter_key)
+        self.pump = KNOWN_PUMPS.get(self.comp.pump_key)
+        self.divert = KNOWN_DIVERT_VALVES.get(self.comp.divert_valve_key)
+        self.bsw_probe = KNOWN_BSW_PROBES.get(self.comp.bsw_probe_key)
+        self.sampler = KNOWN_SAMPLERS.get(self.comp.sampler_key)
+        self.prover = KNOWN_PROVERS.get(self.comp.prover_key)
+
     def generate_all(self) -> tuple:
         """
         Generate all configuration objects.
@@ -48,346 +259,95 @@ class ConfigGenerator:
     # ── I/O Map Generation ───────────────────────────────────
 
     def generate_io_map(self) -> IOMap:
-        """Generate a complete IOMap for the unit."""
-        io_map = IOMap(
-            digital_inputs={},
-            digital_outputs={},
-            analog_inputs={},
-            pulse_inputs={},
-            analog_outputs={},
-        )
-
-        di_addr = 0
-        do_addr = 0
-        ai_addr = 0
-        pi_addr = 0
-        ao_addr = 0
-
-        # ── Inlet Section ────────────────────────────────────
-        io_map.digital_inputs["DI_INLET_VLV_OPEN"] = IOPoint(
-            tag="DI_INLET_VLV_OPEN",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr, description="Inlet ball valve - open limit switch",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
+        """
+        Generate a complete IOMap for the unit.
 
-        io_map.digital_inputs["DI_INLET_VLV_CLOSED"] = IOPoint(
-            tag="DI_INLET_VLV_CLOSED",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr, description="Inlet ball valve - closed limit switch",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        # ── Strainer ─────────────────────────────────────────
-        if self.comp.has_strainer:
-            io_map.digital_inputs["DI_STRAINER_HI_DP"] = IOPoint(
-                tag="DI_STRAINER_HI_DP",
-                signal_type=SignalType.DIGITAL_IN,
-                address=di_addr,
-                description=f"Strainer high DP switch ({self.comp.strainer_mesh} mesh)",
-                modbus_register=di_addr,
-            )
-            di_addr += 1
-
-        # ── Pump ─────────────────────────────────────────────
-        pump = KNOWN_PUMPS.get(self.comp.pump_key)
-        io_map.digital_inputs["DI_PUMP_RUNNING"] = IOPoint(
-            tag="DI_PUMP_RUNNING",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Transfer pump motor running feedback",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_inputs["DI_PUMP_OVERLOAD"] = IOPoint(
-            tag="DI_PUMP_OVERLOAD",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Transfer pump motor overload relay trip",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_outputs["DO_PUMP_START"] = IOPoint(
-            tag="DO_PUMP_START",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Transfer pump motor contactor coil",
-            modbus_register=100 + do_addr,
-        )
-        do_addr += 1
-
-        # ── Divert Valve ─────────────────────────────────────
-        io_map.digital_inputs["DI_DIVERT_SALES"] = IOPoint(
-            tag="DI_DIVERT_SALES",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Divert valve at SALES position",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_inputs["DI_DIVERT_DIVERT"] = IOPoint(
-            tag="DI_DIVERT_DIVERT",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Divert valve at DIVERT position",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_outputs["DO_DIVERT_CMD"] = IOPoint(
-            tag="DO_DIVERT_CMD",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Divert valve command (0=SALES, 1=DIVERT)",
-            modbus_register=100 + do_addr,
-        )
-        do_addr += 1
-
-        # ── Sampler ──────────────────────────────────────────
-        sampler = KNOWN_SAMPLERS.get(self.comp.sampler_key)
-        io_map.digital_inputs["DI_SAMPLE_POT_HI"] = IOPoint(
-            tag="DI_SAMPLE_POT_HI",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Sample receiver pot high level",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_inputs["DI_SAMPLE_POT_LO"] = IOPoint(
-            tag="DI_SAMPLE_POT_LO",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Sample receiver pot low level",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        io_map.digital_outputs["DO_SAMPLE_SOL"] = IOPoint(
-            tag="DO_SAMPLE_SOL",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Sample solenoid valve",
-            modbus_register=100 + do_addr,
+        Units with the same component selection produce identical
+        I/O maps, so the section dicts are built once and shared.
+        The returned IOMap exposes them as read-only views.
+        """
+        di, do, ai, pi, ao = _io_sections(self.comp)
+        return IOMap(
+            digital_inputs=MappingProxyType(di),
+            digital_outputs=MappingProxyType(do),
+            analog_inputs=MappingProxyType(ai),
+            pulse_inputs=MappingProxyType(pi),
+            analog_outputs=MappingProxyType(ao),
         )
-        do_addr += 1
 
+    def _feature_mask(self) -> int:
+        """Encode which optional I/O points the unit has as _F_* bits."""
+        c = self.comp
+        meter, sampler, prover = self.meter, self.sampler, self.prover
+        mask = 0
+        if c.has_strainer:
+            mask |= _F_STRAINER
+        if c.has_air_eliminator:
+            mask |= _F_AIR_ELIMINATOR
+        if c.has_test_thermowell:
+            mask |= _F_TEST_THERMOWELL
+        if c.num_pressure_transmitters >= 2:
+            mask |= _F_LOOP_PRESS
+        if c.num_pressure_transmitters >= 3:
+            mask |= _F_OUTLET_PRESS
+        if c.num_backpressure_valves >= 1:
+            mask |= _F_BP_SALES
+        if c.num_backpressure_valves >= 2:
+            mask |= _F_BP_DIVERT
         if sampler and sampler.has_mixing_pump:
-            io_map.digital_outputs["DO_SAMPLE_MIX_PUMP"] = IOPoint(
-                tag="DO_SAMPLE_MIX_PUMP",
-                signal_type=SignalType.DIGITAL_OUT,
-                address=do_addr,
-                description="Sample pot mixing pump",
-                modbus_register=100 + do_addr,
-            )
-            do_addr += 1
-
-        # ── Prover ───────────────────────────────────────────
-        prover = KNOWN_PROVERS.get(self.comp.prover_key)
+            mask |= _F_MIX_PUMP
         if prover and prover.io_signature.digital_inputs:
-            io_map.digital_inputs["DI_PROVER_VLV_OPEN"] = IOPoint(
-                tag="DI_PROVER_VLV_OPEN",
-                signal_type=SignalType.DIGITAL_IN,
-                address=di_addr,
-                description="Prover DBB valve - open",
-                modbus_register=di_addr,
-            )
-            di_addr += 1
-
-            io_map.digital_outputs["DO_PROVER_VLV_CMD"] = IOPoint(
-                tag="DO_PROVER_VLV_CMD",
-                signal_type=SignalType.DIGITAL_OUT,
-                address=do_addr,
-                description="Prover DBB valve open command",
-                modbus_register=100 + do_addr,
-            )
-            do_addr += 1
-
-        # ── Air Eliminator ───────────────────────────────────
-        if self.comp.has_air_eliminator:
-            io_map.digital_inputs["DI_AIR_ELIM_FLOAT"] = IOPoint(
-                tag="DI_AIR_ELIM_FLOAT",
-                signal_type=SignalType.DIGITAL_IN,
-                address=di_addr,
-                description="Air eliminator float switch (gas detected)",
-                modbus_register=di_addr,
-            )
-            di_addr += 1
-
-        # ── Outlet ───────────────────────────────────────────
-        io_map.digital_inputs["DI_OUTLET_VLV_OPEN"] = IOPoint(
-            tag="DI_OUTLET_VLV_OPEN",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Outlet ball valve - open limit switch",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        # ── E-Stop ───────────────────────────────────────────
-        io_map.digital_inputs["DI_ESTOP"] = IOPoint(
-            tag="DI_ESTOP",
-            signal_type=SignalType.DIGITAL_IN,
-            address=di_addr,
-            description="Emergency stop pushbutton (NC contact)",
-            modbus_register=di_addr,
-        )
-        di_addr += 1
-
-        # ── Annunciation ─────────────────────────────────────
-        io_map.digital_outputs["DO_ALARM_BEACON"] = IOPoint(
-            tag="DO_ALARM_BEACON",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Alarm beacon (visual)",
-            modbus_register=100 + do_addr,
-        )
-        do_addr += 1
-
-        io_map.digital_outputs["DO_ALARM_HORN"] = IOPoint(
-            tag="DO_ALARM_HORN",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Alarm horn (audible)",
-            modbus_register=100 + do_addr,
-        )
-        do_addr += 1
-
-        io_map.digital_outputs["DO_STATUS_GREEN"] = IOPoint(
-            tag="DO_STATUS_GREEN",
-            signal_type=SignalType.DIGITAL_OUT,
-            address=do_addr,
-            description="Running status light (green)",
-            modbus_register=100 + do_addr,
-        )
-        do_addr += 1
-
-        # ── Analog Inputs ────────────────────────────────────
-        # Pressure transmitters
-        io_map.analog_inputs["AI_INLET_PRESS"] = IOPoint(
-            tag="AI_INLET_PRESS",
-            signal_type=SignalType.ANALOG_IN,
-            address=ai_addr,
-            description="Inlet pressure transmitter",
-            unit="PSI", eng_min=0.0, eng_max=300.0,
-            modbus_register=200 + ai_addr,
-        )
-        ai_addr += 1
-
-        if self.comp.num_pressure_transmitters >= 2:
-            io_map.analog_inputs["AI_LOOP_HI_PRESS"] = IOPoint(
-                tag="AI_LOOP_HI_PRESS",
-                signal_type=SignalType.ANALOG_IN,
-                address=ai_addr,
-                description="Loop high-point pressure",
-                unit="PSI", eng_min=0.0, eng_max=300.0,
-                modbus_register=200 + ai_addr,
-            )
-            ai_addr += 1
-
-        # Strainer DP transmitter (if present)
-        if self.comp.has_strainer:
-            io_map.analog_inputs["AI_STRAINER_DP"] = IOPoint(
-                tag="AI_STRAINER_DP",
-                signal_type=SignalType.ANALOG_IN,
-                address=ai_addr,
-                description="Strainer differential pressure",
-                unit="PSI", eng_min=0.0, eng_max=50.0,
-                modbus_register=200 + ai_addr,
-            )
-            ai_addr += 1
-
-        # BS&W probe
-        bsw_probe = KNOWN_BSW_PROBES.get(self.comp.bsw_probe_key)
-        bsw_range = bsw_probe.range_pct if bsw_probe else 5.0
-        io_map.analog_inputs["AI_BSW_PROBE"] = IOPoint(
-            tag="AI_BSW_PROBE",
-            signal_type=SignalType.ANALOG_IN,
-            address=ai_addr,
-            description="BS&W probe",
-            unit="%", eng_min=0.0, eng_max=bsw_range,
-            modbus_register=200 + ai_addr,
-        )
-        ai_addr += 1
-
-        # Meter temperature
-        meter = KNOWN_METERS.get(self.comp.meter_key)
+            mask |= _F_PROVER
         if meter and meter.has_temperature_probe:
-            io_map.analog_inputs["AI_METER_TEMP"] = IOPoint(
-                tag="AI_METER_TEMP",
-                signal_type=SignalType.ANALOG_IN,
-                address=ai_addr,
-                description="Meter TA probe temperature",
-                unit="°F", eng_min=-20.0, eng_max=200.0,
-                modbus_register=200 + ai_addr,
-            )
-            ai_addr += 1
-
-        # Test thermowell
-        if self.comp.has_test_thermowell:
-            io_map.analog_inputs["AI_TEST_THERMO"] = IOPoint(
-                tag="AI_TEST_THERMO",
-                signal_type=SignalType.ANALOG_IN,
-                address=ai_addr,
-                description="Test thermowell downstream of meter",
-                unit="°F", eng_min=-20.0, eng_max=200.0,
-                modbus_register=200 + ai_addr,
-            )
-            ai_addr += 1
-
-        # Outlet pressure
-        if self.comp.num_pressure_transmitters >= 3:
-            io_map.analog_inputs["AI_OUTLET_PRESS"] = IOPoint(
-                tag="AI_OUTLET_PRESS",
-                signal_type=SignalType.ANALOG_IN,
-                address=ai_addr,
-                description="Outlet pressure transmitter",
-                unit="PSI", eng_min=0.0, eng_max=300.0,
-                modbus_register=200 + ai_addr,
-            )
-            ai_addr += 1
-
-        # ── Pulse Inputs ─────────────────────────────────────
+            mask |= _F_METER_TEMP
         if meter and meter.has_pulse_output:
-            io_map.pulse_inputs["PI_METER_PULSE"] = IOPoint(
-                tag="PI_METER_PULSE",
-                signal_type=SignalType.PULSE_IN,
-                address=pi_addr,
-                description=f"{meter.display_name} pulse output",
-                unit="pulses",
-                modbus_register=300 + pi_addr,
-            )
-            pi_addr += 1
-
-        # ── Analog Outputs ───────────────────────────────────
-        if self.comp.num_backpressure_valves >= 1:
-            io_map.analog_outputs["AO_BP_SALES_SP"] = IOPoint(
-                tag="AO_BP_SALES_SP",
-                signal_type=SignalType.ANALOG_OUT,
-                address=ao_addr,
-                description="Backpressure valve setpoint - sales",
-                unit="PSI", eng_min=0.0, eng_max=150.0,
-                modbus_register=400 + ao_addr,
-            )
-            ao_addr += 1
-
-        if self.comp.num_backpressure_valves >= 2:
-            io_map.analog_outputs["AO_BP_DIVERT_SP"] = IOPoint(
-                tag="AO_BP_DIVERT_SP",
-                signal_type=SignalType.ANALOG_OUT,
-                address=ao_addr,
-                description="Backpressure valve setpoint - divert",
-                unit="PSI", eng_min=0.0, eng_max=150.0,
-                modbus_register=400 + ao_addr,
+            mask |= _F_METER_PULSE
+        return mask
+
+    def _build_io_sections(self) -> tuple:
+        """
+        Build the five I/O section dicts for the unit.
+        Returns (digital_inputs, digital_outputs, analog_inputs,
+        pulse_inputs, analog_outputs).
+        """
+        addresses = _address_table(self._feature_mask())
+
+        # Per-unit values layered over the static templates
+        overrides = {
+            TAG_DI_STRAINER_HI_DP: {
+                "description": _strainer_description(self.comp.strainer_mesh),
+            },
+            TAG_AI_BSW_PROBE: {
+                "eng_max": self.bsw_probe.range_pct if self.bsw_probe else 5.0,
+            },
+        }
+        if self.meter:
+            overrides[TAG_PI_METER_PULSE] = {
+                "description": _meter_pulse_description(self.meter),
+            }
+
+        sections = {signal_type: {} for signal_type in _REGISTER_BASE}
+        for tag, signal_type, _, fields in _IO_TEMPLATES:
+            address = addresses.get(tag)
+            if address is None:
+                continue
+            if tag in overrides:
+                fields = {**fields, **overrides[tag]}
+            sections[signal_type][tag] = IOPoint(
+                tag=tag,
+                signal_type=signal_type,
+                address=address,
+                modbus_register=_REGISTER_BASE[signal_type] + address,
+                **fields,
             )
-            ao_addr += 1
 
-        return io_map
+        return (
+            sections[SignalType.DIGITAL_IN],
+            sections[SignalType.DIGITAL_OUT],
+            sections[SignalType.ANALOG_IN],
+            sections[SignalType.PULSE_IN],
+            sections[SignalType.ANALOG_OUT],
+        )
 
     # ── Setpoints Generation ─────────────────────────────────
 
@@ -396,25 +356,21 @@ class ConfigGenerator:
         sp = Setpoints()
 
         # Meter-specific setpoints
-        meter = KNOWN_METERS.get(self.comp.meter_key)
-        if meter:
-            sp.meter_k_factor = meter.k_factor_default
-            sp.meter_min_flow_bph = meter.min_flow_bph
-            sp.meter_max_flow_bph = meter.max_flow_bph
+        if self.meter:
+            sp.meter_k_factor = self.meter.k_factor_default
+            sp.meter_min_flow_bph = self.meter.min_flow_bph
+            sp.meter_max_flow_bph = self.meter.max_flow_bph
 
         # Divert valve travel time
-        divert = KNOWN_DIVERT_VALVES.get(self.comp.divert_valve_key)
-        if divert:
-            sp.divert_travel_timeout_sec = divert.travel_time_sec + 5.0
+        if self.divert:
+            sp.divert_travel_timeout_sec = self.divert.travel_time_sec + 5.0
 
         # Sampler pot size
-        sampler = KNOWN_SAMPLERS.get(self.comp.sampler_key)
-        if sampler:
-            sp.sample_pot_full_gal = sampler.pot_size_gal
+        if self.sampler:
+            sp.sample_pot_full_gal = self.sampler.pot_size_gal
 
         # BS&W probe range
-        bsw_probe = KNOWN_BSW_PROBES.get(self.comp.bsw_probe_key)
-        if bsw_probe and bsw_probe.range_pct > 5.0:
+        if self.bsw_probe and self.bsw_probe.range_pct > 5.0:
             sp.bsw_divert_pct = 1.0
             sp.bsw_alarm_pct = 0.5
 
@@ -438,8 +394,7 @@ class ConfigGenerator:
         if not self.comp.has_air_eliminator:
             config.definitions.pop("ALM_GAS_DETECTED", None)
 
-        prover = KNOWN_PROVERS.get(self.comp.prover_key)
-        if not prover or not prover.io_signature.digital_inputs:
+        if not self.prover or not self.prover.io_signature.digital_inputs:
             config.definitions.pop("ALM_PROVE_REPEAT_FAIL", None)
             config.definitions.pop("ALM_PROVE_MF_RANGE", None)
 
@@ -448,16 +403,19 @@ class ConfigGenerator:
     # ── Summary ──────────────────────────────────────────────
 
     def summary(self) -> dict:
-        """Return a summary of what will be generated."""
-        io_map = self.generate_io_map()
+        """
+        Return a summary of what will be generated.
+        Point counts come from the feature mask, so no IOMap is built.
+        """
+        counts = _io_counts(self._feature_mask())
         return {
             "unit_id": self.profile.unit_id,
-            "digital_inputs": len(io_map.digital_inputs),
-            "digital_outputs": len(io_map.digital_outputs),
-            "analog_inputs": len(io_map.analog_inputs),
-            "pulse_inputs": len(io_map.pulse_inputs),
-            "analog_outputs": len(io_map.analog_outputs),
-            "total_io_points": len(io_map.get_all_points()),
+            "digital_inputs": counts[SignalType.DIGITAL_IN],
+            "digital_outputs": counts[SignalType.DIGITAL_OUT],
+            "analog_inputs": counts[SignalType.ANALOG_IN],
+            "pulse_inputs": counts[SignalType.PULSE_IN],
+            "analog_outputs": counts[SignalType.ANALOG_OUT],
+            "total_io_points": sum(counts.values()),
             "meter": self.comp.meter_key,
             "pump": self.comp.pump_key,
             "divert": self.comp.divert_valve_key,
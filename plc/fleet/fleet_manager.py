@@ -12,9 +12,10 @@ Manages multiple LACT units across a fleet. Provides:
 This is the top-level orchestrator for multi-unit operations.
 """
 
-import json
+import os
 import time
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
@@ -22,6 +23,9 @@ from plc.fleet.unit_profile import UnitProfile, UnitStatus
 from plc.fleet.config_generator import ConfigGenerator
 from plc.fleet.flow_graph import FlowGraph, build_flow_graph
 from plc.fleet.intake import IntakeForm
+from plc.fleet.jsonio import (
+    PackedCatalog, iter_json_items, write_catalog, write_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,66 +33,100 @@ logger = logging.getLogger(__name__)
 class FleetManager:
     """
     Central registry and manager for all LACT units in the fleet.
+
+    With ``fleet_dir=None`` the registry is kept in memory only and
+    nothing is written to disk (exports still write their own file).
     """
 
-    def __init__(self, fleet_dir: str = "config/fleet"):
-        self.fleet_dir = Path(fleet_dir)
-        self.fleet_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, fleet_dir: Optional[str] = "config/fleet"):
+        self.fleet_dir = Path(fleet_dir) if fleet_dir is not None else None
+        if self.fleet_dir is not None:
+            self.fleet_dir.mkdir(parents=True, exist_ok=True)
         self._units: dict = {}  # unit_id → UnitProfile
+        self._unit_paths: dict = {}  # unit_id → Path, not yet parsed
+        self._search_index: dict = {}  # unit_id → (fields, haystack)
+        # Derived results, valid while the profile fields they depend
+        # on are unchanged
+        self._graph_cache: dict = {}  # unit_id → (fingerprint, FlowGraph)
+        self._summary_cache: dict = {}  # unit_id → (fingerprint, dict)
         self._load_fleet()
 
     # ── Unit Registry ────────────────────────────────────────
 
     @property
     def unit_count(self) -> int:
+        # Parse pending files so unreadable ones aren't counted
+        self._load_all()
         return len(self._units)
 
     def register_unit(self, profile: UnitProfile):
         """Add a unit to the fleet."""
         if not profile.unit_id:
             raise ValueError("Unit must have an ID")
+        self._unit_paths.pop(profile.unit_id, None)
         self._units[profile.unit_id] = profile
         self._save_unit(profile)
         logger.info("Registered unit: %s", profile.unit_id)
 
     def remove_unit(self, unit_id: str) -> bool:
         """Remove a unit from the fleet."""
-        if unit_id not in self._units:
+        if unit_id not in self._units and unit_id not in self._unit_paths:
             return False
-        del self._units[unit_id]
-        unit_file = self.fleet_dir / f"{unit_id}.json"
-        if unit_file.exists():
-            unit_file.unlink()
+        self._units.pop(unit_id, None)
+        self._unit_paths.pop(unit_id, None)
+        self._search_index.pop(unit_id, None)
+        self._graph_cache.pop(unit_id, None)
+        self._summary_cache.pop(unit_id, None)
+        if self.fleet_dir is not None:
+            unit_file = self.fleet_dir / f"{unit_id}.json"
+            if unit_file.exists():
+                unit_file.unlink()
         logger.info("Removed unit: %s", unit_id)
         return True
 
     def get_unit(self, unit_id: str) -> Optional[UnitProfile]:
         """Get a unit profile by ID."""
-        return self._units.get(unit_id)
+        return self._get_or_load(unit_id)
 
     def list_units(self, status: UnitStatus = None) -> list:
         """List all units, optionally filtered by status."""
-        units = list(self._units.values())
-        if status:
-            units = [u for u in units if u.status == status]
-        return sorted(units, key=lambda u: u.unit_id)
+        self._load_all()
+        # Registry keys are the unit IDs, so sort those directly.
+        # Status is read live: profiles are edited in place, which a
+        # status index maintained at registration would miss.
+        units = self._units
+        if status is None:
+            return [units[uid] for uid in sorted(units)]
+        return [units[uid] for uid in sorted(units) if units[uid].status == status]
 
     def search_units(self, query: str) -> list:
         """Search units by ID, manufacturer, model, or location."""
         query_lower = query.lower()
-        results = []
-        for unit in self._units.values():
-            searchable = " ".join([
-                unit.unit_id,
-                unit.manufacturer,
-                unit.model,
-                unit.serial_number,
-                unit.location.state,
-                unit.location.lease_name,
-            ]).lower()
-            if query_lower in searchable:
-                results.append(unit)
-        return results
+        self._load_all()
+        return [
+            unit for unit in self._units.values()
+            if query_lower in self._haystack(unit)
+        ]
+
+    def _haystack(self, unit: UnitProfile) -> str:
+        """
+        Lowercased searchable text for a unit. Cached per unit and
+        rebuilt only when one of the searched fields has changed.
+        """
+        fields = (
+            unit.unit_id,
+            unit.manufacturer,
+            unit.model,
+            unit.serial_number,
+            unit.location.state,
+            unit.location.lease_name,
+        )
+        cached = self._search_index.get(unit.unit_id)
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+        haystack = " ".join(fields).lower()
+        self._search_index[unit.unit_id] = (fields, haystack)
+        return haystack
 
     # ── Intake Processing ────────────────────────────────────
 
@@ -121,97 +159,160 @@ class FleetManager:
         profile = self.get_unit(unit_id)
         if not profile:
             return {}
-        gen = ConfigGenerator(profile)
-        return gen.summary()
+        # The summary depends only on these, so in-place profile edits
+        # are picked up without re-registering
+        fingerprint = (profile.unit_id, profile.components)
+        cached = self._summary_cache.get(unit_id)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, ConfigGenerator(profile).summary())
+            self._summary_cache[unit_id] = cached
+        return dict(cached[1])
 
     # ── Flow Graphs ──────────────────────────────────────────
 
     def build_flow_graph(self, unit_id: str) -> FlowGraph:
         """Build the topological flow graph for a unit."""
-        profile = self.get_unit(unit_id)
-        if not profile:
-            raise ValueError(f"Unit not found: {unit_id}")
-        return build_flow_graph(profile)
+        graph = self._cached_flow_graph(unit_id)
+        return graph._clone(unit_id)
 
     def compare_units(self, unit_id_a: str, unit_id_b: str) -> dict:
         """Compare the topological structure of two units."""
-        graph_a = self.build_flow_graph(unit_id_a)
-        graph_b = self.build_flow_graph(unit_id_b)
+        graph_a = self._cached_flow_graph(unit_id_a)
+        graph_b = self._cached_flow_graph(unit_id_b)
         return graph_a.compare(graph_b)
 
+    def _cached_flow_graph(self, unit_id: str) -> FlowGraph:
+        """Flow graph for a unit, shared until its topology inputs change."""
+        profile = self.get_unit(unit_id)
+        if not profile:
+            raise ValueError(f"Unit not found: {unit_id}")
+        # The graph depends only on these, so in-place profile edits
+        # are picked up without re-registering
+        fingerprint = (profile.pipe_size, profile.components)
+        cached = self._graph_cache.get(unit_id)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, build_flow_graph(profile))
+            self._graph_cache[unit_id] = cached
+        return cached[1]
+
     # ── Fleet Statistics ─────────────────────────────────────
 
     def fleet_summary(self) -> dict:
         """Return fleet-wide statistics."""
+        self._load_all()
         units = list(self._units.values())
         if not units:
             return {"total_units": 0}
 
-        status_counts = {}
-        for status in UnitStatus:
-            count = sum(1 for u in units if u.status == status)
-            if count > 0:
-                status_counts[status.value] = count
-
-        manufacturers = {}
-        for u in units:
-            mfg = u.manufacturer or "Unknown"
-            manufacturers[mfg] = manufacturers.get(mfg, 0) + 1
-
-        pipe_sizes = {}
+        status_counts = Counter()
+        manufacturers = Counter()
+        pipe_sizes = Counter()
+        states = Counter()
         for u in units:
-            ps = f'{u.pipe_size}"'
-            pipe_sizes[ps] = pipe_sizes.get(ps, 0) + 1
-
-        states = {}
-        for u in units:
-            st = u.location.state or "Unknown"
-            states[st] = states.get(st, 0) + 1
+            status_counts[u.status] += 1
+            manufacturers[u.manufacturer or "Unknown"] += 1
+            pipe_sizes[f'{u.pipe_size}"'] += 1
+            states[u.location.state or "Unknown"] += 1
 
         return {
             "total_units": len(units),
-            "by_status": status_counts,
-            "by_manufacturer": manufacturers,
-            "by_pipe_size": pipe_sizes,
-            "by_state": states,
+            "by_status": {
+                status.value: status_counts[status]
+                for status in UnitStatus if status in status_counts
+            },
+            "by_manufacturer": dict(manufacturers),
+            "by_pipe_size": dict(pipe_sizes),
+            "by_state": dict(states),
         }
 
     # ── Persistence ──────────────────────────────────────────
 
     def _save_unit(self, profile: UnitProfile):
         """Save a single unit profile to the fleet directory."""
+        if self.fleet_dir is None:
+            return
         profile.save(str(self.fleet_dir / f"{profile.unit_id}.json"))
 
     def _load_fleet(self):
-        """Load all unit profiles from the fleet directory."""
-        for path in self.fleet_dir.glob("*.json"):
-            try:
-                profile = UnitProfile.load(str(path))
-                if profile.unit_id:
-                    self._units[profile.unit_id] = profile
-            except Exception:
-                logger.warning("Failed to load unit profile: %s", path)
+        """
+        Index unit profile files in the fleet directory. Files are
+        parsed on first access rather than at startup.
+        """
+        if self.fleet_dir is None:
+            return
+        with os.scandir(self.fleet_dir) as entries:
+            self._unit_paths = {
+                entry.name[:-5]: Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+
+    def _get_or_load(self, unit_id: str) -> Optional[UnitProfile]:
+        """Return a unit profile, parsing its file on first access."""
+        profile = self._units.get(unit_id)
+        if profile is not None:
+            return profile
+        path = self._unit_paths.pop(unit_id, None)
+        if path is None:
+            return None
+        try:
+            profile = UnitProfile.load(str(path))
+        except Exception:
+            logger.warning("Failed to load unit profile: %s", path)
+            return None
+        if not profile.unit_id:
+            return None
+        if profile.unit_id != unit_id:
+            logger.warning(
+                "Unit profile %s holds unit_id %r; it is registered under that id",
+                path, profile.unit_id,
+            )
+        self._units[profile.unit_id] = profile
+        return self._units.get(unit_id)
+
+    def _load_all(self):
+        """Parse any unit profiles not yet loaded."""
+        for unit_id in list(self._unit_paths):
+            self._get_or_load(unit_id)
 
     def save_all(self):
-        """Save all unit profiles."""
-        for profile in self._units.values():
-            self._save_unit(profile)
+        """Save all unit profiles with one filesystem sync."""
+        if self.fleet_dir is None:
+            return
+        self._load_all()
+        UnitProfile.save_many(self._units.values(), self.fleet_dir)
 
     def export_fleet(self, path: str):
         """Export the entire fleet to a single JSON file."""
+        self._load_all()
         data = {
             "fleet_export_time": time.time(),
-            "units": {
-                uid: profile._to_dict()
-                for uid, profile in self._units.items()
-            },
+            "units": dict(self._units),
         }
-        Path(path).write_text(json.dumps(data, indent=2))
+        write_json(path, data)
 
     def import_fleet(self, path: str):
         """Import units from a fleet export file."""
-        data = json.loads(Path(path).read_text())
-        for uid, unit_data in data.get("units", {}).items():
+        self._import_units(data for _, data in iter_json_items(path, "units"))
+
+    def export_fleet_binary(self, path: str):
+        """Export the fleet as a packed catalog, one record per unit."""
+        self._load_all()
+        write_catalog(path, {
+            uid: profile._to_dict() for uid, profile in self._units.items()
+        })
+
+    def import_fleet_binary(self, path: str):
+        """Import units from a packed catalog written by export_fleet_binary()."""
+        with PackedCatalog(path) as catalog:
+            self._import_units(data for _, data in catalog.items())
+
+    def _import_units(self, unit_dicts):
+        """Register profiles from serialized dicts and save them together."""
+        imported = []
+        for unit_data in unit_dicts:
             profile = UnitProfile._from_dict(unit_data)
+            self._unit_paths.pop(profile.unit_id, None)
             self._units[profile.unit_id] = profile
-            self._save_unit(profile)
+            imported.append(profile)
+        if self.fleet_dir is not None:
+            UnitProfile.save_many(imported, self.fleet_dir)
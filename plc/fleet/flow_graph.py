@@ -17,8 +17,14 @@ methodology: extract the system's connectivity structure,
 then reason about it independently of implementation.
 """
 
+import hashlib
+import sys
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import zip_longest
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -51,18 +57,28 @@ class FlowPath(Enum):
     PROVER = "prover"        # Off meter → prover → return
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FlowNode:
-    """A single equipment node in the flow graph."""
+    """
+    A single equipment node in the flow graph. Immutable, since
+    graphs built from the same template share their nodes; swap a
+    node with add_node(dataclasses.replace(node, ...)) instead.
+    """
     node_id: str
     node_type: NodeType
     label: str
-    io_tags: list = field(default_factory=list)  # Associated I/O tags
+    io_tags: tuple = ()  # Associated I/O tags
     position: tuple = (0.0, 0.0)  # x, y for visualization
-    properties: dict = field(default_factory=dict)
+    properties: MappingProxyType = field(
+        default_factory=lambda: MappingProxyType({}), hash=False,
+    )
 
+    def __post_init__(self):
+        object.__setattr__(self, "io_tags", tuple(self.io_tags))
+        object.__setattr__(self, "properties", MappingProxyType(dict(self.properties)))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class FlowEdge:
     """A directed edge representing flow between nodes."""
     source: str         # node_id of upstream equipment
@@ -72,6 +88,34 @@ class FlowEdge:
     label: str = ""
 
 
+# Node types every LACT flow graph must contain, in report order
+_REQUIRED_NODE_TYPES = (
+    NodeType.INLET_VALVE,
+    NodeType.PUMP,
+    NodeType.DIVERT_VALVE,
+    NodeType.METER,
+)
+
+# Underline for the to_ascii title
+_ASCII_RULE = "=" * 50
+
+# Graphs larger than this use bidirectional search in trace_path
+BIDIRECTIONAL_MIN_NODES = 50
+
+# Identical edges are shared between graphs (FlowEdge is frozen)
+_EDGE_POOL: dict = {}  # (source, target, path, pipe_size_in, label) → FlowEdge
+
+
+def _make_edge(source: str, target: str, path: FlowPath,
+               pipe_size_in: float = 3.0, label: str = "") -> FlowEdge:
+    """Return the pooled FlowEdge for these fields, creating it once."""
+    key = (source, target, path, pipe_size_in, label)
+    edge = _EDGE_POOL.get(key)
+    if edge is None:
+        edge = _EDGE_POOL[key] = FlowEdge(source, target, path, pipe_size_in, label)
+    return edge
+
+
 class FlowGraph:
     """
     Directed graph representation of a LACT unit's process flow.
@@ -85,17 +129,78 @@ class FlowGraph:
         self.nodes: dict = {}   # node_id → FlowNode
         self.edges: list = []   # FlowEdge list
         self._adjacency: dict = {}  # node_id → [FlowEdge]
+        self._rev_adjacency: dict = {}  # node_id → [FlowEdge] (incoming)
+        # True while the adjacency dicts belong to the graph this one
+        # was cloned from; copied on the first structural change
+        self._adjacency_shared = False
+        # Derived views, rebuilt lazily after any add_node/add_edge
+        self._topo_cache: Optional[list] = None
+        self._path_cache: dict = {}  # FlowPath → [FlowNode]
+        self._ascii_cache: Optional[str] = None  # to_ascii body
+        self._signature: Optional[bytes] = None  # see signature()
 
     def add_node(self, node: FlowNode):
         """Add a node to the graph."""
+        self._unshare_adjacency()
         self.nodes[node.node_id] = node
         if node.node_id not in self._adjacency:
             self._adjacency[node.node_id] = []
+        self._invalidate()
 
     def add_edge(self, edge: FlowEdge):
         """Add a directed edge to the graph."""
+        self._unshare_adjacency()
         self.edges.append(edge)
         self._adjacency.setdefault(edge.source, []).append(edge)
+        self._rev_adjacency.setdefault(edge.target, []).append(edge)
+        self._invalidate()
+
+    def _bulk_load(self, nodes: list, edges: list):
+        """Add many nodes and edges, building the indexes in one pass."""
+        self._unshare_adjacency()
+        for node in nodes:
+            self.nodes[node.node_id] = node
+            self._adjacency.setdefault(node.node_id, [])
+        adjacency = self._adjacency
+        rev_adjacency = self._rev_adjacency
+        for edge in edges:
+            adjacency.setdefault(edge.source, []).append(edge)
+            rev_adjacency.setdefault(edge.target, []).append(edge)
+        self.edges.extend(edges)
+        self._invalidate()
+
+    def _clone(self, unit_id: str) -> "FlowGraph":
+        """
+        Return a new graph with the same structure under another
+        unit_id. Node and edge objects are shared, the containers
+        and cached views are copied; the adjacency indexes are shared
+        until either graph changes structure.
+        """
+        clone = FlowGraph(unit_id=unit_id)
+        clone.nodes = dict(self.nodes)
+        clone.edges = list(self.edges)
+        clone._adjacency = self._adjacency
+        clone._rev_adjacency = self._rev_adjacency
+        clone._adjacency_shared = self._adjacency_shared = True
+        clone._topo_cache = self._topo_cache
+        clone._path_cache = dict(self._path_cache)
+        clone._ascii_cache = self._ascii_cache
+        clone._signature = self._signature
+        return clone
+
+    def _unshare_adjacency(self):
+        """Take private copies of adjacency indexes shared with a clone."""
+        if self._adjacency_shared:
+            self._adjacency = {k: list(v) for k, v in self._adjacency.items()}
+            self._rev_adjacency = {k: list(v) for k, v in self._rev_adjacency.items()}
+            self._adjacency_shared = False
+
+    def _invalidate(self):
+        """Drop cached derived views after a structural change."""
+        self._topo_cache = None
+        self._path_cache = {}
+        self._ascii_cache = None
+        self._signature = None
 
     def get_downstream(self, node_id: str) -> list:
         """Get all nodes directly downstream of the given node."""
@@ -104,47 +209,125 @@ class FlowGraph:
 
     def get_upstream(self, node_id: str) -> list:
         """Get all nodes directly upstream of the given node."""
-        upstream = []
-        for edge in self.edges:
-            if edge.target == node_id and edge.source in self.nodes:
-                upstream.append(self.nodes[edge.source])
-        return upstream
+        edges = self._rev_adjacency.get(node_id, [])
+        return [self.nodes[e.source] for e in edges if e.source in self.nodes]
 
     def trace_path(self, start: str, end: str) -> list:
         """
         Trace the flow path from start to end node.
         Returns list of node_ids in order, or empty list if
-        no path exists.
+        no path exists. Graphs over BIDIRECTIONAL_MIN_NODES
+        are searched breadth-first from both ends.
         """
-        visited = set()
+        if start == end:
+            return [start]
+        if len(self.nodes) > BIDIRECTIONAL_MIN_NODES:
+            return self._trace_path_bidirectional(start, end)
+
+        # BFS with parent pointers, so both searches return a shortest path
+        parent = {start: None}
+        queue = deque((start,))
+        adjacency = self._adjacency
+        while queue:
+            nid = queue.popleft()
+            for edge in adjacency.get(nid, ()):
+                target = edge.target
+                if target in parent:
+                    continue
+                parent[target] = nid
+                if target == end:
+                    path = []
+                    while target is not None:
+                        path.append(target)
+                        target = parent[target]
+                    path.reverse()
+                    return path
+                queue.append(target)
+        return []
+
+    def _trace_path_bidirectional(self, start: str, end: str) -> list:
+        """
+        Breadth-first search from both ends, always expanding the
+        smaller frontier, stitched together where the searches meet.
+        """
+        # node_id → previous node toward start / next node toward end
+        fwd = {start: None}
+        bwd = {end: None}
+        fwd_frontier = [start]
+        bwd_frontier = [end]
+        adjacency = self._adjacency
+        rev_adjacency = self._rev_adjacency
+        meet = None
+
+        # Each direction gets its own loop so the edge attribute is a
+        # plain load rather than a getattr() per edge
+        while fwd_frontier and bwd_frontier and meet is None:
+            next_frontier = []
+            if len(fwd_frontier) <= len(bwd_frontier):
+                for nid in fwd_frontier:
+                    for edge in adjacency.get(nid, ()):
+                        neighbor = edge.target
+                        if neighbor in fwd:
+                            continue
+                        fwd[neighbor] = nid
+                        if neighbor in bwd:
+                            meet = neighbor
+                            break
+                        next_frontier.append(neighbor)
+                    if meet is not None:
+                        break
+                fwd_frontier = next_frontier
+            else:
+                for nid in bwd_frontier:
+                    for edge in rev_adjacency.get(nid, ()):
+                        neighbor = edge.source
+                        if neighbor in bwd:
+                            continue
+                        bwd[neighbor] = nid
+                        if neighbor in fwd:
+                            meet = neighbor
+                            break
+                        next_frontier.append(neighbor)
+                    if meet is not None:
+                        break
+                bwd_frontier = next_frontier
+
+        if meet is None:
+            return []
         path = []
-
-        def dfs(current):
-            if current == end:
-                path.append(current)
-                return True
-            if current in visited:
-                return False
-            visited.add(current)
-            path.append(current)
-            for edge in self._adjacency.get(current, []):
-                if dfs(edge.target):
-                    return True
-            path.pop()
-            return False
-
-        dfs(start)
+        nid = meet
+        while nid is not None:
+            path.append(nid)
+            nid = fwd[nid]
+        path.reverse()
+        nid = bwd[meet]
+        while nid is not None:
+            path.append(nid)
+            nid = bwd[nid]
         return path
 
     def get_flow_path_nodes(self, flow_path: FlowPath) -> list:
         """Get all nodes on a specific flow path."""
-        node_ids = set()
+        if not self._path_cache:
+            self._group_flow_paths()
+        return list(self._path_cache[flow_path])
+
+    def _group_flow_paths(self):
+        """
+        Bin every edge's endpoints by flow path in a single pass,
+        then order each group topologically.
+        """
+        node_ids = {fp: set() for fp in FlowPath}
         for edge in self.edges:
-            if edge.path == flow_path:
-                node_ids.add(edge.source)
-                node_ids.add(edge.target)
-        # Return in topological order
-        return [self.nodes[nid] for nid in self._topo_sort() if nid in node_ids]
+            ids = node_ids[edge.path]
+            ids.add(edge.source)
+            ids.add(edge.target)
+
+        order = self._topo_sort()
+        self._path_cache = {
+            fp: [self.nodes[nid] for nid in order if nid in ids]
+            for fp, ids in node_ids.items()
+        }
 
     def validate(self) -> list:
         """
@@ -153,38 +336,33 @@ class FlowGraph:
         """
         issues = []
 
+        # Index nodes by type and find isolated nodes in one pass
+        by_type: dict = {}
+        isolated = []
+        for nid, n in self.nodes.items():
+            by_type.setdefault(n.node_type, []).append(n)
+            if not self._adjacency.get(nid) and not self._rev_adjacency.get(nid):
+                isolated.append(nid)
+
         # Check for required node types
-        node_types = {n.node_type for n in self.nodes.values()}
-        required = {
-            NodeType.INLET_VALVE,
-            NodeType.PUMP,
-            NodeType.DIVERT_VALVE,
-            NodeType.METER,
-        }
-        missing = required - node_types
+        missing = [t.value for t in _REQUIRED_NODE_TYPES if t not in by_type]
         if missing:
-            issues.append(f"Missing required nodes: {[m.value for m in missing]}")
+            issues.append(f"Missing required nodes: {missing}")
 
         # Check connectivity
-        inlet_nodes = [n for n in self.nodes.values() if n.node_type == NodeType.INLET_VALVE]
-        meter_nodes = [n for n in self.nodes.values() if n.node_type == NodeType.METER]
+        inlet_nodes = by_type.get(NodeType.INLET_VALVE, [])
+        meter_nodes = by_type.get(NodeType.METER, [])
         if inlet_nodes and meter_nodes:
             path = self.trace_path(inlet_nodes[0].node_id, meter_nodes[0].node_id)
             if not path:
                 issues.append("No flow path from inlet to meter")
 
         # Check for isolated nodes
-        connected = set()
-        for edge in self.edges:
-            connected.add(edge.source)
-            connected.add(edge.target)
-        isolated = set(self.nodes.keys()) - connected
         if isolated:
-            issues.append(f"Isolated nodes: {list(isolated)}")
+            issues.append(f"Isolated nodes: {isolated}")
 
         # Check that divert valve has both sales and divert paths
-        divert_nodes = [n for n in self.nodes.values() if n.node_type == NodeType.DIVERT_VALVE]
-        for dv in divert_nodes:
+        for dv in by_type.get(NodeType.DIVERT_VALVE, []):
             downstream = self._adjacency.get(dv.node_id, [])
             paths = {e.path for e in downstream}
             if FlowPath.SALES not in paths:
@@ -196,16 +374,21 @@ class FlowGraph:
 
     def _topo_sort(self) -> list:
         """Topological sort of nodes (Kahn's algorithm)."""
+        if self._topo_cache is None:
+            self._topo_cache = self._compute_topo_sort()
+        return list(self._topo_cache)
+
+    def _compute_topo_sort(self) -> list:
         in_degree = {nid: 0 for nid in self.nodes}
         for edge in self.edges:
             if edge.target in in_degree:
                 in_degree[edge.target] += 1
 
-        queue = [nid for nid, deg in in_degree.items() if deg == 0]
+        queue = deque(nid for nid, deg in in_degree.items() if deg == 0)
         result = []
 
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node)
             for edge in self._adjacency.get(node, []):
                 if edge.target in in_degree:
@@ -220,49 +403,76 @@ class FlowGraph:
         Generate an ASCII representation of the flow graph.
         Shows the main flow path with branches for sales/divert.
         """
-        sorted_nodes = self._topo_sort()
-        if not sorted_nodes:
+        if self._ascii_cache is None:
+            self._ascii_cache = self._render_ascii_body()
+        if not self._topo_cache:
             return "(empty graph)"
 
+        title = f"Flow Graph: {self.unit_id}\n{_ASCII_RULE}"
+        if self._ascii_cache:
+            return f"{title}\n{self._ascii_cache}"
+        return title
+
+    def _render_ascii_body(self) -> str:
+        """
+        Render the to_ascii text below the title. The title carries
+        the unit_id, so the cached body survives a unit_id change.
+        """
+        if not self._topo_sort():
+            return ""
+        if not self._path_cache:
+            self._group_flow_paths()
+
         lines = []
-        lines.append(f"Flow Graph: {self.unit_id}")
-        lines.append("=" * 50)
 
         # Group by flow path
-        main_path = self.get_flow_path_nodes(FlowPath.MAIN)
-        sales_path = self.get_flow_path_nodes(FlowPath.SALES)
-        divert_path = self.get_flow_path_nodes(FlowPath.DIVERT)
+        main_path = self._path_cache[FlowPath.MAIN]
+        sales_path = self._path_cache[FlowPath.SALES]
+        divert_path = self._path_cache[FlowPath.DIVERT]
 
         for node in main_path:
-            lines.append(f"  │")
             io_str = f" [{', '.join(node.io_tags)}]" if node.io_tags else ""
-            lines.append(f"  ├─ {node.label}{io_str}")
+            lines += ("  │", f"  ├─ {node.label}{io_str}")
 
         if sales_path or divert_path:
-            lines.append(f"  │")
-            lines.append(f"  ├── SALES ──────────┐  DIVERT ─────────┐")
-
-            max_len = max(len(sales_path), len(divert_path))
-            for i in range(max_len):
-                sales_node = sales_path[i] if i < len(sales_path) else None
-                divert_node = divert_path[i] if i < len(divert_path) else None
+            lines += ("  │", "  ├── SALES ──────────┐  DIVERT ─────────┐")
 
-                s_text = f"{sales_node.label}" if sales_node else ""
-                d_text = f"{divert_node.label}" if divert_node else ""
-                lines.append(f"  │  {s_text:<20s}│  {d_text}")
+            lines.extend(
+                f"  │  {s.label if s else '':<20s}│  {d.label if d else ''}"
+                for s, d in zip_longest(sales_path, divert_path)
+            )
 
         return "\n".join(lines)
 
+    def signature(self) -> bytes:
+        """
+        16-byte digest of the graph's structure, independent of node
+        ids and labels: the sorted node types plus the sorted
+        (source type, target type, flow path) of every edge.
+        """
+        if self._signature is None:
+            nodes = self.nodes
+            node_types = sorted(n.node_type.value for n in nodes.values())
+            edge_types = sorted(
+                (nodes[e.source].node_type.value,
+                 nodes[e.target].node_type.value, e.path.value)
+                for e in self.edges
+                if e.source in nodes and e.target in nodes
+            )
+            canonical = repr((node_types, edge_types)).encode()
+            self._signature = hashlib.blake2b(canonical, digest_size=16).digest()
+        return self._signature
+
     def compare(self, other: "FlowGraph") -> dict:
         """
         Compare this flow graph with another.
         Returns dict describing structural differences.
         """
-        self_types = sorted(n.node_type.value for n in self.nodes.values())
-        other_types = sorted(n.node_type.value for n in other.nodes.values())
+        self_types = Counter(n.node_type.value for n in self.nodes.values())
+        other_types = Counter(n.node_type.value for n in other.nodes.values())
 
-        self_set = set(self_types)
-        other_set = set(other_types)
+        self_set = self_types.keys()
+        other_set = other_types.keys()
 
         return {
             "nodes_only_in_self": list(self_set - other_set),
@@ -272,7 +482,7 @@ class FlowGraph:
             "other_node_count": len(other.nodes),
             "self_edge_count": len(self.edges),
             "other_edge_count": len(other.edges),
-            "topologically_equivalent": self_types == other_types,
+            "topologically_equivalent": self.signature() == other.signature(),
         }
 
 
@@ -283,133 +493,144 @@ def build_flow_graph(profile) -> FlowGraph:
     Build a FlowGraph from a UnitProfile.
     Auto-generates the standard LACT topology based on
     the unit's installed components.
+
+    Units with the same pipe size and component selection share
+    a cached template; each call returns a fresh copy of it, so
+    callers may extend the graph. The shared node and edge objects
+    are immutable; replace a node with add_node() to change it.
     """
+    template = _flow_graph_template(profile.pipe_size, profile.components)
+    return template._clone(profile.unit_id)
+
+
+@lru_cache(maxsize=128)
+def _flow_graph_template(pipe: float, comp) -> FlowGraph:
+    """Build the flow graph for one pipe size / component selection."""
     from plc.fleet.components import (
         KNOWN_METERS, KNOWN_SAMPLERS, KNOWN_PROVERS,
     )
 
-    graph = FlowGraph(unit_id=profile.unit_id)
-    comp = profile.components
-    pipe = profile.pipe_size
-
-    # Node counter for unique IDs
-    y_pos = 0.0
+    # Nodes and edges are collected in order, then loaded in one go
+    nodes = []
+    edges = []
     step = 1.0
 
-    def add(node_type, label, io_tags=None):
-        nonlocal y_pos
-        nid = f"{node_type.value}_{len(graph.nodes)}"
-        node = FlowNode(
+    def add(node_type, label, io_tags=()):
+        idx = len(nodes)
+        nid = f"{node_type.value}_{idx}"
+        nodes.append(FlowNode(
             node_id=nid,
             node_type=node_type,
             label=label,
-            io_tags=io_tags or [],
-            position=(0.0, y_pos),
-        )
-        graph.add_node(node)
-        y_pos += step
+            io_tags=tuple(sys.intern(t) for t in io_tags),
+            position=(0.0, idx * step),
+        ))
         return nid
 
     # ── Build main flow path ─────────────────────────────────
 
     inlet_id = add(NodeType.INLET_VALVE, f"{pipe}\" Inlet Ball Valve",
-                    ["DI_INLET_VLV_OPEN", "DI_INLET_VLV_CLOSED"])
+                    ("DI_INLET_VLV_OPEN", "DI_INLET_VLV_CLOSED"))
 
     prev_id = inlet_id
 
     if comp.has_strainer:
         strainer_id = add(NodeType.STRAINER,
                           f"Strainer ({comp.strainer_mesh} mesh)",
-                          ["DI_STRAINER_HI_DP", "AI_STRAINER_DP"])
-        graph.add_edge(FlowEdge(prev_id, strainer_id, FlowPath.MAIN, pipe))
+                          ("DI_STRAINER_HI_DP", "AI_STRAINER_DP"))
+        edges.append(_make_edge(prev_id, strainer_id, FlowPath.MAIN, pipe))
         prev_id = strainer_id
 
     pump_id = add(NodeType.PUMP, "Transfer Pump",
-                  ["DO_PUMP_START", "DI_PUMP_RUNNING", "DI_PUMP_OVERLOAD"])
-    graph.add_edge(FlowEdge(prev_id, pump_id, FlowPath.MAIN, pipe))
+                  ("DO_PUMP_START", "DI_PUMP_RUNNING", "DI_PUMP_OVERLOAD"))
+    edges.append(_make_edge(prev_id, pump_id, FlowPath.MAIN, pipe))
     prev_id = pump_id
 
     bsw_id = add(NodeType.BSW_PROBE, "BS&W Probe",
-                  ["AI_BSW_PROBE"])
-    graph.add_edge(FlowEdge(prev_id, bsw_id, FlowPath.MAIN, pipe))
+                  ("AI_BSW_PROBE",))
+    edges.append(_make_edge(prev_id, bsw_id, FlowPath.MAIN, pipe))
     prev_id = bsw_id
 
     if comp.has_air_eliminator:
         air_id = add(NodeType.AIR_ELIMINATOR, "Air Eliminator",
-                      ["DI_AIR_ELIM_FLOAT", "AI_LOOP_HI_PRESS"])
-        graph.add_edge(FlowEdge(prev_id, air_id, FlowPath.MAIN, pipe))
+                      ("DI_AIR_ELIM_FLOAT", "AI_LOOP_HI_PRESS"))
+        edges.append(_make_edge(prev_id, air_id, FlowPath.MAIN, pipe))
         prev_id = air_id
 
     if comp.has_static_mixer:
         mixer_id = add(NodeType.STATIC_MIXER, "Static Mixer")
-        graph.add_edge(FlowEdge(prev_id, mixer_id, FlowPath.MAIN, pipe))
+        edges.append(_make_edge(prev_id, mixer_id, FlowPath.MAIN, pipe))
         prev_id = mixer_id
 
     sampler = KNOWN_SAMPLERS.get(comp.sampler_key)
     if sampler:
-        tags = ["DO_SAMPLE_SOL", "DI_SAMPLE_POT_HI", "DI_SAMPLE_POT_LO"]
+        tags = ("DO_SAMPLE_SOL", "DI_SAMPLE_POT_HI", "DI_SAMPLE_POT_LO")
         if sampler.has_mixing_pump:
-            tags.append("DO_SAMPLE_MIX_PUMP")
+            tags += ("DO_SAMPLE_MIX_PUMP",)
         sampler_id = add(NodeType.SAMPLER, f"Sampler ({sampler.model})", tags)
-        graph.add_edge(FlowEdge(prev_id, sampler_id, FlowPath.MAIN, pipe))
+        edges.append(_make_edge(prev_id, sampler_id, FlowPath.MAIN, pipe))
         prev_id = sampler_id
 
     # ── Divert valve (splits into sales and divert paths) ────
     divert_id = add(NodeType.DIVERT_VALVE, "Divert Valve",
-                    ["DO_DIVERT_CMD", "DI_DIVERT_SALES", "DI_DIVERT_DIVERT"])
-    graph.add_edge(FlowEdge(prev_id, divert_id, FlowPath.MAIN, pipe))
+                    ("DO_DIVERT_CMD", "DI_DIVERT_SALES", "DI_DIVERT_DIVERT"))
+    edges.append(_make_edge(prev_id, divert_id, FlowPath.MAIN, pipe))
 
     # ── Sales path ───────────────────────────────────────────
     meter = KNOWN_METERS.get(comp.meter_key)
     meter_label = meter.display_name if meter else "PD Meter"
     meter_id = add(NodeType.METER, meter_label,
-                   ["PI_METER_PULSE", "AI_METER_TEMP"])
-    graph.add_edge(FlowEdge(divert_id, meter_id, FlowPath.SALES, pipe))
+                   ("PI_METER_PULSE", "AI_METER_TEMP"))
+    edges.append(_make_edge(divert_id, meter_id, FlowPath.SALES, pipe))
 
     sales_prev = meter_id
 
     if comp.has_test_thermowell:
         thermo_id = add(NodeType.TEST_THERMOWELL, "Test Thermowell",
-                        ["AI_TEST_THERMO"])
-        graph.add_edge(FlowEdge(sales_prev, thermo_id, FlowPath.SALES, pipe))
+                        ("AI_TEST_THERMO",))
+        edges.append(_make_edge(sales_prev, thermo_id, FlowPath.SALES, pipe))
         sales_prev = thermo_id
 
     prover = KNOWN_PROVERS.get(comp.prover_key)
     if prover and prover.io_signature.digital_inputs:
         prover_id = add(NodeType.PROVER_TEE, f"Prover ({prover.model})",
-                        ["DO_PROVER_VLV_CMD", "DI_PROVER_VLV_OPEN"])
-        graph.add_edge(FlowEdge(sales_prev, prover_id, FlowPath.SALES, pipe))
+                        ("DO_PROVER_VLV_CMD", "DI_PROVER_VLV_OPEN"))
+        edges.append(_make_edge(sales_prev, prover_id, FlowPath.SALES, pipe))
         sales_prev = prover_id
 
     if comp.num_backpressure_valves >= 1:
         bp_sales_id = add(NodeType.BACKPRESSURE_VALVE, "BP Valve (Sales)",
-                          ["AO_BP_SALES_SP"])
-        graph.add_edge(FlowEdge(sales_prev, bp_sales_id, FlowPath.SALES, pipe))
+                          ("AO_BP_SALES_SP",))
+        edges.append(_make_edge(sales_prev, bp_sales_id, FlowPath.SALES, pipe))
         sales_prev = bp_sales_id
 
     check_sales_id = add(NodeType.CHECK_VALVE, "Check Valve (Sales)")
-    graph.add_edge(FlowEdge(sales_prev, check_sales_id, FlowPath.SALES, pipe))
+    edges.append(_make_edge(sales_prev, check_sales_id, FlowPath.SALES, pipe))
 
     outlet_id = add(NodeType.OUTLET_VALVE, f"{pipe}\" Outlet Ball Valve",
-                    ["DI_OUTLET_VLV_OPEN"])
-    graph.add_edge(FlowEdge(check_sales_id, outlet_id, FlowPath.SALES, pipe))
+                    ("DI_OUTLET_VLV_OPEN",))
+    edges.append(_make_edge(check_sales_id, outlet_id, FlowPath.SALES, pipe))
 
     pipeline_id = add(NodeType.PIPELINE, "Sales Pipeline")
-    graph.add_edge(FlowEdge(outlet_id, pipeline_id, FlowPath.SALES, pipe))
+    edges.append(_make_edge(outlet_id, pipeline_id, FlowPath.SALES, pipe))
 
     # ── Divert path ──────────────────────────────────────────
     if comp.num_backpressure_valves >= 2:
         bp_divert_id = add(NodeType.BACKPRESSURE_VALVE, "BP Valve (Divert)",
-                           ["AO_BP_DIVERT_SP"])
-        graph.add_edge(FlowEdge(divert_id, bp_divert_id, FlowPath.DIVERT, pipe))
+                           ("AO_BP_DIVERT_SP",))
+        edges.append(_make_edge(divert_id, bp_divert_id, FlowPath.DIVERT, pipe))
         divert_prev = bp_divert_id
     else:
         divert_prev = divert_id
 
     check_divert_id = add(NodeType.CHECK_VALVE, "Check Valve (Divert)")
-    graph.add_edge(FlowEdge(divert_prev, check_divert_id, FlowPath.DIVERT, pipe))
+    edges.append(_make_edge(divert_prev, check_divert_id, FlowPath.DIVERT, pipe))
 
     tank_id = add(NodeType.TANK_RETURN, "Tank Return (Divert)")
-    graph.add_edge(FlowEdge(check_divert_id, tank_id, FlowPath.DIVERT, pipe))
+    edges.append(_make_edge(check_divert_id, tank_id, FlowPath.DIVERT, pipe))
 
+    graph = FlowGraph()
+    graph._bulk_load(nodes, edges)
+    # Warm the derived views so every copy inherits them
+    graph._group_flow_paths()
     return graph
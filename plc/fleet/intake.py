@@ -15,8 +15,16 @@ The intake process:
 Can be driven interactively (CLI) or programmatically (API).
 """
 
+import atexit
+import copy
 import json
+import logging
+import threading
 import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -29,6 +37,190 @@ from plc.fleet.components import (
     KNOWN_BSW_PROBES, KNOWN_SAMPLERS, KNOWN_PROVERS,
 )
 from plc.fleet.photo_analyzer import PhotoAnalyzer
+from plc.fleet.jsonio import write_json
+
+logger = logging.getLogger(__name__)
+
+# ── Photo Tag Keywords ───────────────────────────────────────
+
+# Substrings of a photo tag that suggest catalog components
+TAG_MAPPINGS = {
+    "smith": {"meter": ["smith_e3s1_3in", "smith_e3s1_4in", "smith_g6_2in"]},
+    "e3": {"meter": ["smith_e3s1_3in", "smith_e3s1_4in"]},
+    "hydromatic": {"divert_valve": ["hydromatic_3in", "hydromatic_4in"]},
+    "clay_bailey": {"sampler": ["clay_bailey_15gal", "clay_bailey_5gal"]},
+    "welker": {"sampler": ["welker_piston"]},
+    "phase_dynamics": {"bsw_probe": ["phase_dynamics_4528", "phase_dynamics_analyzer"]},
+    "4528": {"bsw_probe": ["phase_dynamics_4528"]},
+}
+# Per keyword index: ((component_type, component_keys), ...)
+_TAG_SUGGESTIONS = tuple(
+    tuple((ctype, tuple(keys)) for ctype, keys in mapping.items())
+    for mapping in TAG_MAPPINGS.values()
+)
+
+
+def _build_keyword_automaton(keywords) -> tuple:
+    """
+    Build Aho-Corasick tables (goto, fail, output) over keywords.
+    Outputs are the indices of the keywords ending at each state.
+    """
+    goto = [{}]
+    out = [set()]
+    for idx, keyword in enumerate(keywords):
+        state = 0
+        for ch in keyword:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto.append({})
+                out.append(set())
+                goto[state][ch] = nxt
+            state = nxt
+        out[state].add(idx)
+
+    fail = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for ch, nxt in goto[state].items():
+            queue.append(nxt)
+            f = fail[state]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[nxt] = goto[f].get(ch, 0) if state else 0
+            out[nxt] |= out[fail[nxt]]
+    return goto, fail, tuple(frozenset(o) for o in out)
+
+
+_TAG_GOTO, _TAG_FAIL, _TAG_OUT = _build_keyword_automaton(TAG_MAPPINGS)
+
+
+def _match_tag_keywords(text: str) -> set:
+    """Indices of every TAG_MAPPINGS keyword occurring in text."""
+    goto, fail, out = _TAG_GOTO, _TAG_FAIL, _TAG_OUT
+    found = set()
+    state = 0
+    for ch in text:
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        if out[state]:
+            found |= out[state]
+    return found
+
+
+# ── Catalog Validation ───────────────────────────────────────
+
+# (ComponentSelection attribute, catalog, label) checked by validate()
+_CATALOG_CHECKS = (
+    ("meter_key", KNOWN_METERS, "meter"),
+    ("pump_key", KNOWN_PUMPS, "pump"),
+    ("divert_valve_key", KNOWN_DIVERT_VALVES, "divert valve"),
+    ("bsw_probe_key", KNOWN_BSW_PROBES, "BS&W probe"),
+    ("sampler_key", KNOWN_SAMPLERS, "sampler"),
+)
+
+# The checked keys of a ComponentSelection, as one tuple
+_get_catalog_keys = attrgetter(*(attr for attr, _, _ in _CATALOG_CHECKS))
+
+
+@lru_cache(maxsize=256)
+def _component_key_issues(keys: tuple) -> tuple:
+    """Issues for component keys missing from their catalogs."""
+    return tuple(
+        f"Unknown {label}: {key}"
+        for key, (_, catalog, label) in zip(keys, _CATALOG_CHECKS)
+        if key and key not in catalog
+    )
+
+
+# ── Deferred Saves ───────────────────────────────────────────
+
+# Seconds a queued save waits so back-to-back saves of one draft coalesce
+SAVE_DEBOUNCE_S = 0.25
+
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="intake-save")
+_PENDING: dict = {}  # path -> latest serialized profile
+_FAILED: dict = {}  # path -> error from its last write attempt
+_PENDING_LOCK = threading.Lock()
+_WRITE_LOCK = threading.Lock()
+
+
+def _queue_save(path: str, profile: UnitProfile):
+    """Snapshot a profile and schedule it to be written to path."""
+    profile.updated_at = time.time()
+    # Deep copy so later edits to photo tags or overrides can't leak in
+    data = copy.deepcopy(profile._to_dict())
+    with _PENDING_LOCK:
+        # A snapshot left behind by a failed write has no write queued
+        scheduled = path in _PENDING and path not in _FAILED
+        _PENDING[path] = data
+    if not scheduled:
+        _WRITER.submit(_flush_later, path)
+
+
+def _write_snapshot(path: str, data: dict):
+    """
+    Write one snapshot. On failure it goes back in the queue (unless a
+    newer one arrived meanwhile) and the error is logged and re-raised.
+    """
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        write_json(path, data)
+    except Exception as exc:
+        with _PENDING_LOCK:
+            _PENDING.setdefault(path, data)
+            _FAILED[path] = exc
+        logger.error("Intake save to %s failed: %s", path, exc)
+        raise
+    with _PENDING_LOCK:
+        _FAILED.pop(path, None)
+
+
+def _write_pending(path: str):
+    """Write the latest queued snapshot for path, if any."""
+    with _WRITE_LOCK:
+        with _PENDING_LOCK:
+            data = _PENDING.pop(path, None)
+        if data is not None:
+            _write_snapshot(path, data)
+
+
+def _flush_later(path: str):
+    time.sleep(SAVE_DEBOUNCE_S)
+    _write_pending(path)
+
+
+def flush_pending_saves():
+    """
+    Write every queued intake save now. Runs at interpreter exit.
+    Snapshots that cannot be written stay queued, and the first
+    error is raised once every path has been tried.
+    """
+    errors = []
+    with _WRITE_LOCK:
+        with _PENDING_LOCK:
+            pending = list(_PENDING.items())
+            _PENDING.clear()
+        for path, data in pending:
+            try:
+                _write_snapshot(path, data)
+            except Exception as exc:
+                errors.append(exc)
+    if errors:
+        raise errors[0]
+
+
+atexit.register(flush_pending_saves)
+
+
+# ── Audit Trail ──────────────────────────────────────────────
+
+AuditEntry = namedtuple("AuditEntry", "timestamp step detail")
+
+# Most recent intake steps kept per form
+AUDIT_LOG_SIZE = 1024
 
 
 class IntakeForm:
@@ -45,7 +237,7 @@ class IntakeForm:
             self.profile.unit_id = unit_id
         self.profile.status = UnitStatus.INTAKE
         self._photo_analyzer = PhotoAnalyzer()
-        self._step_log: list = []
+        self._step_log: deque = deque(maxlen=AUDIT_LOG_SIZE)
 
     @property
     def unit_id(self) -> str:
@@ -53,11 +245,7 @@ class IntakeForm:
 
     def log_step(self, step: str, detail: str = ""):
         """Record an intake step for audit trail."""
-        self._step_log.append({
-            "timestamp": time.time(),
-            "step": step,
-            "detail": detail,
-        })
+        self._step_log.append(AuditEntry(time.time(), step, detail))
 
     # ── Step 1: Basic Identification ─────────────────────────
 
@@ -87,26 +275,23 @@ class IntakeForm:
 
     # ── Step 2: Photo Processing ─────────────────────────────
 
-    def add_photos(self, photo_paths: list) -> list:
+    def add_photos(self, photo_paths: list, parallel: bool = True) -> list:
         """
         Add photos and extract metadata. Returns list of
         PhotoRecord objects with extracted EXIF data.
         """
-        records = []
-        for path in photo_paths:
-            record = self._photo_analyzer.analyze(path)
-            self.profile.photos.append(record)
-            records.append(record)
+        records = self._photo_analyzer.analyze_many(list(photo_paths), parallel)
+        self.profile.photos.extend(records)
 
         self.log_step("photos", f"Added {len(records)} photos")
 
         # Auto-detect GPS location from first photo with GPS
-        for rec in records:
-            if rec.has_gps and self.profile.location.latitude == 0:
+        if self.profile.location.latitude == 0:
+            rec = next((r for r in records if r.has_gps), None)
+            if rec is not None:
                 self.profile.location.latitude = rec.gps_lat
                 self.profile.location.longitude = rec.gps_lon
                 self.log_step("auto_location", f"GPS from photo: {rec.gps_lat}, {rec.gps_lon}")
-                break
 
         return records
 
@@ -115,34 +300,19 @@ class IntakeForm:
         Analyze all photos and return component identification
         suggestions based on visible nameplates, equipment, etc.
         """
-        suggestions = {}
-        all_tags = set()
-        for photo in self.profile.photos:
-            all_tags.update(photo.tags)
-
-        # Tag-based component suggestions
-        tag_mappings = {
-            "smith": {"meter": ["smith_e3s1_3in", "smith_e3s1_4in", "smith_g6_2in"]},
-            "e3": {"meter": ["smith_e3s1_3in", "smith_e3s1_4in"]},
-            "hydromatic": {"divert_valve": ["hydromatic_3in", "hydromatic_4in"]},
-            "clay_bailey": {"sampler": ["clay_bailey_15gal", "clay_bailey_5gal"]},
-            "welker": {"sampler": ["welker_piston"]},
-            "phase_dynamics": {"bsw_probe": ["phase_dynamics_4528", "phase_dynamics_analyzer"]},
-            "4528": {"bsw_probe": ["phase_dynamics_4528"]},
-        }
-
-        for tag in all_tags:
-            tag_lower = tag.lower()
-            for keyword, mappings in tag_mappings.items():
-                if keyword in tag_lower:
-                    for component_type, keys in mappings.items():
-                        suggestions.setdefault(component_type, []).extend(keys)
-
-        # Deduplicate
-        for key in suggestions:
-            suggestions[key] = list(dict.fromkeys(suggestions[key]))
-
-        return suggestions
+        # Lowercase each distinct tag once and scan them all in one pass;
+        # the NUL separator keeps keywords from matching across tags
+        all_tags = {tag.lower() for photo in self.profile.photos for tag in photo.tags}
+        matched = _match_tag_keywords("\x00".join(all_tags))
+
+        # Suggestions in TAG_MAPPINGS order; dict keys double as an
+        # ordered set for deduplication
+        found = {}
+        for idx in sorted(matched):
+            for component_type, keys in _TAG_SUGGESTIONS[idx]:
+                found.setdefault(component_type, {}).update(dict.fromkeys(keys))
+
+        return {ctype: list(keys) for ctype, keys in found.items()}
 
     # ── Step 3: Component Selection ──────────────────────────
 
@@ -232,18 +402,9 @@ class IntakeForm:
         issues = self.profile.validate()
 
         # Check component keys exist in catalogs
-        comp = self.profile.components
-        if comp.meter_key and comp.meter_key not in KNOWN_METERS:
-            issues.append(f"Unknown meter: {comp.meter_key}")
-        if comp.pump_key and comp.pump_key not in KNOWN_PUMPS:
-            issues.append(f"Unknown pump: {comp.pump_key}")
-        if comp.divert_valve_key and comp.divert_valve_key not in KNOWN_DIVERT_VALVES:
-            issues.append(f"Unknown divert valve: {comp.divert_valve_key}")
-        if comp.bsw_probe_key and comp.bsw_probe_key not in KNOWN_BSW_PROBES:
-            issues.append(f"Unknown BS&W probe: {comp.bsw_probe_key}")
-        if comp.sampler_key and comp.sampler_key not in KNOWN_SAMPLERS:
-            issues.append(f"Unknown sampler: {comp.sampler_key}")
-
+        issues.extend(_component_key_issues(
+            _get_catalog_keys(self.profile.components)
+        ))
         return issues
 
     def finalize(self) -> UnitProfile:
@@ -258,22 +419,33 @@ class IntakeForm:
         self.profile.status = UnitStatus.CONFIGURED
         self.profile.updated_at = time.time()
         self.log_step("finalized", "Profile validated and marked configured")
+        flush_pending_saves()
         return self.profile
 
     def get_audit_log(self) -> list:
         """Return the intake step log for audit purposes."""
-        return self._step_log.copy()
+        return [entry._asdict() for entry in self._step_log]
+
+    def iter_audit_log(self):
+        """Iterate the intake step log as AuditEntry tuples, without copying."""
+        return iter(self._step_log)
 
     def save_progress(self, directory: str = "config/units"):
-        """Save the current intake state (even if incomplete)."""
-        self.profile.save(
-            f"{directory}/{self.profile.unit_id or 'draft'}.json"
+        """
+        Save the current intake state (even if incomplete). The write
+        happens in the background; saves of the same draft within
+        SAVE_DEBOUNCE_S collapse into one. Call flush_pending_saves()
+        to force it to disk.
+        """
+        _queue_save(
+            f"{directory}/{self.profile.unit_id or 'draft'}.json", self.profile
         )
         self.log_step("saved", f"Progress saved to {directory}")
 
     @classmethod
     def resume(cls, path: str) -> "IntakeForm":
         """Resume an incomplete intake from saved profile."""
+        flush_pending_saves()
         form = cls()
         form.profile = UnitProfile.load(path)
         form.log_step("resumed", f"Loaded from {path}")
@@ -282,36 +454,70 @@ class IntakeForm:
 
 # ── Quick Intake Templates ───────────────────────────────────
 
-def quick_intake_scs_3inch(
-    unit_id: str,
-    serial: str = "",
-    location_state: str = "TX",
-) -> IntakeForm:
-    """
-    Pre-filled intake for the common SCS Technologies 3" LACT.
-    These are the most common surplus units on the market.
-    """
-    form = IntakeForm(unit_id=unit_id)
-    form.set_identity(
-        unit_id=unit_id,
-        serial_number=serial,
-        manufacturer="SCS Technologies",
-        model='3" LACT Unit',
-        pipe_size=3.0,
-        source="Surplus Market",
-    )
-    form.select_components(
+# Fixed (identity fields, component selection) per template. The
+# selections are immutable, so every quick intake shares one object
+# and its cached signature and catalog-check results.
+_SCS_3IN_TEMPLATE = (
+    {
+        "manufacturer": "SCS Technologies",
+        "model": '3" LACT Unit',
+        "pipe_size": 3.0,
+        "source": "Surplus Market",
+    },
+    ComponentSelection(
         meter_key="smith_e3s1_3in",
         pump_key="generic_centrifugal_480v",
         divert_valve_key="hydromatic_3in",
         bsw_probe_key="phase_dynamics_4528",
         sampler_key="clay_bailey_15gal",
         prover_key="none",
+    ),
+)
+
+_4IN_TEMPLATE = (
+    {
+        "manufacturer": "Generic",
+        "model": '4" LACT Unit',
+        "pipe_size": 4.0,
+        "source": "Surplus Market",
+    },
+    ComponentSelection(
+        meter_key="smith_e3s1_4in",
+        pump_key="generic_centrifugal_480v",
+        divert_valve_key="hydromatic_4in",
+        bsw_probe_key="phase_dynamics_4528",
+        sampler_key="welker_piston",
+        prover_key="none",
+    ),
+)
+
+
+def _quick_intake(template: tuple, unit_id: str, serial: str,
+                  location_state: str) -> IntakeForm:
+    """Fill a new intake form from a template, logging the same steps."""
+    identity, components = template
+    form = IntakeForm(unit_id=unit_id)
+    form.set_identity(unit_id=unit_id, serial_number=serial, **identity)
+    form.profile.components = components
+    form.log_step(
+        "components", f"meter={components.meter_key}, pump={components.pump_key}"
     )
     form.set_location(state=location_state)
     return form
 
 
+def quick_intake_scs_3inch(
+    unit_id: str,
+    serial: str = "",
+    location_state: str = "TX",
+) -> IntakeForm:
+    """
+    Pre-filled intake for the common SCS Technologies 3" LACT.
+    These are the most common surplus units on the market.
+    """
+    return _quick_intake(_SCS_3IN_TEMPLATE, unit_id, serial, location_state)
+
+
 def quick_intake_4inch(
     unit_id: str,
     serial: str = "",
@@ -320,22 +526,4 @@ def quick_intake_4inch(
     """
     Pre-filled intake for 4" LACT units.
     """
-    form = IntakeForm(unit_id=unit_id)
-    form.set_identity(
-        unit_id=unit_id,
-        serial_number=serial,
-        manufacturer="Generic",
-        model='4" LACT Unit',
-        pipe_size=4.0,
-        source="Surplus Market",
-    )
-    form.select_components(
-        meter_key="smith_e3s1_4in",
-        pump_key="generic_centrifugal_480v",
-        divert_valve_key="hydromatic_4in",
-        bsw_probe_key="phase_dynamics_4528",
-        sampler_key="welker_piston",
-        prover_key="none",
-    )
-    form.set_location(state=location_state)
-    return form
+    return _quick_intake(_4IN_TEMPLATE, unit_id, serial, location_state)
@@ -0,0 +1,259 @@
+"""
+Fleet JSON I/O
+================
+Read and write helpers for unit profiles and fleet exports.
+Uses orjson when it is installed and falls back to the
+standard library otherwise; both produce 2-space indented
+UTF-8 JSON that either backend can read back. Dataclasses and
+enums are written directly (public fields in declaration order,
+enum values), so callers need not build dicts first. Large fleet
+exports are streamed with ijson when it is available.
+
+Machine-only snapshots can instead be written packed: msgpack
+when it is installed, compact JSON otherwise. read_packed()
+tells the two apart by the first byte. A packed catalog stores
+many such records behind an offset index and is memory-mapped
+on open, so each record is decoded only when it is looked up.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+    # Non-string keys are stringified, as the stdlib json module does
+    _ORJSON_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAS_ORJSON = False
+    logger.debug("orjson not installed; using stdlib json")
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+def read_json(path) -> dict:
+    """Parse a JSON file."""
+    return loads_json(Path(path).read_bytes())
+
+
+def loads_json(raw):
+    """Parse JSON bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data) -> bytes:
+    """The exact bytes write_json() would put on disk."""
+    return _dumps(data)
+
+
+def iter_json_items(path, key: str):
+    """
+    Yield (name, value) pairs of the object stored under a top-level
+    key. With ijson installed the file is streamed, so only one value
+    is held in memory at a time.
+    """
+    if HAS_IJSON:
+        with open(path, "rb") as fp:
+            yield from ijson.kvitems(fp, key, use_float=True)
+        return
+    yield from read_json(path).get(key, {}).items()
+
+
+def write_json(path, data):
+    """
+    Serialize data to a JSON file atomically: the output goes to a
+    sibling temp file which is fsynced and then renamed over the
+    target, so readers never see a half-written file.
+    """
+    _write_atomic(Path(path), _dumps(data))
+
+
+def write_json_many(items):
+    """
+    Write several (path, data) JSON files atomically: every file is
+    staged to its temp name and fsynced, then all are renamed into
+    place and each directory is synced once.
+    """
+    staged = []
+    try:
+        for path, data in items:
+            path = Path(path)
+            tmp = path.with_name(path.name + ".tmp")
+            staged.append((tmp, path))
+            with open(tmp, "wb") as fp:
+                fp.write(_dumps(data))
+                fp.flush()
+                os.fsync(fp.fileno())
+        for tmp, path in staged:
+            os.replace(tmp, path)
+    except BaseException:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+    for directory in {path.parent for _, path in staged}:
+        _fsync_dir(directory)
+
+
+def _dumps(data) -> bytes:
+    """2-space indented UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=_ORJSON_OPTS)
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _public_fields(cls) -> tuple:
+    """Dataclass field names orjson serializes: those without a leading _."""
+    return tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+
+
+def _json_default(obj):
+    """Encode dataclasses and enums for the stdlib backend as orjson does."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in _public_fields(type(obj))}
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _fsync_dir(directory: Path):
+    """Persist renames in a directory (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_packed(path, data):
+    """Serialize data compactly (msgpack, else minified JSON), atomically."""
+    _write_atomic(Path(path), _pack(data))
+
+
+def read_packed(path) -> dict:
+    """Parse a file written by write_packed() on any installation."""
+    return _unpack(Path(path).read_bytes(), path)
+
+
+def _pack(data) -> bytes:
+    if HAS_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _unpack(raw, source) -> dict:
+    if raw[:1] == b"{":
+        return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    if not HAS_MSGPACK:
+        raise ImportError("msgpack is required to read " + str(source))
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+
+# ── Packed Catalog ───────────────────────────────────────────
+# Layout: magic, uint32 index length, packed index
+# {name: [offset, length]}, then the packed records back to back.
+
+_CATALOG_MAGIC = b"LACTCAT1"
+_CATALOG_HEADER = struct.Struct("<8sI")
+
+
+def write_catalog(path, records: dict):
+    """Write a name → dict mapping as a packed catalog, atomically."""
+    blobs = [(name, _pack(data)) for name, data in records.items()]
+    index = {}
+    offset = 0
+    for name, blob in blobs:
+        index[name] = [offset, len(blob)]
+        offset += len(blob)
+    packed_index = _pack(index)
+    parts = [_CATALOG_HEADER.pack(_CATALOG_MAGIC, len(packed_index)), packed_index]
+    parts.extend(blob for _, blob in blobs)
+    _write_atomic(Path(path), b"".join(parts))
+
+
+class PackedCatalog:
+    """
+    Read-only view of a file written by write_catalog(). The file is
+    memory-mapped and records are decoded on each lookup.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_len = _CATALOG_HEADER.unpack_from(self._map, 0)
+        if magic != _CATALOG_MAGIC:
+            self._map.close()
+            raise ValueError(f"Not a packed catalog: {self.path}")
+        start = _CATALOG_HEADER.size
+        self._index = _unpack(self._map[start:start + index_len], self.path)
+        self._data_start = start + index_len
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name) -> dict:
+        offset, length = self._index[name]
+        start = self._data_start + offset
+        return _unpack(self._map[start:start + length], self.path)
+
+    def items(self):
+        for name in self._index:
+            yield name, self[name]
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _write_atomic(path: Path, raw: bytes):
+    """Write bytes via an fsynced sibling temp file and a rename."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as fp:
+            fp.write(raw)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
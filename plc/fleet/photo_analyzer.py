@@ -16,10 +16,15 @@ Uses only the Python standard library for core metadata;
 Pillow is optional for enhanced extraction.
 """
 
+import mmap
 import os
 import struct
 import time
+import zlib
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -27,6 +32,43 @@ from plc.fleet.unit_profile import PhotoRecord
 
 logger = logging.getLogger(__name__)
 
+try:
+    from PIL import Image
+    HAS_PILLOW = True
+except ImportError:
+    HAS_PILLOW = False  # Pillow not installed — that's fine
+
+# Batches at least this large are analyzed on a thread pool
+PARALLEL_MIN_PHOTOS = 8
+
+# Files analyze_batch() picks up by default
+PHOTO_EXTENSIONS = frozenset(
+    (".jpg", ".jpeg", ".png", ".heic", ".heif", ".tif", ".tiff")
+)
+
+# Bytes searched up front for a JPEG's EXIF (APP1) segment
+JPEG_EXIF_SCAN_BYTES = 65536
+
+# Precompiled EXIF field layouts, by byte order
+_U16 = {e: struct.Struct(f"{e}H") for e in "<>"}
+_U32 = {e: struct.Struct(f"{e}I") for e in "<>"}
+_IFD_ENTRY = {e: struct.Struct(f"{e}HHI") for e in "<>"}  # tag, type, count
+_RATIONAL = {e: struct.Struct(f"{e}II") for e in "<>"}
+_RATIONAL3 = {e: struct.Struct(f"{e}6I") for e in "<>"}  # deg, min, sec
+_PNG_CHUNK_HEADER = struct.Struct(">I4s")  # length, chunk type
+
+# PNG chunks that may carry a Description/Comment
+_PNG_TEXT_CHUNKS = frozenset((b"tEXt", b"iTXt"))
+
+# IFD0 tags read by _parse_ifd: camera model, orientation, GPS pointer
+_IFD0_WANTED_TAGS = frozenset((0x0110, 0x0112, 0x8825))
+
+# GPS IFD tags read by _parse_gps_ifd: latitude/longitude and their refs
+_GPS_WANTED_TAGS = frozenset((1, 2, 3, 4))
+
+# Hemisphere reference → coordinate sign
+_GPS_SIGN = {"N": 1.0, "S": -1.0, "E": 1.0, "W": -1.0}
+
 
 class PhotoAnalyzer:
     """
@@ -37,21 +79,41 @@ class PhotoAnalyzer:
     contain EXIF data.
     """
 
-    def analyze(self, file_path: str) -> PhotoRecord:
+    def analyze(self, file_path: str, stat: os.stat_result = None) -> PhotoRecord:
         """
         Analyze a single photo and return a PhotoRecord
-        with extracted metadata.
+        with extracted metadata. A stat result the caller already
+        holds (e.g. from os.scandir) saves a second stat call.
         """
         path = Path(file_path)
-        record = PhotoRecord(file_path=str(path.absolute()))
-
-        if not path.exists():
-            logger.warning("Photo not found: %s", file_path)
-            return record
-
-        # File-level metadata
-        stat = path.stat()
-        record.timestamp = stat.st_mtime
+        abs_path = str(path.absolute())
+
+        if stat is None:
+            try:
+                stat = path.stat()
+            except OSError:
+                logger.warning("Photo not found: %s", file_path)
+                return PhotoRecord(file_path=abs_path)
+
+        # Unchanged files (same path, mtime and size) reuse the cached
+        # parse; each caller gets its own copy to annotate
+        cached = self._analyze_cached(abs_path, stat.st_mtime_ns, stat.st_size)
+        return replace(cached, timestamp=stat.st_mtime, tags=list(cached.tags))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _analyze_cached(abs_path: str, mtime_ns: int, size: int) -> PhotoRecord:
+        """Parse a photo's metadata; keyed on file identity and version."""
+        return PhotoAnalyzer()._analyze_file(Path(abs_path))
+
+    @classmethod
+    def cache_clear(cls):
+        """Forget all cached photo analyses."""
+        cls._analyze_cached.cache_clear()
+
+    def _analyze_file(self, path: Path) -> PhotoRecord:
+        """Run the metadata extractors for one existing file."""
+        record = PhotoRecord(file_path=str(path))
 
         # Try to extract EXIF data
         suffix = path.suffix.lower()
@@ -64,64 +126,113 @@ class PhotoAnalyzer:
         elif suffix in (".tif", ".tiff"):
             self._extract_tiff_exif(path, record)
 
-        # Try Pillow as enhanced fallback
-        self._try_pillow_extraction(path, record)
+        # Try Pillow as enhanced fallback, only for fields still unset.
+        # Orientation 1 is the default, so it alone never warrants a reopen.
+        needs_pillow = record.gps_lat == 0.0 or not record.camera_model
+        if HAS_PILLOW and needs_pillow:
+            self._try_pillow_extraction(path, record)
 
         return record
 
-    def analyze_batch(self, directory: str, extensions: tuple = None) -> list:
+    def analyze_batch(self, directory: str, extensions: tuple = None,
+                      processes: bool = False) -> list:
         """
         Analyze all photos in a directory.
         Returns list of PhotoRecord objects sorted by timestamp.
         """
         if extensions is None:
-            extensions = (".jpg", ".jpeg", ".png", ".heic", ".heif", ".tif", ".tiff")
+            extensions = PHOTO_EXTENSIONS
+        else:
+            extensions = frozenset(ext.lower() for ext in extensions)
 
-        dir_path = Path(directory)
-        if not dir_path.is_dir():
+        if not os.path.isdir(directory):
             return []
 
-        records = []
-        for entry in sorted(dir_path.iterdir()):
-            if entry.suffix.lower() in extensions:
-                record = self.analyze(str(entry))
-                records.append(record)
-
+        with os.scandir(directory) as it:
+            entries = sorted(
+                (entry for entry in it
+                 if os.path.splitext(entry.name)[1].lower() in extensions
+                 and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
+        records = self.analyze_many(
+            [entry.path for entry in entries],
+            stats=[entry.stat() for entry in entries],
+            processes=processes,
+        )
         records.sort(key=lambda r: r.timestamp)
         return records
 
+    def analyze_many(self, paths: list, parallel: bool = True,
+                     stats: list = None, processes: bool = False) -> list:
+        """
+        Analyze a list of photos, returning records in input order.
+        Batches of PARALLEL_MIN_PHOTOS or more are spread over a
+        thread pool so file reads overlap. ``stats``, if given, holds
+        a stat result per path. ``processes`` uses a process pool
+        instead, for large CPU-bound batches; worker results do not
+        populate this process's analysis cache.
+        """
+        if stats is None:
+            stats = [None] * len(paths)
+        if not parallel or len(paths) < PARALLEL_MIN_PHOTOS:
+            return [self.analyze(p, st) for p, st in zip(paths, stats)]
+        if processes:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(_analyze_in_worker, paths, stats, chunksize=16))
+        workers = min(8, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.analyze, paths, stats))
+
     def _extract_jpeg_exif(self, path: Path, record: PhotoRecord):
         """Extract EXIF from JPEG files using standard library."""
         try:
-            with open(path, "rb") as f:
+            with open(path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
                 # Check JPEG SOI marker
-                if f.read(2) != b"\xff\xd8":
+                if mm[:2] != b"\xff\xd8":
                     return
 
-                # Scan for APP1 (EXIF) marker
-                while True:
-                    marker = f.read(2)
-                    if len(marker) < 2:
-                        break
-                    if marker[0] != 0xFF:
-                        break
-
-                    # APP1 = 0xFFE1
-                    if marker[1] == 0xE1:
-                        length = struct.unpack(">H", f.read(2))[0]
-                        exif_data = f.read(length - 2)
-                        self._parse_exif_data(exif_data, record)
-                        break
-
-                    # Skip other markers
-                    if marker[1] in (0xD0, 0xD1, 0xD2, 0xD3, 0xD4,
-                                      0xD5, 0xD6, 0xD7, 0xD8, 0xD9):
-                        continue
-                    length = struct.unpack(">H", f.read(2))[0]
-                    f.seek(length - 2, 1)
+                # EXIF lives in an APP1 segment near the start of the
+                # file, so search for it before walking markers
+                window = min(len(mm), JPEG_EXIF_SCAN_BYTES)
+                i = mm.find(b"\xff\xe1", 2, window)
+                while i != -1:
+                    if mm[i + 4:i + 10] == b"Exif\x00\x00":
+                        length = _U16[">"].unpack_from(mm, i + 2)[0]
+                        self._parse_exif_data(mm[i + 4:i + 2 + length], record)
+                        return
+                    i = mm.find(b"\xff\xe1", i + 2, window)
+
+                if window == JPEG_EXIF_SCAN_BYTES:
+                    mm.seek(2)
+                    self._scan_jpeg_markers(mm, record)
         except Exception:
             logger.debug("Failed to extract JPEG EXIF: %s", path)
 
+    def _scan_jpeg_markers(self, f, record: PhotoRecord):
+        """Walk JPEG segments from the current position to APP1."""
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2:
+                break
+            if marker[0] != 0xFF:
+                break
+
+            # APP1 = 0xFFE1
+            if marker[1] == 0xE1:
+                length = _U16[">"].unpack(f.read(2))[0]
+                exif_data = f.read(length - 2)
+                self._parse_exif_data(exif_data, record)
+                break
+
+            # Skip other markers
+            if marker[1] in (0xD0, 0xD1, 0xD2, 0xD3, 0xD4,
+                              0xD5, 0xD6, 0xD7, 0xD8, 0xD9):
+                continue
+            length = _U16[">"].unpack(f.read(2))[0]
+            f.seek(length - 2, 1)
+
     def _extract_png_metadata(self, path: Path, record: PhotoRecord):
         """Extract metadata from PNG text chunks."""
         try:
@@ -134,25 +245,45 @@ class PhotoAnalyzer:
                     header = f.read(8)
                     if len(header) < 8:
                         break
-                    length = struct.unpack(">I", header[:4])[0]
-                    chunk_type = header[4:8]
+                    length, chunk_type = _PNG_CHUNK_HEADER.unpack(header)
+                    # Text chunks conventionally precede the image data
+                    if chunk_type in (b"IDAT", b"IEND"):
+                        break
 
-                    if chunk_type == b"tEXt":
+                    if chunk_type in _PNG_TEXT_CHUNKS:
                         text_data = f.read(length)
                         f.read(4)  # CRC
-                        try:
-                            decoded = text_data.decode("latin-1")
-                            if "\x00" in decoded:
-                                key, val = decoded.split("\x00", 1)
-                                if key.lower() in ("description", "comment"):
-                                    record.description = val
-                        except Exception:
-                            pass
+                        key, val = self._decode_png_text(chunk_type, text_data)
+                        if key.lower() in ("description", "comment"):
+                            record.description = val
                     else:
                         f.seek(length + 4, 1)  # data + CRC
         except Exception:
             logger.debug("Failed to extract PNG metadata: %s", path)
 
+    @staticmethod
+    def _decode_png_text(chunk_type: bytes, data: bytes) -> tuple:
+        """Split a tEXt or iTXt chunk into (keyword, text)."""
+        key, sep, rest = data.partition(b"\x00")
+        if not sep:
+            return "", ""
+        if chunk_type == b"tEXt":
+            return key.decode("latin-1"), rest.decode("latin-1")
+        # iTXt: compression flag, method, language\0, translated keyword\0
+        if len(rest) < 2:
+            return "", ""
+        compressed = rest[0]
+        fields = rest[2:].split(b"\x00", 2)
+        if len(fields) < 3:
+            return "", ""
+        text = fields[2]
+        try:
+            if compressed:
+                text = zlib.decompress(text)
+            return key.decode("latin-1"), text.decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            return "", ""
+
     def _extract_tiff_exif(self, path: Path, record: PhotoRecord):
         """Extract EXIF from TIFF files."""
         # TIFF files use the same IFD structure as EXIF
@@ -175,7 +306,8 @@ class PhotoAnalyzer:
         if not data.startswith(b"Exif\x00\x00"):
             return
 
-        tiff_data = data[6:]
+        # IFD offsets are relative to the TIFF header; view it in place
+        tiff_data = memoryview(data)[6:]
         if len(tiff_data) < 8:
             return
 
@@ -187,122 +319,142 @@ class PhotoAnalyzer:
             return
 
         try:
-            ifd_offset = struct.unpack(f"{endian}I", tiff_data[4:8])[0]
+            ifd_offset = _U32[endian].unpack_from(tiff_data, 4)[0]
             self._parse_ifd(tiff_data, ifd_offset, endian, record)
         except Exception:
             logger.debug("Failed to parse EXIF IFD")
 
-    def _parse_ifd(self, data: bytes, offset: int, endian: str, record: PhotoRecord):
+    def _parse_ifd(self, data, offset: int, endian: str, record: PhotoRecord):
         """Parse a single IFD (Image File Directory)."""
         if offset + 2 > len(data):
             return
 
-        num_entries = struct.unpack(f"{endian}H", data[offset:offset + 2])[0]
+        u16 = _U16[endian]
+        u32 = _U32[endian]
+        num_entries = u16.unpack_from(data, offset)[0]
         pos = offset + 2
 
         gps_ifd_offset = None
+        pending = set(_IFD0_WANTED_TAGS)
 
         for _ in range(num_entries):
             if pos + 12 > len(data):
                 break
 
-            tag = struct.unpack(f"{endian}H", data[pos:pos + 2])[0]
-            type_id = struct.unpack(f"{endian}H", data[pos + 2:pos + 4])[0]
-            count = struct.unpack(f"{endian}I", data[pos + 4:pos + 8])[0]
-            value_raw = data[pos + 8:pos + 12]
+            tag = u16.unpack_from(data, pos)[0]
+            if tag not in pending:
+                pos += 12
+                continue
+            value_pos = pos + 8
 
             # Tag 0x0110 = Camera Model
             if tag == 0x0110:
-                str_offset = struct.unpack(f"{endian}I", value_raw)[0]
+                count = u32.unpack_from(data, pos + 4)[0]
+                str_offset = u32.unpack_from(data, value_pos)[0]
                 if str_offset + count <= len(data):
-                    record.camera_model = data[str_offset:str_offset + count].decode(
-                        "ascii", errors="ignore"
-                    ).rstrip("\x00")
+                    record.camera_model = bytes(
+                        data[str_offset:str_offset + count]
+                    ).decode("ascii", errors="ignore").rstrip("\x00")
 
             # Tag 0x0112 = Orientation
             elif tag == 0x0112:
-                record.orientation = struct.unpack(f"{endian}H", value_raw[:2])[0]
+                record.orientation = u16.unpack_from(data, value_pos)[0]
 
             # Tag 0x8825 = GPS IFD pointer
             elif tag == 0x8825:
-                gps_ifd_offset = struct.unpack(f"{endian}I", value_raw)[0]
+                gps_ifd_offset = u32.unpack_from(data, value_pos)[0]
 
+            # Stop once every tag we read has been seen
+            pending.discard(tag)
+            if not pending:
+                break
             pos += 12
 
         # Parse GPS sub-IFD if present
         if gps_ifd_offset is not None:
             self._parse_gps_ifd(data, gps_ifd_offset, endian, record)
 
-    def _parse_gps_ifd(self, data: bytes, offset: int, endian: str, record: PhotoRecord):
+    def _parse_gps_ifd(self, data, offset: int, endian: str, record: PhotoRecord):
         """Parse GPS IFD to extract coordinates."""
         if offset + 2 > len(data):
             return
 
-        num_entries = struct.unpack(f"{endian}H", data[offset:offset + 2])[0]
+        entry = _IFD_ENTRY[endian]
+        u32 = _U32[endian]
+        num_entries = _U16[endian].unpack_from(data, offset)[0]
         pos = offset + 2
 
         lat_ref = "N"
         lon_ref = "W"
         lat_vals = None
         lon_vals = None
+        pending = set(_GPS_WANTED_TAGS)
 
         for _ in range(num_entries):
             if pos + 12 > len(data):
                 break
 
-            tag = struct.unpack(f"{endian}H", data[pos:pos + 2])[0]
-            type_id = struct.unpack(f"{endian}H", data[pos + 2:pos + 4])[0]
-            count = struct.unpack(f"{endian}I", data[pos + 4:pos + 8])[0]
-            value_raw = data[pos + 8:pos + 12]
+            tag, type_id, count = entry.unpack_from(data, pos)
+            if tag not in pending:
+                pos += 12
+                continue
+            value_pos = pos + 8
 
             # GPS latitude reference (N/S)
             if tag == 1:
-                lat_ref = value_raw[:1].decode("ascii", errors="ignore")
+                lat_ref = bytes(data[value_pos:value_pos + 1]).decode("ascii", errors="ignore")
             # GPS latitude (rational x 3)
             elif tag == 2:
-                val_offset = struct.unpack(f"{endian}I", value_raw)[0]
+                val_offset = u32.unpack_from(data, value_pos)[0]
                 lat_vals = self._read_gps_rational(data, val_offset, endian)
             # GPS longitude reference (E/W)
             elif tag == 3:
-                lon_ref = value_raw[:1].decode("ascii", errors="ignore")
+                lon_ref = bytes(data[value_pos:value_pos + 1]).decode("ascii", errors="ignore")
             # GPS longitude (rational x 3)
             elif tag == 4:
-                val_offset = struct.unpack(f"{endian}I", value_raw)[0]
+                val_offset = u32.unpack_from(data, value_pos)[0]
                 lon_vals = self._read_gps_rational(data, val_offset, endian)
 
+            # Altitude, timestamps, etc. follow; stop once both fixes are read
+            pending.discard(tag)
+            if not pending:
+                break
             pos += 12
 
         if lat_vals and lon_vals:
             lat = lat_vals[0] + lat_vals[1] / 60.0 + lat_vals[2] / 3600.0
             lon = lon_vals[0] + lon_vals[1] / 60.0 + lon_vals[2] / 3600.0
-            if lat_ref == "S":
-                lat = -lat
-            if lon_ref == "W":
-                lon = -lon
-            record.gps_lat = round(lat, 6)
-            record.gps_lon = round(lon, 6)
-
-    def _read_gps_rational(self, data: bytes, offset: int, endian: str) -> list:
+            record.gps_lat = round(_GPS_SIGN.get(lat_ref, 1.0) * lat, 6)
+            record.gps_lon = round(_GPS_SIGN.get(lon_ref, 1.0) * lon, 6)
+
+    def _read_gps_rational(self, data, offset: int, endian: str) -> list:
         """Read 3 RATIONAL values (degrees, minutes, seconds)."""
+        if offset + 24 <= len(data):
+            # Common case: all six words in one unpack
+            d_num, d_den, m_num, m_den, s_num, s_den = \
+                _RATIONAL3[endian].unpack_from(data, offset)
+            return [
+                d_num / d_den if d_den else 0.0,
+                m_num / m_den if m_den else 0.0,
+                s_num / s_den if s_den else 0.0,
+            ]
+        rational = _RATIONAL[endian]
         values = []
         for i in range(3):
             pos = offset + i * 8
             if pos + 8 > len(data):
                 values.append(0.0)
                 continue
-            num = struct.unpack(f"{endian}I", data[pos:pos + 4])[0]
-            den = struct.unpack(f"{endian}I", data[pos + 4:pos + 8])[0]
+            num, den = rational.unpack_from(data, pos)
             values.append(num / den if den else 0.0)
         return values
 
     def _try_pillow_extraction(self, path: Path, record: PhotoRecord):
         """Try Pillow for enhanced metadata extraction (optional dependency)."""
         try:
-            from PIL import Image
-            from PIL.ExifTags import TAGS, GPSTAGS
-
-            img = Image.open(str(path))
-            exif_data = img.getexif()
+            # Only the EXIF block is needed; close the file straight away
+            with Image.open(path) as img:
+                exif_data = img.getexif()
 
             if not exif_data:
                 return
@@ -326,14 +478,13 @@ class PhotoAnalyzer:
                 if lat and lon:
                     lat_deg = float(lat[0]) + float(lat[1]) / 60 + float(lat[2]) / 3600
                     lon_deg = float(lon[0]) + float(lon[1]) / 60 + float(lon[2]) / 3600
-                    if lat_ref == "S":
-                        lat_deg = -lat_deg
-                    if lon_ref == "W":
-                        lon_deg = -lon_deg
-                    record.gps_lat = round(lat_deg, 6)
-                    record.gps_lon = round(lon_deg, 6)
-
-        except ImportError:
-            pass  # Pillow not installed — that's fine
+                    record.gps_lat = round(lat_deg * _GPS_SIGN.get(lat_ref, 1.0), 6)
+                    record.gps_lon = round(lon_deg * _GPS_SIGN.get(lon_ref, 1.0), 6)
+
         except Exception:
             logger.debug("Pillow extraction failed for: %s", path)
+
+
+def _analyze_in_worker(path: str, stat: os.stat_result = None) -> PhotoRecord:
+    """Process-pool entry point (must be picklable, so module level)."""
+    return PhotoAnalyzer().analyze(path, stat)
@@ -15,13 +15,18 @@ or partially auto-populated from photo analysis. Once complete,
 it drives configuration generation (io_map, setpoints, alarms).
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
-import json
 import time
 from pathlib import Path
 
+from plc.fleet.jsonio import (
+    dumps_json, loads_json, write_json, write_json_many,
+    read_packed, write_packed,
+)
+
 
 class UnitStatus(Enum):
     INTAKE = "intake"              # Gathering information
@@ -38,7 +43,19 @@ class PipeSize(Enum):
     SIX_INCH = 6.0
 
 
-@dataclass
+_VALID_PIPE_SIZES = frozenset(p.value for p in PipeSize)
+
+# (ComponentSelection attribute, message when it is empty)
+_REQUIRED_COMPONENTS = (
+    ("meter_key", "No meter selected"),
+    ("pump_key", "No pump selected"),
+    ("divert_valve_key", "No divert valve selected"),
+    ("bsw_probe_key", "No BS&W probe selected"),
+    ("sampler_key", "No sampler selected"),
+)
+
+
+@dataclass(slots=True)
 class GeoLocation:
     """Physical location of the unit."""
     latitude: float = 0.0
@@ -50,7 +67,7 @@ class GeoLocation:
     well_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricalConfig:
     """Electrical system configuration."""
     main_power: str = "480VAC_3PH"
@@ -65,7 +82,7 @@ class ElectricalConfig:
     has_ups: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoRecord:
     """Metadata about a unit photo used during intake."""
     file_path: str = ""
@@ -82,11 +99,14 @@ class PhotoRecord:
         return self.gps_lat != 0.0 or self.gps_lon != 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComponentSelection:
     """
     Selected components for a unit. Keys reference
     the component library (components.py catalogs).
+
+    Immutable and hashable so it can key configuration caches;
+    replace the whole selection to change components.
     """
     meter_key: str = ""
     pump_key: str = ""
@@ -102,9 +122,29 @@ class ComponentSelection:
     has_test_thermowell: bool = True
     num_backpressure_valves: int = 2  # sales + divert lines
     num_pressure_transmitters: int = 3  # inlet, loop, outlet
+    # Built once in __post_init__; slots leave no room for cached_property
+    _sig: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_sig", (
+            self.meter_key, self.pump_key, self.divert_valve_key,
+            self.bsw_probe_key, self.sampler_key, self.prover_key,
+            self.has_strainer, self.strainer_mesh,
+            self.has_air_eliminator, self.has_static_mixer,
+            self.has_test_thermowell, self.num_backpressure_valves,
+            self.num_pressure_transmitters,
+        ))
 
+    @property
+    def signature_tuple(self) -> tuple:
+        """Canonical tuple of every field, in declaration order."""
+        return self._sig
+
+    def __hash__(self) -> int:
+        return hash(self._sig)
 
-@dataclass
+
+@dataclass(slots=True)
 class UnitProfile:
     """
     Complete profile of a LACT unit — everything needed to
@@ -152,122 +192,93 @@ class UnitProfile:
     def save(self, path: str = None):
         """Persist unit profile to JSON."""
         filepath = Path(path or f"config/units/{self.unit_id}.json")
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(filepath.parent)
         self.updated_at = time.time()
-        filepath.write_text(json.dumps(self._to_dict(), indent=2))
+        # The dataclass is encoded directly; no intermediate dict
+        try:
+            write_json(filepath, self)
+        except FileNotFoundError:
+            # Directory removed since it was cached; recreate and retry
+            _KNOWN_DIRS.discard(filepath.parent)
+            _ensure_dir(filepath.parent)
+            write_json(filepath, self)
+
+    @classmethod
+    def save_many(cls, profiles, directory: str):
+        """
+        Persist several profiles as <unit_id>.json in one directory,
+        with a single sync for the whole batch instead of one per file.
+        """
+        dirpath = Path(directory)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        items = []
+        for profile in profiles:
+            profile.updated_at = now
+            items.append((dirpath / f"{profile.unit_id}.json", profile))
+        write_json_many(items)
 
     @classmethod
     def load(cls, path: str) -> "UnitProfile":
         """Load unit profile from JSON."""
-        data = json.loads(Path(path).read_text())
-        return cls._from_dict(data)
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def to_bytes(self) -> bytes:
+        """The JSON document save() writes, without touching disk."""
+        return dumps_json(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "UnitProfile":
+        """Parse a JSON document produced by to_bytes() or save()."""
+        return cls._from_dict(loads_json(data))
+
+    def save_binary(self, path: str):
+        """
+        Persist a packed machine-only snapshot (msgpack when installed).
+        Use save() for profiles people edit by hand.
+        """
+        filepath = Path(path)
+        _ensure_dir(filepath.parent)
+        self.updated_at = time.time()
+        write_packed(filepath, self._to_dict())
+
+    @classmethod
+    def load_binary(cls, path: str) -> "UnitProfile":
+        """Load a snapshot written by save_binary()."""
+        return cls._from_dict(read_packed(path))
 
     def _to_dict(self) -> dict:
         """Serialize to dict."""
-        return {
-            "unit_id": self.unit_id,
-            "serial_number": self.serial_number,
-            "manufacturer": self.manufacturer,
-            "model": self.model,
-            "pipe_size": self.pipe_size,
-            "year_built": self.year_built,
-            "source": self.source,
-            "source_listing_url": self.source_listing_url,
-            "purchase_date": self.purchase_date,
-            "notes": self.notes,
-            "status": self.status.value,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "location": {
-                "latitude": self.location.latitude,
-                "longitude": self.location.longitude,
-                "address": self.location.address,
-                "county": self.location.county,
-                "state": self.location.state,
-                "lease_name": self.location.lease_name,
-                "well_id": self.location.well_id,
-            },
-            "components": {
-                "meter_key": self.components.meter_key,
-                "pump_key": self.components.pump_key,
-                "divert_valve_key": self.components.divert_valve_key,
-                "bsw_probe_key": self.components.bsw_probe_key,
-                "sampler_key": self.components.sampler_key,
-                "prover_key": self.components.prover_key,
-                "has_strainer": self.components.has_strainer,
-                "strainer_mesh": self.components.strainer_mesh,
-                "has_air_eliminator": self.components.has_air_eliminator,
-                "has_static_mixer": self.components.has_static_mixer,
-                "has_test_thermowell": self.components.has_test_thermowell,
-                "num_backpressure_valves": self.components.num_backpressure_valves,
-                "num_pressure_transmitters": self.components.num_pressure_transmitters,
-            },
-            "electrical": {
-                "main_power": self.electrical.main_power,
-                "control_power": self.electrical.control_power,
-                "io_bus": self.electrical.io_bus,
-                "io_bus_address": self.electrical.io_bus_address,
-                "di_module_channels": self.electrical.di_module_channels,
-                "do_module_channels": self.electrical.do_module_channels,
-                "ai_module_channels": self.electrical.ai_module_channels,
-                "ao_module_channels": self.electrical.ao_module_channels,
-                "has_pulse_counter": self.electrical.has_pulse_counter,
-                "has_ups": self.electrical.has_ups,
-            },
-            "photos": [
-                {
-                    "file_path": p.file_path,
-                    "timestamp": p.timestamp,
-                    "description": p.description,
-                    "gps_lat": p.gps_lat,
-                    "gps_lon": p.gps_lon,
-                    "camera_model": p.camera_model,
-                    "tags": p.tags,
-                } for p in self.photos
-            ],
-            "setpoint_overrides": self.setpoint_overrides,
-            "custom_di": self.custom_di,
-            "custom_do": self.custom_do,
-            "custom_ai": self.custom_ai,
-        }
+        data = dict(zip(_PROFILE_SCALARS, _get_profile_scalars(self)))
+        data["status"] = self.status.value
+        data["location"] = _fields_dict(self.location)
+        data["components"] = _fields_dict(self.components)
+        data["electrical"] = _fields_dict(self.electrical)
+        names, getter = _FIELD_GETTERS[PhotoRecord]
+        data["photos"] = [dict(zip(names, getter(p))) for p in self.photos]
+        return data
 
     @classmethod
     def _from_dict(cls, data: dict) -> "UnitProfile":
         """Deserialize from dict."""
-        profile = cls()
-        for key in ("unit_id", "serial_number", "manufacturer", "model",
-                     "pipe_size", "year_built", "source", "source_listing_url",
-                     "purchase_date", "notes", "created_at", "updated_at"):
-            if key in data:
-                setattr(profile, key, data[key])
+        kwargs = {key: data[key] for key in _PROFILE_SCALARS if key in data}
 
         if "status" in data:
-            profile.status = UnitStatus(data["status"])
+            kwargs["status"] = UnitStatus(data["status"])
 
         if "location" in data:
-            loc = data["location"]
-            profile.location = GeoLocation(**loc)
+            kwargs["location"] = GeoLocation(**data["location"])
 
         if "components" in data:
-            comp = data["components"]
-            profile.components = ComponentSelection(**comp)
+            kwargs["components"] = ComponentSelection(**data["components"])
 
         if "electrical" in data:
-            elec = data["electrical"]
-            profile.electrical = ElectricalConfig(**elec)
+            kwargs["electrical"] = ElectricalConfig(**data["electrical"])
 
         if "photos" in data:
-            profile.photos = [
-                PhotoRecord(**p) for p in data["photos"]
-            ]
+            kwargs["photos"] = [PhotoRecord(**p) for p in data["photos"]]
 
-        if "setpoint_overrides" in data:
-            profile.setpoint_overrides = data["setpoint_overrides"]
-        for key in ("custom_di", "custom_do", "custom_ai"):
-            if key in data:
-                setattr(profile, key, data[key])
-
-        return profile
+        return cls(**kwargs)
 
     def validate(self) -> list:
         """
@@ -278,16 +289,52 @@ class UnitProfile:
         issues = []
         if not self.unit_id:
             issues.append("unit_id is required")
-        if not self.components.meter_key:
-            issues.append("No meter selected")
-        if not self.components.pump_key:
-            issues.append("No pump selected")
-        if not self.components.divert_valve_key:
-            issues.append("No divert valve selected")
-        if not self.components.bsw_probe_key:
-            issues.append("No BS&W probe selected")
-        if not self.components.sampler_key:
-            issues.append("No sampler selected")
-        if self.pipe_size not in (2.0, 3.0, 4.0, 6.0):
+        comp = self.components
+        issues.extend(
+            message for attr, message in _REQUIRED_COMPONENTS
+            if not getattr(comp, attr)
+        )
+        if self.pipe_size not in _VALID_PIPE_SIZES:
             issues.append(f"Unusual pipe size: {self.pipe_size}")
         return issues
+
+
+# ── Serialization Tables ─────────────────────────────────────
+
+# Directories save() has already created this process
+_KNOWN_DIRS: set = set()
+
+
+def _ensure_dir(directory: Path):
+    if directory not in _KNOWN_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(directory)
+
+
+def _field_getter(cls) -> tuple:
+    """(field names, attrgetter returning their values as a tuple)."""
+    names = tuple(f.name for f in fields(cls) if f.init)
+    return names, attrgetter(*names)
+
+
+_FIELD_GETTERS = {
+    cls: _field_getter(cls)
+    for cls in (GeoLocation, ComponentSelection, ElectricalConfig, PhotoRecord)
+}
+
+# UnitProfile fields that are converted to and from nested records
+_PROFILE_SECTIONS = frozenset(
+    ("status", "location", "components", "electrical", "photos")
+)
+
+# Every other top-level UnitProfile field is stored as-is
+_PROFILE_SCALARS = tuple(
+    f.name for f in fields(UnitProfile) if f.name not in _PROFILE_SECTIONS
+)
+_get_profile_scalars = attrgetter(*_PROFILE_SCALARS)
+
+
+def _fields_dict(obj) -> dict:
+    """Flat dict of a nested profile dataclass's fields."""
+    names, getter = _FIELD_GETTERS[type(obj)]
+    return dict(zip(names, getter(obj)))
@@ -1,11 +1,17 @@
-from plc.modules.flow_measurement import FlowMeasurement
-from plc.modules.bsw_monitor import BSWMonitor
-from plc.modules.sampler import Sampler
-from plc.modules.divert_valve import DivertValve
-from plc.modules.pump_control import PumpControl
-from plc.modules.proving import ProvingManager
-from plc.modules.pressure_monitor import PressureMonitor
-from plc.modules.temperature import TemperatureMonitor
+import importlib
+
+# Process modules are imported on first access (PEP 562), so
+# importing one module doesn't pull in all the others
+_LAZY = {
+    "FlowMeasurement": "plc.modules.flow_measurement",
+    "BSWMonitor": "plc.modules.bsw_monitor",
+    "Sampler": "plc.modules.sampler",
+    "DivertValve": "plc.modules.divert_valve",
+    "PumpControl": "plc.modules.pump_control",
+    "ProvingManager": "plc.modules.proving",
+    "PressureMonitor": "plc.modules.pressure_monitor",
+    "TemperatureMonitor": "plc.modules.temperature",
+}
 
 __all__ = [
     "FlowMeasurement",
@@ -17,3 +23,15 @@ __all__ = [
     "PressureMonitor",
     "TemperatureMonitor",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,14 +9,19 @@ exceeds the divert setpoint, flow is diverted away from the
 sales line to protect custody transfer accuracy.
 """
 
-import time
 import logging
+import statistics
+from collections import deque
 
-from plc.core.data_store import DataStore
+from plc.core import clock
+from plc.core.data_store import DataStore, QUALITY_BAD
 from plc.config.setpoints import Setpoints
 
 logger = logging.getLogger(__name__)
 
+# Scans between exact recomputations of the rolling sum
+RESUM_INTERVAL_SCANS = 1000
+
 
 class BSWMonitor:
     """
@@ -29,40 +34,67 @@ class BSWMonitor:
     def __init__(self, data_store: DataStore, setpoints: Setpoints):
         self.ds = data_store
         self.sp = setpoints
-        self._readings: list[float] = []
         self._max_history = 10  # Rolling average window
+        self._readings: deque = deque(maxlen=self._max_history)
+        self._sum = 0.0
+        self._scans_since_resum = 0
         self._divert_timer_start: float = 0.0
         self._divert_pending = False
 
-    def execute(self):
-        """Process BS&W probe reading for this scan cycle."""
+    def execute(self, now: float = None):
+        """
+        Process BS&W probe reading for this scan cycle. ``now`` is a
+        ``clock.monotonic()`` reading for the divert debounce timer.
+        """
         raw_bsw = self.ds.read("AI_BSW_PROBE")
 
         # Validate signal range (0-5% for this probe)
         if raw_bsw < -0.1 or raw_bsw > 5.5:
-            self.ds.write("AI_BSW_PROBE", raw_bsw, quality="BAD")
+            self.ds.write("AI_BSW_PROBE", raw_bsw, quality=QUALITY_BAD)
             self.ds.write("BSW_PCT", raw_bsw)
             return
 
-        # Rolling average for noise rejection
+        # Rolling average for noise rejection, kept as a running sum
+        if len(self._readings) == self._max_history:
+            self._sum -= self._readings[0]
         self._readings.append(raw_bsw)
-        if len(self._readings) > self._max_history:
-            self._readings.pop(0)
+        self._sum += raw_bsw
+        self._scans_since_resum += 1
+        if self._scans_since_resum >= RESUM_INTERVAL_SCANS:
+            # Re-add from scratch now and then so float error can't build up
+            self._sum = sum(self._readings)
+            self._scans_since_resum = 0
 
-        avg_bsw = sum(self._readings) / len(self._readings)
+        avg_bsw = self._sum / len(self._readings)
         self.ds.write("BSW_PCT", round(avg_bsw, 3))
 
         # Divert logic with debounce timer
         if avg_bsw >= self.sp.bsw_divert_pct:
+            if now is None:
+                now = clock.monotonic()
             if not self._divert_pending:
                 self._divert_pending = True
-                self._divert_timer_start = time.time()
-            elif (time.time() - self._divert_timer_start) >= self.sp.bsw_divert_delay_sec:
+                self._divert_timer_start = now
+            elif (now - self._divert_timer_start) >= self.sp.bsw_divert_delay_sec:
                 self.ds.write("DIVERT_REASON", f"BS&W {avg_bsw:.2f}%")
         else:
             self._divert_pending = False
 
+    @property
+    def history(self) -> tuple:
+        """Readings in the averaging window, oldest first."""
+        return tuple(self._readings)
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation of the window (probe noise)."""
+        if len(self._readings) < 2:
+            return 0.0
+        return statistics.pstdev(self._readings)
+
     def reset(self):
         """Clear the rolling average history."""
         self._readings.clear()
+        self._sum = 0.0
+        self._scans_since_resum = 0
         self._divert_pending = False
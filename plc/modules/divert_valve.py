@@ -13,14 +13,29 @@ Safety behavior:
   - Travel timeout monitoring for stuck valve detection
 """
 
-import time
 import logging
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
 
 logger = logging.getLogger(__name__)
 
+# Order matches the tuple returned by _read_feedback()
+_VALVE_TAGS = ("DO_DIVERT_CMD", "DI_DIVERT_SALES", "DI_DIVERT_DIVERT")
+
+# Reported position, indexed by cmd << 2 | at_divert << 1 | at_sales
+_POSITIONS = (
+    "TRANSIT_TO_SALES",   # 000  commanded to sales, no limit made
+    "SALES",              # 001
+    "TRANSIT_TO_SALES",   # 010  still on the divert limit
+    "FAULT_BOTH_LIMITS",  # 011
+    "TRANSIT_TO_DIVERT",  # 100  commanded to divert, no limit made
+    "TRANSIT_TO_DIVERT",  # 101  still on the sales limit
+    "DIVERT",             # 110
+    "FAULT_BOTH_LIMITS",  # 111
+)
+
 
 class DivertValve:
     """
@@ -35,47 +50,53 @@ class DivertValve:
         self.sp = setpoints
         self._last_cmd = None
         self._cmd_change_time = 0.0
-
-    def execute(self):
-        """Monitor divert valve status each scan cycle."""
-        cmd = self.ds.read("DO_DIVERT_CMD")
-        at_sales = self.ds.read("DI_DIVERT_SALES")
-        at_divert = self.ds.read("DI_DIVERT_DIVERT")
+        self._last_position = None
+        self._feedback_handles = tuple(
+            data_store.key_handle(tag) for tag in _VALVE_TAGS
+        )
+
+    def execute(self, now: float = None):
+        """
+        Monitor divert valve status each scan cycle. ``now`` is a
+        ``clock.monotonic()`` reading for the travel timer.
+        """
+        cmd, at_sales, at_divert = self._read_feedback()
 
         # Track command changes for timeout monitoring
         if cmd != self._last_cmd:
-            self._cmd_change_time = time.time()
+            self._cmd_change_time = clock.monotonic() if now is None else now
             self._last_cmd = cmd
 
-        # Determine valve state
-        if cmd:
-            # Commanded to DIVERT
-            expected_pos = at_divert
-            position = "DIVERT" if at_divert else "TRANSIT_TO_DIVERT"
-        else:
-            # Commanded to SALES
-            expected_pos = at_sales
-            position = "SALES" if at_sales else "TRANSIT_TO_SALES"
-
-        # Check for conflicting position feedback
-        if at_sales and at_divert:
-            position = "FAULT_BOTH_LIMITS"
-            logger.error("Divert valve fault: both limit switches active")
+        # Determine valve state from (command, divert limit, sales limit)
+        position = _POSITIONS[
+            (bool(cmd) << 2) | (bool(at_divert) << 1) | bool(at_sales)
+        ]
+        if position != self._last_position:
+            # Log the fault once on entry, not on every scan it persists
+            if position == "FAULT_BOTH_LIMITS":
+                logger.error("Divert valve fault: both limit switches active")
+            self._last_position = position
 
         self.ds.write("DIVERT_VALVE_POS", position)
 
+    def _read_feedback(self) -> tuple:
+        """(command, at-sales limit, at-divert limit) in one store read."""
+        return self.ds.read_handles(self._feedback_handles)
+
     @property
     def is_at_sales(self) -> bool:
-        return self.ds.read("DI_DIVERT_SALES") and not self.ds.read("DO_DIVERT_CMD")
+        cmd, at_sales, _ = self._read_feedback()
+        return at_sales and not cmd
 
     @property
     def is_at_divert(self) -> bool:
-        return self.ds.read("DI_DIVERT_DIVERT") and self.ds.read("DO_DIVERT_CMD")
+        cmd, _, at_divert = self._read_feedback()
+        return at_divert and cmd
 
     @property
     def is_in_transit(self) -> bool:
-        cmd = self.ds.read("DO_DIVERT_CMD")
+        cmd, at_sales, at_divert = self._read_feedback()
         if cmd:
-            return not self.ds.read("DI_DIVERT_DIVERT")
+            return not at_divert
         else:
-            return not self.ds.read("DI_DIVERT_SALES")
+            return not at_sales
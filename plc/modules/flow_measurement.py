@@ -12,14 +12,47 @@ The meter has a VR Truck loading counter head for local display
 and generates pulses proportional to throughput volume.
 """
 
-import time
 import logging
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
 
 logger = logging.getLogger(__name__)
 
+# Tags read together at the start of each flow calculation (order
+# matches the unpack in execute())
+_FLOW_INPUT_TAGS = ("PI_METER_PULSE", "METER_FACTOR", "CTL_FACTOR")
+
+# Tags written at the end of each flow calculation, in that order
+_FLOW_OUTPUT_TAGS = (
+    "FLOW_RATE_BPH", "FLOW_TOTAL_BBL", "FLOW_NET_BBL",
+    "BATCH_GROSS_BBL", "BATCH_NET_BBL",
+)
+
+
+def _flow_core(current_pulses: int, last_pulses: int, delta_time: float,
+               k_factor: float, flow_rate_bph: float) -> tuple:
+    """
+    Pulse arithmetic for one scan: returns (gross barrels since the
+    last scan, updated flow rate in BPH). Plain scalars in and out.
+    """
+    delta_pulses = current_pulses - last_pulses
+    if delta_pulses < 0:
+        # Counter rollover
+        delta_pulses = current_pulses
+
+    # Gross volume increment
+    delta_bbl = delta_pulses / k_factor if k_factor > 0 else 0.0
+
+    # Instantaneous flow rate (barrels per hour)
+    if delta_time > 0 and delta_pulses > 0:
+        flow_rate_bph = delta_bbl / delta_time * 3600.0
+    elif delta_time > 2.0:
+        # No pulses for 2 seconds - decay flow rate
+        flow_rate_bph = 0.0
+    return delta_bbl, flow_rate_bph
+
 
 class FlowMeasurement:
     """
@@ -34,58 +67,53 @@ class FlowMeasurement:
         self.ds = data_store
         self.sp = setpoints
         self._last_pulse_count = 0
-        self._last_pulse_time = time.time()
+        # Rate intervals come from the monotonic clock so a wall-clock
+        # step (NTP, operator setting the time) cannot skew the BPH.
+        self._last_pulse_time = clock.monotonic()
         self._flow_rate_bph = 0.0
         self._gross_total_bbl = 0.0
+        self._handles = tuple(
+            data_store.key_handle(tag) for tag in _FLOW_INPUT_TAGS
+        )
+        self._out_handles = tuple(
+            data_store.key_handle(tag) for tag in _FLOW_OUTPUT_TAGS
+        )
+
+    def execute(self, now: float = None):
+        """
+        Run flow calculation for this scan cycle.
+
+        ``now`` is a ``clock.monotonic()`` reading; it is not the
+        controller's wall-clock scan timestamp.
+        """
+        current_pulses, meter_factor, ctl = self.ds.read_handles(self._handles)
+        current_pulses = current_pulses or 0
+        if now is None:
+            now = clock.monotonic()
 
-    def execute(self):
-        """Run flow calculation for this scan cycle."""
-        current_pulses = self.ds.read("PI_METER_PULSE")
-        now = time.time()
-
-        # Calculate delta pulses since last scan
-        delta_pulses = current_pulses - self._last_pulse_count
         delta_time = now - self._last_pulse_time
-
-        if delta_pulses < 0:
-            # Counter rollover
-            delta_pulses = current_pulses
-
         if delta_time <= 0:
             delta_time = self.sp.scan_rate_ms / 1000.0
 
-        # Gross volume increment
-        k_factor = self.sp.meter_k_factor
-        if k_factor > 0:
-            delta_bbl = delta_pulses / k_factor
-        else:
-            delta_bbl = 0.0
-
-        # Instantaneous flow rate (barrels per hour)
-        if delta_time > 0 and delta_pulses > 0:
-            bbl_per_sec = delta_bbl / delta_time
-            self._flow_rate_bph = bbl_per_sec * 3600.0
-        elif delta_time > 2.0:
-            # No pulses for 2 seconds - decay flow rate
-            self._flow_rate_bph = 0.0
+        delta_bbl, self._flow_rate_bph = _flow_core(
+            current_pulses, self._last_pulse_count, delta_time,
+            self.sp.meter_k_factor, self._flow_rate_bph,
+        )
 
         # Accumulate gross total
         self._gross_total_bbl += delta_bbl
 
         # Apply meter factor
-        meter_factor = self.ds.read("METER_FACTOR") or 1.0
-        corrected_gross = self._gross_total_bbl * meter_factor
+        corrected_gross = self._gross_total_bbl * (meter_factor or 1.0)
 
         # Temperature correction (CTL)
-        ctl = self.ds.read("CTL_FACTOR") or 1.0
-        net_bbl = corrected_gross * ctl
-
-        # Write results
-        self.ds.write("FLOW_RATE_BPH", round(self._flow_rate_bph, 2))
-        self.ds.write("FLOW_TOTAL_BBL", round(self._gross_total_bbl, 4))
-        self.ds.write("FLOW_NET_BBL", round(net_bbl, 4))
-        self.ds.write("BATCH_GROSS_BBL", round(corrected_gross, 4))
-        self.ds.write("BATCH_NET_BBL", round(net_bbl, 4))
+        net_bbl = corrected_gross * (ctl or 1.0)
+
+        # Write results at full precision; displays round on read
+        self.ds.write_handles(self._out_handles, (
+            self._flow_rate_bph, self._gross_total_bbl, net_bbl,
+            corrected_gross, net_bbl,
+        ))
 
         self._last_pulse_count = current_pulses
         self._last_pulse_time = now
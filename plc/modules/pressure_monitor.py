@@ -31,12 +31,18 @@ class PressureMonitor:
     def __init__(self, data_store: DataStore, setpoints: Setpoints):
         self.ds = data_store
         self.sp = setpoints
-
-    def execute(self):
-        """Process pressure readings for this scan cycle."""
-        # Write backpressure valve setpoints
-        self.ds.write("AO_BP_SALES_SP", self.sp.backpressure_sales_psi)
-        self.ds.write("AO_BP_DIVERT_SP", self.sp.backpressure_divert_psi)
+        self._last_bp_setpoints = None  # (sales, divert) last written
+
+    def execute(self, now: float = None):
+        """Process pressure readings for this scan cycle (now is unused)."""
+        # Write backpressure valve setpoints, only when they change
+        bp_setpoints = (self.sp.backpressure_sales_psi, self.sp.backpressure_divert_psi)
+        if bp_setpoints != self._last_bp_setpoints:
+            self.ds.write_multiple({
+                "AO_BP_SALES_SP": bp_setpoints[0],
+                "AO_BP_DIVERT_SP": bp_setpoints[1],
+            })
+            self._last_bp_setpoints = bp_setpoints
 
     @property
     def inlet_pressure(self) -> float:
@@ -18,8 +18,12 @@ Proving procedure follows API MPMS Chapter 4 requirements:
 
 import time
 import logging
+from array import array
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from enum import Enum
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
 
@@ -35,16 +39,20 @@ class ProvingState(Enum):
     FAILED = "FAILED"
 
 
+@dataclass(slots=True)
 class ProvingRun:
     """Data from a single proving run."""
-    def __init__(self):
-        self.start_time: float = 0.0
-        self.end_time: float = 0.0
-        self.meter_pulses: int = 0
-        self.prover_volume_bbl: float = 0.0
-        self.temperature_f: float = 60.0
-        self.pressure_psi: float = 0.0
-        self.meter_factor: float = 0.0
+    start_time: float = 0.0
+    end_time: float = 0.0
+    meter_pulses: int = 0
+    prover_volume_bbl: float = 0.0
+    temperature_f: float = 60.0
+    pressure_psi: float = 0.0
+    meter_factor: float = 0.0
+
+
+_RUN_FIELDS = tuple(f.name for f in fields(ProvingRun))
+_get_run_fields = attrgetter(*_RUN_FIELDS)
 
 
 class ProvingManager:
@@ -63,57 +71,69 @@ class ProvingManager:
         self.runs: list[ProvingRun] = []
         self.current_run: ProvingRun = None
         self._state_entry_time = 0.0
+        self._run_start = 0.0  # clock.monotonic() at the current run's start
         self.result_meter_factor: float = 0.0
         self.result_repeatability: float = 0.0
+        self._handlers = {
+            ProvingState.IDLE: self._handle_idle,
+            ProvingState.SETUP: self._handle_setup,
+            ProvingState.RUNNING: self._handle_running,
+            ProvingState.CALCULATING: self._handle_calculating,
+            ProvingState.COMPLETE: self._handle_complete,
+            ProvingState.FAILED: self._handle_failed,
+        }
 
     def start_proving(self):
         """Initiate a proving sequence."""
-        self.state = ProvingState.SETUP
-        self._state_entry_time = time.time()
+        self._set_state(ProvingState.SETUP)
         self.runs.clear()
         self.current_run = None
         logger.info("Proving sequence initiated")
 
-    def execute(self):
-        """Execute proving logic for this scan cycle."""
-        handler = {
-            ProvingState.IDLE: self._handle_idle,
-            ProvingState.SETUP: self._handle_setup,
-            ProvingState.RUNNING: self._handle_running,
-            ProvingState.CALCULATING: self._handle_calculating,
-            ProvingState.COMPLETE: self._handle_complete,
-            ProvingState.FAILED: self._handle_failed,
-        }.get(self.state)
+    def _set_state(self, state: ProvingState):
+        """Enter a proving state and restart its timer."""
+        self.state = state
+        self._state_entry_time = clock.monotonic()
+
+    def execute(self, now: float = None):
+        """
+        Execute proving logic for this scan cycle.
+
+        ``now`` is a ``clock.monotonic()`` reading used to time runs;
+        the stamps stored in each ProvingRun are wall-clock.
+        """
+        handler = self._handlers.get(self.state)
 
         if handler:
-            handler()
+            handler(clock.monotonic() if now is None else now)
 
-    def _handle_idle(self):
+    def _handle_idle(self, now: float):
         pass
 
-    def _handle_setup(self):
+    def _handle_setup(self, now: float):
         """Open prover DBB valve and prepare for first run."""
         self.ds.write("DO_PROVER_VLV_CMD", True)
 
         # Wait for valve confirmation
         if self.ds.read("DI_PROVER_VLV_OPEN"):
-            self._start_run()
-        elif (time.time() - self._state_entry_time) > 30.0:
+            self._start_run(now)
+        elif (clock.monotonic() - self._state_entry_time) > 30.0:
             logger.error("Proving aborted: prover valve timeout")
-            self.state = ProvingState.FAILED
+            self._set_state(ProvingState.FAILED)
             self.ds.write("DO_PROVER_VLV_CMD", False)
 
-    def _start_run(self):
+    def _start_run(self, now: float):
         """Begin a single proving run."""
         self.current_run = ProvingRun()
         self.current_run.start_time = time.time()
+        self._run_start = now
         self.current_run.meter_pulses = self.ds.read("PI_METER_PULSE")
         self.current_run.temperature_f = self.ds.read("AI_METER_TEMP")
         self.current_run.pressure_psi = self.ds.read("AI_OUTLET_PRESS")
-        self.state = ProvingState.RUNNING
+        self._set_state(ProvingState.RUNNING)
         logger.info("Proving run %d started", len(self.runs) + 1)
 
-    def _handle_running(self):
+    def _handle_running(self, now: float):
         """
         Accumulate pulses during a proving run.
 
@@ -123,11 +143,11 @@ class ProvingManager:
         """
         # Simulated run completion after 60 seconds
         # In production, this would be triggered by prover detector switches
-        elapsed = time.time() - self.current_run.start_time
+        elapsed = now - self._run_start
         if elapsed >= 60.0:
-            self._end_run()
+            self._end_run(now)
 
-    def _end_run(self):
+    def _end_run(self, now: float):
         """Complete a proving run and record results."""
         run = self.current_run
         run.end_time = time.time()
@@ -154,18 +174,18 @@ class ProvingManager:
 
         # Check if we have enough runs
         if len(self.runs) >= self.sp.prove_num_runs:
-            self.state = ProvingState.CALCULATING
+            self._set_state(ProvingState.CALCULATING)
         else:
-            self._start_run()
+            self._start_run(now)
 
-    def _handle_calculating(self):
+    def _handle_calculating(self, now: float):
         """Validate repeatability and compute final meter factor."""
-        meter_factors = [r.meter_factor for r in self.runs]
-
-        if not meter_factors:
-            self.state = ProvingState.FAILED
+        if not self.runs:
+            self._set_state(ProvingState.FAILED)
             return
 
+        # Builtin sum/min/max run in C over the flat float column
+        meter_factors = self._meter_factor_column()
         avg_mf = sum(meter_factors) / len(meter_factors)
         mf_range = max(meter_factors) - min(meter_factors)
         repeatability = (mf_range / avg_mf) * 100.0 if avg_mf else 0.0
@@ -182,26 +202,45 @@ class ProvingManager:
         if repeatability > self.sp.prove_repeatability_pct:
             logger.warning("Proving FAILED: repeatability %.4f%% > %.4f%%",
                           repeatability, self.sp.prove_repeatability_pct)
-            self.state = ProvingState.FAILED
+            self._set_state(ProvingState.FAILED)
             return
 
         if not (self.sp.prove_meter_factor_min <= avg_mf <= self.sp.prove_meter_factor_max):
             logger.warning("Proving FAILED: MF %.4f outside range [%.4f, %.4f]",
                           avg_mf, self.sp.prove_meter_factor_min,
                           self.sp.prove_meter_factor_max)
-            self.state = ProvingState.FAILED
+            self._set_state(ProvingState.FAILED)
             return
 
         # Apply new meter factor
         self.ds.write("METER_FACTOR", self.result_meter_factor)
-        self.state = ProvingState.COMPLETE
+        self._set_state(ProvingState.COMPLETE)
         logger.info("New meter factor applied: %.4f", self.result_meter_factor)
 
-    def _handle_complete(self):
+    def _meter_factor_column(self) -> array:
+        """
+        Meter factors of the recorded runs, built fresh on each call:
+        runs may be replaced or edited in place, and there are only a few.
+        """
+        return array("d", (r.meter_factor for r in self.runs))
+
+    def get_run_columns(self) -> dict:
+        """
+        Recorded runs as columns (field name -> array of doubles),
+        for trending and CSV export without walking run objects.
+        """
+        columns = {name: array("d") for name in _RUN_FIELDS}
+        appenders = [columns[name].append for name in _RUN_FIELDS]
+        for values in map(_get_run_fields, self.runs):
+            for append, value in zip(appenders, values):
+                append(value)
+        return columns
+
+    def _handle_complete(self, now: float):
         """Clean up after successful proving."""
         self.ds.write("DO_PROVER_VLV_CMD", False)
 
-    def _handle_failed(self):
+    def _handle_failed(self, now: float):
         """Clean up after failed proving."""
         self.ds.write("DO_PROVER_VLV_CMD", False)
 
@@ -16,13 +16,17 @@ static mixer, sampler, meter, and out to sales/divert.
 
 import time
 import logging
-from collections import deque
+from bisect import bisect_right
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
 
 logger = logging.getLogger(__name__)
 
+# Order matches the unpacking in PumpControl.execute()
+_PUMP_TAGS = ("DO_PUMP_START", "DI_PUMP_RUNNING", "DI_PUMP_OVERLOAD")
+
 
 class PumpControl:
     """
@@ -35,26 +39,34 @@ class PumpControl:
     def __init__(self, data_store: DataStore, setpoints: Setpoints):
         self.ds = data_store
         self.sp = setpoints
-        self._start_times: deque = deque(maxlen=20)
-        self._last_trip_time = 0.0
+        self._start_times: list = []  # Monotonic start times, ascending
+        self._last_trip_time = 0.0          # Wall clock, for display
+        self._last_trip_mono = float("-inf")  # Monotonic, for the lockout
         self._locked_out = False
+        self._handles = tuple(data_store.key_handle(tag) for tag in _PUMP_TAGS)
+        self._run_handle = self._handles[1]
+
+    def execute(self, now: float = None):
+        """
+        Monitor pump status each scan cycle. ``now`` is a
+        ``clock.monotonic()`` reading for the restart lockout.
+        """
+        pump_cmd, pump_run, pump_overload = self.ds.read_handles(self._handles)
 
-    def execute(self):
-        """Monitor pump status each scan cycle."""
-        pump_cmd = self.ds.read("DO_PUMP_START")
-        pump_run = self.ds.read("DI_PUMP_RUNNING")
-        pump_overload = self.ds.read("DI_PUMP_OVERLOAD")
+        if now is None:
+            now = clock.monotonic()
 
         # Track overload trips
         if pump_overload and pump_cmd:
             self._last_trip_time = time.time()
+            self._last_trip_mono = now
             self._locked_out = True
             self.ds.write("DO_PUMP_START", False)
             logger.warning("Pump tripped on overload")
 
-        # Enforce restart lockout
+        # Enforce restart lockout (immune to wall-clock steps)
         if self._locked_out:
-            elapsed = time.time() - self._last_trip_time
+            elapsed = now - self._last_trip_mono
             if elapsed < self.sp.pump_restart_lockout_sec:
                 self.ds.write("DO_PUMP_START", False)
                 return
@@ -69,12 +81,14 @@ class PumpControl:
 
     def record_start(self):
         """Record a pump start event for thermal tracking."""
-        now = time.time()
+        # Monotonic, so a wall-clock step cannot unsort the start list
+        now = clock.monotonic()
         self._start_times.append(now)
 
-        # Count starts in the last hour
-        one_hour_ago = now - 3600
-        recent_starts = sum(1 for t in self._start_times if t > one_hour_ago)
+        # Count starts in the last hour, dropping older ones
+        starts = self._start_times
+        del starts[:bisect_right(starts, now - 3600)]
+        recent_starts = len(starts)
 
         if recent_starts >= self.sp.pump_max_starts_per_hour:
             self._locked_out = True
@@ -86,7 +100,8 @@ class PumpControl:
 
     @property
     def is_running(self) -> bool:
-        return bool(self.ds.read("DI_PUMP_RUNNING"))
+        # A single attribute load needs no store lock
+        return bool(self._run_handle.value)
 
     @property
     def is_locked_out(self) -> bool:
@@ -94,6 +109,5 @@ class PumpControl:
 
     @property
     def starts_this_hour(self) -> int:
-        now = time.time()
-        one_hour_ago = now - 3600
-        return sum(1 for t in self._start_times if t > one_hour_ago)
+        starts = self._start_times
+        return len(starts) - bisect_right(starts, clock.monotonic() - 3600)
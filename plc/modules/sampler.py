@@ -16,15 +16,23 @@ Sampling follows API MPMS Chapter 8 requirements:
   - Minimum down-gradient of 1" per foot for gravitational flow
 """
 
-import time
+import math
 import logging
 
+from plc.core import clock
 from plc.core.data_store import DataStore
 from plc.core.state_machine import LACTState
 from plc.config.setpoints import Setpoints
 
 logger = logging.getLogger(__name__)
 
+# Sample pot mixing cycle: pump runs for sample_mix_time_sec
+# at the start of every interval
+MIX_INTERVAL_SEC = 300.0
+
+# Order matches the unpacking in Sampler.execute()
+_SAMPLER_TAGS = ("DI_SAMPLE_POT_HI", "FLOW_RATE_BPH")
+
 
 class Sampler:
     """
@@ -40,27 +48,47 @@ class Sampler:
         self.sp = setpoints
         self._last_grab_time = 0.0
         self._grab_count = 0
-        self._total_ml = 0.0
+        self._total_ul = 0  # Integer microlitres so the total stays exact
         self._solenoid_on_time = 0.0
         self._solenoid_active = False
         self._mix_running = False
+        self._next_mix_edge = 0.0
+        self._last_state = None
+        self._next_action_time = 0.0
+        self._handles = tuple(data_store.key_handle(tag) for tag in _SAMPLER_TAGS)
+        self._solenoid_handle = data_store.key_handle("DO_SAMPLE_SOL")
+
+    def execute(self, state: LACTState, now: float = None):
+        """
+        Run sampler logic for this scan cycle.
+
+        ``now`` is a ``clock.monotonic()`` reading: grab intervals,
+        pulse length and mixing edges must not move with the wall clock.
+        """
+        if now is None:
+            now = clock.monotonic()
+
+        # Steady state with no grab, pulse end or mixing edge due yet
+        if state == self._last_state and now < self._next_action_time:
+            return
+        self._last_state = state
+        self._next_action_time = 0.0
 
-    def execute(self, state: LACTState):
-        """Run sampler logic for this scan cycle."""
-        now = time.time()
-
-        # Only sample during RUNNING state (not during DIVERT)
+        # Only sample during RUNNING state (not during DIVERT); close
+        # the solenoid on entry and idle until the state changes again
         if state != LACTState.RUNNING:
             self._set_solenoid(False)
+            self._next_action_time = math.inf
             return
 
+        pot_full, flow_rate = self.ds.read_handles(self._handles)
+
         # Check if sample pot is full
-        if self.ds.read("DI_SAMPLE_POT_HI"):
+        if pot_full:
             self._set_solenoid(False)
             return
 
         # Flow-weighted grab timing
-        flow_rate = self.ds.read("FLOW_RATE_BPH")
         if flow_rate <= 0:
             return
 
@@ -82,6 +110,12 @@ class Sampler:
         # Run mixing pump periodically to keep sample homogeneous
         self._manage_mixing(now)
 
+        # While a pulse is open keep scanning so a full pot closes it
+        if not self._solenoid_active:
+            self._next_action_time = min(
+                self._last_grab_time + base_interval, self._next_mix_edge
+            )
+
     def _take_grab(self, now: float):
         """Actuate the sample solenoid for one grab."""
         self._set_solenoid(True)
@@ -89,32 +123,45 @@ class Sampler:
         self._solenoid_active = True
         self._last_grab_time = now
         self._grab_count += 1
-        self._total_ml += self.sp.sample_volume_ml
+        self._total_ul += round(self.sp.sample_volume_ml * 1000)
 
-        self.ds.write("SAMPLE_TOTAL_GRABS", self._grab_count)
-        self.ds.write("SAMPLE_TOTAL_ML", round(self._total_ml, 1))
+        self.ds.write_multiple({
+            "SAMPLE_TOTAL_GRABS": self._grab_count,
+            "SAMPLE_TOTAL_ML": self._total_ul / 1000,
+        })
 
     def _set_solenoid(self, on: bool):
         """Control the SS 3-way solenoid valve."""
-        self.ds.write("DO_SAMPLE_SOL", on)
+        # Write on edges only; compare against the live tag since the
+        # state machine also closes the solenoid on transitions
+        if self._solenoid_handle.value is not on:
+            self.ds.write("DO_SAMPLE_SOL", on)
         if not on:
             self._solenoid_active = False
 
     def _manage_mixing(self, now: float):
         """Run the sample pot mixing pump periodically."""
-        # Mix every 5 minutes for the configured duration
-        mix_interval = 300.0  # 5 minutes
-        cycle_pos = now % mix_interval
-        should_mix = cycle_pos < self.sp.sample_mix_time_sec
+        # Nothing changes between edges of the mixing cycle
+        if now < self._next_mix_edge:
+            return
+
+        cycle_start = now - now % MIX_INTERVAL_SEC
+        mix_off_at = cycle_start + self.sp.sample_mix_time_sec
+        should_mix = now < mix_off_at
 
         if should_mix != self._mix_running:
             self.ds.write("DO_SAMPLE_MIX_PUMP", should_mix)
             self._mix_running = should_mix
+        self._next_mix_edge = (
+            mix_off_at if should_mix else cycle_start + MIX_INTERVAL_SEC
+        )
 
     def reset_totals(self):
         """Reset sample totals for new batch."""
         self._grab_count = 0
-        self._total_ml = 0.0
-        self.ds.write("SAMPLE_TOTAL_GRABS", 0)
-        self.ds.write("SAMPLE_TOTAL_ML", 0.0)
+        self._total_ul = 0
+        self.ds.write_multiple({
+            "SAMPLE_TOTAL_GRABS": 0,
+            "SAMPLE_TOTAL_ML": 0.0,
+        })
         logger.info("Sample totals reset")
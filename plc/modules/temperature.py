@@ -26,6 +26,18 @@ _API_K0 = 341.0957
 _API_K1 = 0.0
 _API_K2 = 0.0
 
+# Simplified API 11.1 for light-medium crude
+# alpha_60 typically 0.00045 to 0.00065 per °F for crude
+_CTL_ALPHA_60 = 0.00046  # Approximate for ~35 API gravity crude
+
+# Order matches the unpacking in TemperatureMonitor.execute()
+_TEMP_TAGS = ("AI_METER_TEMP", "AI_TEST_THERMO")
+
+
+def _ctl_from_offset(dt: float) -> float:
+    """CTL for a temperature offset dt (°F) from base."""
+    return math.exp(-_CTL_ALPHA_60 * dt * (1.0 + 0.8 * _CTL_ALPHA_60 * dt))
+
 
 class TemperatureMonitor:
     """
@@ -39,19 +51,33 @@ class TemperatureMonitor:
     def __init__(self, data_store: DataStore, setpoints: Setpoints):
         self.ds = data_store
         self.sp = setpoints
+        self._last_ctl = None
+        self._last_temp = None
+        self._handles = tuple(data_store.key_handle(tag) for tag in _TEMP_TAGS)
 
-    def execute(self):
-        """Process temperature readings for this scan cycle."""
-        meter_temp = self.ds.read("AI_METER_TEMP")
-        test_temp = self.ds.read("AI_TEST_THERMO")
+    def execute(self, now: float = None):
+        """Process temperature readings for this scan cycle (now is unused)."""
+        meter_temp, test_temp = self.ds.read_handles(self._handles)
 
         # Use meter (TA probe) temperature as primary
         process_temp = meter_temp
 
         # Compute CTL factor
-        ctl = self._compute_ctl(process_temp)
-        self.ds.write("CTL_FACTOR", round(ctl, 6))
-        self.ds.write("TEMP_CORRECTED_F", round(process_temp, 1))
+        ctl = round(self._compute_ctl(process_temp), 6)
+        temp = round(process_temp, 1)
+
+        # Publish only what changed at the displayed resolution
+        changed = {}
+        if ctl != self._last_ctl:
+            changed["CTL_FACTOR"] = self._last_ctl = ctl
+        if temp != self._last_temp:
+            changed["TEMP_CORRECTED_F"] = self._last_temp = temp
+        if changed:
+            self.ds.write_multiple(changed)
+
+    def reprocess_history(self, temps) -> list:
+        """CTL for each of a series of observed temperatures (°F)."""
+        return list(map(self._compute_ctl, temps))
 
     def _compute_ctl(self, observed_temp_f: float) -> float:
         """
@@ -75,9 +101,7 @@ class TemperatureMonitor:
         if abs(dt) < 0.01:
             return 1.0
 
-        # Simplified API 11.1 for light-medium crude
-        # alpha_60 typically 0.00045 to 0.00065 per °F for crude
-        alpha_60 = 0.00046  # Approximate for ~35 API gravity crude
-
-        ctl = math.exp(-alpha_60 * dt * (1.0 + 0.8 * alpha_60 * dt))
+        # A single exp() call is cheaper in CPython than table
+        # interpolation or a rational approximation
+        ctl = _ctl_from_offset(dt)
         return max(0.9, min(1.1, ctl))  # Sanity bounds
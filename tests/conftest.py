@@ -4,6 +4,7 @@ Shared test fixtures for the LACT PLC test suite.
 
 import pytest
 
+from plc.core import clock
 from plc.config.io_map import IOMap
 from plc.config.setpoints import Setpoints
 from plc.config.alarms import AlarmConfig
@@ -15,22 +16,54 @@ from plc.drivers.simulator import HardwareSimulator
 from plc.drivers.io_handler import IOHandler
 
 
+class FakeClock:
+    """Stand-in for clock.monotonic that only moves when advanced."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
 @pytest.fixture
-def data_store():
+def fake_clock(monkeypatch):
+    """
+    Replace the process clock for one test. Request it before any
+    fixture whose constructor starts a timer (e.g. state_machine).
+    """
+    fake = FakeClock()
+    monkeypatch.setattr(clock, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def _data_store_template():
     return DataStore()
 
 
+@pytest.fixture
+def data_store(_data_store_template):
+    return _data_store_template.clone()
+
+
+# Setpoints stay per-test: many tests tune them, and building one is
+# cheaper than copying it. The alarm and I/O maps are never modified,
+# cost far more to build, and are shared across a test class.
 @pytest.fixture
 def setpoints():
     return Setpoints()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def alarm_config():
     return AlarmConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def io_map():
     return IOMap()
 
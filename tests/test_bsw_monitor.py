@@ -5,8 +5,6 @@ Tests for the BS&W Monitor module.
 import pytest
 
 from plc.modules.bsw_monitor import BSWMonitor
-from plc.core.data_store import DataStore
-from plc.config.setpoints import Setpoints
 
 
 class TestBSWMonitor:
@@ -29,6 +27,21 @@ class TestBSWMonitor:
         expected_avg = (0.3 + 0.4 + 0.5) / 3
         assert data_store.read("BSW_PCT") == pytest.approx(expected_avg, abs=0.01)
 
+    def test_rolling_average_window(self, bsw, data_store):
+        # Only the last 10 readings count toward the average
+        for val in [5.0] * 5 + [0.2] * 10:
+            data_store.write("AI_BSW_PROBE", val)
+            bsw.execute()
+        assert data_store.read("BSW_PCT") == pytest.approx(0.2, abs=0.001)
+        assert len(bsw._readings) == 10
+
+    def test_history_and_stddev(self, bsw, data_store):
+        for val in (0.1, 0.3):
+            data_store.write("AI_BSW_PROBE", val)
+            bsw.execute()
+        assert bsw.history == (0.1, 0.3)
+        assert bsw.stddev == pytest.approx(0.1)
+
     def test_out_of_range_signal(self, bsw, data_store):
         data_store.write("AI_BSW_PROBE", 6.0)  # Above 5.5 = bad
         bsw.execute()
@@ -1,10 +1,9 @@
 """Tests for the LACT component library."""
 
-import pytest
 from plc.fleet.components import (
     KNOWN_METERS, KNOWN_PUMPS, KNOWN_DIVERT_VALVES,
     KNOWN_BSW_PROBES, KNOWN_SAMPLERS, KNOWN_PROVERS,
-    MeterSpec, PumpSpec, MeterType, PumpType,
+    MeterType,
     search_components,
 )
 
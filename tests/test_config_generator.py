@@ -3,7 +3,6 @@
 import pytest
 from plc.fleet.unit_profile import UnitProfile, ComponentSelection
 from plc.fleet.config_generator import ConfigGenerator
-from plc.config.io_map import SignalType
 
 
 def _make_profile(
@@ -129,6 +128,16 @@ class TestIOMapGeneration:
         io_map = gen.generate_io_map()
         assert "DO_SAMPLE_MIX_PUMP" not in io_map.digital_outputs
 
+    def test_identical_units_share_io_points(self):
+        map_a = ConfigGenerator(_make_profile()).generate_io_map()
+        map_b = ConfigGenerator(_make_profile()).generate_io_map()
+        assert map_a.digital_inputs["DI_ESTOP"] is map_b.digital_inputs["DI_ESTOP"]
+
+    def test_generated_io_map_is_read_only(self):
+        io_map = ConfigGenerator(_make_profile()).generate_io_map()
+        with pytest.raises(TypeError):
+            io_map.digital_inputs["DI_EXTRA"] = None
+
 
 class TestSetpointsGeneration:
     def test_generates_setpoints(self):
@@ -212,6 +221,21 @@ class TestConfigSummary:
         assert summary["total_io_points"] > 20
         assert summary["meter"] == "smith_e3s1_3in"
 
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"has_strainer": False, "has_air_eliminator": False},
+        {"prover": "portable_pipe", "sampler": "clay_bailey_5gal"},
+        {"num_pressure_transmitters": 1, "num_backpressure_valves": 0},
+    ])
+    def test_summary_counts_match_io_map(self, kwargs):
+        gen = ConfigGenerator(_make_profile(**kwargs))
+        summary = gen.summary()
+        io_map = gen.generate_io_map()
+        assert summary["digital_inputs"] == len(io_map.digital_inputs)
+        assert summary["digital_outputs"] == len(io_map.digital_outputs)
+        assert summary["analog_inputs"] == len(io_map.analog_inputs)
+        assert summary["total_io_points"] == len(io_map.get_all_points())
+
     def test_generate_all_returns_tuple(self):
         profile = _make_profile()
         gen = ConfigGenerator(profile)
@@ -3,12 +3,8 @@ Tests for the main PLC Controller.
 """
 
 import time
-import pytest
 
-from plc.core.controller import PLCController
 from plc.core.state_machine import LACTState
-from plc.drivers.simulator import HardwareSimulator
-from plc.drivers.io_handler import IOHandler
 
 
 class TestPLCController:
@@ -49,7 +45,6 @@ class TestPLCController:
     def test_cmd_stop(self, controller):
         # Get into running-ish state first
         controller.state_machine.state = LACTState.RUNNING
-        controller.state_machine._state_entry_time = time.time()
         result = controller.cmd_stop()
         assert "Shutdown" in result
 
@@ -2,9 +2,6 @@
 Tests for the DataStore (tag database).
 """
 
-import pytest
-from plc.core.data_store import DataStore
-
 
 class TestDataStore:
     """Test tag read/write and thread safety."""
@@ -44,6 +41,33 @@ class TestDataStore:
         data_store.write_multiple({"X": 10, "Y": 20})
         assert data_store.read("X") == 10
         assert data_store.read("Y") == 20
+        x, y = (data_store.read_with_quality(t) for t in ("X", "Y"))
+        assert x.timestamp == y.timestamp > 0
+
+    def test_key_handles_track_writes(self, data_store):
+        handles = (data_store.key_handle("DO_DIVERT_CMD"), data_store.key_handle("NEW_TAG"))
+        assert data_store.read_handles(handles) == (False, 0)
+        data_store.write("DO_DIVERT_CMD", True)
+        data_store.write("NEW_TAG", 7)
+        assert data_store.read_handles(handles) == (True, 7)
+
+    def test_write_handles(self, data_store):
+        handles = (data_store.key_handle("FLOW_RATE_BPH"), data_store.key_handle("BSW_PCT"))
+        data_store.write_handles(handles, (400.0, 0.3), quality="UNCERTAIN")
+        assert data_store.read("FLOW_RATE_BPH") == 400.0
+        tv = data_store.read_with_quality("BSW_PCT")
+        assert tv.value == 0.3 and tv.quality == "UNCERTAIN"
+        assert tv.timestamp == data_store.read_with_quality("FLOW_RATE_BPH").timestamp
+
+    def test_clone_is_independent(self, data_store):
+        data_store.write("FLOW_RATE_BPH", 400.0, quality="UNCERTAIN")
+        copy = data_store.clone()
+        assert copy.read_with_quality("FLOW_RATE_BPH").quality == "UNCERTAIN"
+        copy.write("FLOW_RATE_BPH", 0.0)
+        copy.write("NEW_TAG", 1)
+        assert data_store.read("FLOW_RATE_BPH") == 400.0
+        assert not data_store.tag_exists("NEW_TAG")
+        assert copy.get_all_tags().keys() - {"NEW_TAG"} == data_store.get_all_tags().keys()
 
     def test_get_all_tags(self, data_store):
         tags = data_store.get_all_tags()
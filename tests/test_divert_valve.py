@@ -0,0 +1,49 @@
+"""
+Tests for the Divert Valve module.
+"""
+
+import logging
+
+import pytest
+
+from plc.modules.divert_valve import DivertValve
+
+
+class TestDivertValve:
+    """Test divert valve position decoding from limit switch feedback."""
+
+    @pytest.fixture
+    def valve(self, data_store, setpoints):
+        return DivertValve(data_store, setpoints)
+
+    @pytest.mark.parametrize("cmd, at_sales, at_divert, expected", [
+        (False, False, False, "TRANSIT_TO_SALES"),
+        (False, True, False, "SALES"),
+        (False, False, True, "TRANSIT_TO_SALES"),
+        (True, False, False, "TRANSIT_TO_DIVERT"),
+        (True, True, False, "TRANSIT_TO_DIVERT"),
+        (True, False, True, "DIVERT"),
+        (False, True, True, "FAULT_BOTH_LIMITS"),
+        (True, True, True, "FAULT_BOTH_LIMITS"),
+    ])
+    def test_position_decode(self, valve, data_store, cmd, at_sales, at_divert, expected):
+        data_store.write("DO_DIVERT_CMD", cmd)
+        data_store.write("DI_DIVERT_SALES", at_sales)
+        data_store.write("DI_DIVERT_DIVERT", at_divert)
+        valve.execute()
+        assert data_store.read("DIVERT_VALVE_POS") == expected
+
+    def test_position_properties(self, valve, data_store):
+        data_store.write("DO_DIVERT_CMD", True)
+        data_store.write("DI_DIVERT_DIVERT", True)
+        assert valve.is_at_divert
+        assert not valve.is_at_sales
+        assert not valve.is_in_transit
+
+    def test_fault_logged_once(self, valve, data_store, caplog):
+        data_store.write("DI_DIVERT_SALES", True)
+        data_store.write("DI_DIVERT_DIVERT", True)
+        with caplog.at_level(logging.ERROR, logger="plc.modules.divert_valve"):
+            for _ in range(5):
+                valve.execute()
+        assert len(caplog.records) == 1
@@ -1,8 +1,6 @@
 """Tests for the fleet manager."""
 
 import pytest
-import tempfile
-import os
 from plc.fleet.fleet_manager import FleetManager
 from plc.fleet.unit_profile import UnitProfile, UnitStatus, ComponentSelection
 from plc.fleet.intake import quick_intake_scs_3inch
@@ -29,8 +27,8 @@ def _make_unit(unit_id, manufacturer="SCS", state="TX", **kwargs) -> UnitProfile
 
 class TestFleetManager:
     @pytest.fixture
-    def fleet(self, tmp_path):
-        return FleetManager(fleet_dir=str(tmp_path / "fleet"))
+    def fleet(self):
+        return FleetManager(fleet_dir=None)
 
     def test_empty_fleet(self, fleet):
         assert fleet.unit_count == 0
@@ -74,6 +72,11 @@ class TestFleetManager:
         assert len(deployed) == 1
         assert deployed[0].unit_id == "LACT-001"
 
+    def test_list_by_status_sees_profile_edits(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001"))
+        fleet.get_unit("LACT-001").status = UnitStatus.DEPLOYED
+        assert [u.unit_id for u in fleet.list_units(UnitStatus.DEPLOYED)] == ["LACT-001"]
+
     def test_search_units(self, fleet):
         fleet.register_unit(_make_unit("LACT-001", manufacturer="SCS Technologies"))
         fleet.register_unit(_make_unit("LACT-002", manufacturer="Generic"))
@@ -81,6 +84,13 @@ class TestFleetManager:
         assert len(results) == 1
         assert results[0].unit_id == "LACT-001"
 
+    def test_search_sees_profile_edits(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001", manufacturer="SCS Technologies"))
+        assert len(fleet.search_units("scs")) == 1
+        fleet.get_unit("LACT-001").manufacturer = "Generic"
+        assert fleet.search_units("scs") == []
+        assert len(fleet.search_units("generic")) == 1
+
     def test_generate_config(self, fleet):
         fleet.register_unit(_make_unit("LACT-001"))
         io_map, setpoints, alarms = fleet.generate_config("LACT-001")
@@ -102,6 +112,37 @@ class TestFleetManager:
         diff = fleet.compare_units("LACT-001", "LACT-002")
         assert diff["topologically_equivalent"] is True
 
+    def test_config_summary_refreshes_on_reregister(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001"))
+        before = fleet.get_config_summary("LACT-001")
+        assert before["prover"] == ""
+        fleet.register_unit(_make_unit("LACT-001", prover_key="portable_pipe"))
+        after = fleet.get_config_summary("LACT-001")
+        assert after["prover"] == "portable_pipe"
+        assert after["total_io_points"] > before["total_io_points"]
+
+    def test_config_summary_sees_in_place_edit(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001"))
+        before = fleet.get_config_summary("LACT-001")
+        unit = fleet.get_unit("LACT-001")
+        unit.components = ComponentSelection(meter_key="smith_e3s1_3in", has_strainer=False)
+        after = fleet.get_config_summary("LACT-001")
+        assert after["pump"] == ""
+        assert after["total_io_points"] < before["total_io_points"]
+
+    def test_flow_graph_refreshes_on_reregister(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001"))
+        before = len(fleet.build_flow_graph("LACT-001").nodes)
+        fleet.register_unit(_make_unit("LACT-001", has_strainer=False))
+        assert len(fleet.build_flow_graph("LACT-001").nodes) == before - 1
+
+    def test_flow_graph_refreshes_on_profile_edit(self, fleet):
+        fleet.register_unit(_make_unit("LACT-001"))
+        before = len(fleet.build_flow_graph("LACT-001").nodes)
+        unit = fleet.get_unit("LACT-001")
+        unit.components = _make_unit("LACT-001", has_strainer=False).components
+        assert len(fleet.build_flow_graph("LACT-001").nodes) == before - 1
+
     def test_fleet_summary(self, fleet):
         fleet.register_unit(_make_unit("LACT-001", state="TX"))
         fleet.register_unit(_make_unit("LACT-002", state="NM"))
@@ -111,6 +152,14 @@ class TestFleetManager:
         assert summary["by_state"]["TX"] == 2
         assert summary["by_state"]["NM"] == 1
 
+    def test_in_memory_fleet_writes_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        fleet = FleetManager(fleet_dir=None)
+        fleet.register_unit(_make_unit("LACT-001"))
+        fleet.save_all()
+        assert fleet.remove_unit("LACT-001")
+        assert list(tmp_path.iterdir()) == []
+
     def test_persistence(self, tmp_path):
         fleet_dir = str(tmp_path / "fleet_persist")
         fleet1 = FleetManager(fleet_dir=fleet_dir)
@@ -122,6 +171,52 @@ class TestFleetManager:
         assert fleet2.unit_count == 2
         assert fleet2.get_unit("LACT-001") is not None
 
+    def test_startup_indexes_without_parsing(self, tmp_path):
+        fleet_dir = tmp_path / "fleet_lazy"
+        fleet1 = FleetManager(fleet_dir=str(fleet_dir))
+        fleet1.register_unit(_make_unit("LACT-001"))
+        fleet1.register_unit(_make_unit("LACT-002"))
+        (fleet_dir / "archive.json").mkdir()
+
+        fleet2 = FleetManager(fleet_dir=str(fleet_dir))
+        assert sorted(fleet2._unit_paths) == ["LACT-001", "LACT-002"]
+        assert fleet2._units == {}
+        fleet2.get_unit("LACT-002")
+        assert list(fleet2._units) == ["LACT-002"]
+        assert fleet2.unit_count == 2
+
+    def test_save_all_leaves_no_temp_files(self, tmp_path):
+        fleet_dir = tmp_path / "fleet_save"
+        fleet = FleetManager(fleet_dir=str(fleet_dir))
+        for i in range(20):
+            fleet.register_unit(_make_unit(f"LACT-{i:03d}"))
+        fleet.save_all()
+        assert len(list(fleet_dir.glob("*.json"))) == 20
+        assert list(fleet_dir.glob("*.tmp")) == []
+        assert FleetManager(fleet_dir=str(fleet_dir)).unit_count == 20
+
+    def test_persistence_skips_unreadable_profiles(self, tmp_path):
+        fleet_dir = tmp_path / "fleet_bad"
+        fleet1 = FleetManager(fleet_dir=str(fleet_dir))
+        fleet1.register_unit(_make_unit("LACT-001"))
+        (fleet_dir / "LACT-BAD.json").write_text("{not json")
+
+        assert FleetManager(fleet_dir=str(fleet_dir)).unit_count == 1
+        fleet2 = FleetManager(fleet_dir=str(fleet_dir))
+        assert fleet2.get_unit("LACT-BAD") is None
+        assert [u.unit_id for u in fleet2.list_units()] == ["LACT-001"]
+        assert fleet2.unit_count == 1
+
+    def test_file_name_mismatch_is_logged(self, tmp_path, caplog):
+        fleet_dir = tmp_path / "fleet_renamed"
+        FleetManager(fleet_dir=str(fleet_dir)).register_unit(_make_unit("LACT-001"))
+        (fleet_dir / "LACT-001.json").rename(fleet_dir / "renamed.json")
+
+        fleet2 = FleetManager(fleet_dir=str(fleet_dir))
+        assert fleet2.get_unit("renamed") is None
+        assert "holds unit_id 'LACT-001'" in caplog.text
+        assert fleet2.get_unit("LACT-001") is not None
+
     def test_export_and_import(self, fleet, tmp_path):
         fleet.register_unit(_make_unit("LACT-001"))
         fleet.register_unit(_make_unit("LACT-002"))
@@ -133,6 +228,19 @@ class TestFleetManager:
         fleet2.import_fleet(export_path)
         assert fleet2.unit_count == 2
 
+    def test_export_and_import_binary(self, fleet, tmp_path):
+        fleet.register_unit(_make_unit("LACT-001", manufacturer="SCS"))
+        fleet.register_unit(_make_unit("LACT-002", manufacturer="Acme"))
+
+        export_path = str(tmp_path / "export.cat")
+        fleet.export_fleet_binary(export_path)
+
+        fleet2 = FleetManager(fleet_dir=str(tmp_path / "fleet2"))
+        fleet2.import_fleet_binary(export_path)
+        assert fleet2.unit_count == 2
+        assert fleet2.get_unit("LACT-002").manufacturer == "Acme"
+        assert (tmp_path / "fleet2" / "LACT-001.json").exists()
+
     def test_intake_to_registration(self, fleet):
         form = quick_intake_scs_3inch("LACT-INTAKE-001", serial="6113-045")
         profile = fleet.complete_intake(form)
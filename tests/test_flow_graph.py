@@ -1,5 +1,6 @@
 """Tests for the topological flow graph system."""
 
+import dataclasses
 import pytest
 from plc.fleet.flow_graph import (
     FlowGraph, FlowNode, FlowEdge, FlowPath, NodeType,
@@ -73,6 +74,15 @@ class TestFlowGraphBasics:
         path = graph.trace_path("a", "c")
         assert path == ["a", "b", "c"]
 
+    def test_trace_path_is_shortest(self):
+        graph = FlowGraph()
+        for nid in ("a", "b", "c"):
+            graph.add_node(FlowNode(nid, NodeType.PIPELINE, nid))
+        graph.add_edge(FlowEdge("a", "b", FlowPath.MAIN))
+        graph.add_edge(FlowEdge("b", "c", FlowPath.MAIN))
+        graph.add_edge(FlowEdge("a", "c", FlowPath.DIVERT))
+        assert graph.trace_path("a", "c") == ["a", "c"]
+
     def test_trace_no_path(self):
         graph = FlowGraph()
         graph.add_node(FlowNode("a", NodeType.INLET_VALVE, "Inlet"))
@@ -81,6 +91,51 @@ class TestFlowGraphBasics:
         path = graph.trace_path("a", "b")
         assert path == []
 
+    def test_trace_long_path(self):
+        graph = FlowGraph()
+        n = 5000  # deeper than the default recursion limit
+        for i in range(n):
+            graph.add_node(FlowNode(f"n{i}", NodeType.PIPELINE, f"Pipe {i}"))
+        for i in range(n - 1):
+            graph.add_edge(FlowEdge(f"n{i}", f"n{i + 1}", FlowPath.MAIN))
+        path = graph.trace_path("n0", f"n{n - 1}")
+        assert len(path) == n
+        assert path[-1] == f"n{n - 1}"
+
+    def test_trace_path_large_branching_graph(self):
+        graph = FlowGraph()
+        # Two parallel chains from "s" that rejoin at "t", plus dead-end spurs
+        graph.add_node(FlowNode("s", NodeType.INLET_VALVE, "Inlet"))
+        graph.add_node(FlowNode("t", NodeType.METER, "Meter"))
+        for chain in ("a", "b"):
+            prev = "s"
+            for i in range(30):
+                nid = f"{chain}{i}"
+                graph.add_node(FlowNode(nid, NodeType.JUNCTION, nid))
+                graph.add_node(FlowNode(f"{nid}_spur", NodeType.JUNCTION, nid))
+                graph.add_edge(FlowEdge(prev, nid, FlowPath.MAIN))
+                graph.add_edge(FlowEdge(nid, f"{nid}_spur", FlowPath.MAIN))
+                prev = nid
+            graph.add_edge(FlowEdge(prev, "t", FlowPath.MAIN))
+        path = graph.trace_path("s", "t")
+        assert path[0] == "s" and path[-1] == "t"
+        assert len(path) == 32
+        for a, b in zip(path, path[1:]):
+            assert any(n.node_id == b for n in graph.get_downstream(a))
+        assert graph.trace_path("t", "s") == []
+
+    def test_flow_path_nodes_refresh_after_add_edge(self):
+        graph = FlowGraph()
+        graph.add_node(FlowNode("a", NodeType.INLET_VALVE, "Inlet"))
+        graph.add_node(FlowNode("b", NodeType.PUMP, "Pump"))
+        graph.add_node(FlowNode("c", NodeType.METER, "Meter"))
+        graph.add_edge(FlowEdge("a", "b", FlowPath.MAIN))
+        ids = [n.node_id for n in graph.get_flow_path_nodes(FlowPath.MAIN)]
+        assert ids == ["a", "b"]
+        graph.add_edge(FlowEdge("b", "c", FlowPath.MAIN))
+        ids = [n.node_id for n in graph.get_flow_path_nodes(FlowPath.MAIN)]
+        assert ids == ["a", "b", "c"]
+
 
 class TestFlowGraphValidation:
     def test_validate_complete_graph(self):
@@ -96,6 +151,7 @@ class TestFlowGraphValidation:
         issues = graph.validate()
         assert len(issues) > 0
         assert any("Missing required" in i for i in issues)
+        assert "Missing required nodes: ['pump', 'divert_valve', 'meter']" in issues
 
     def test_validate_isolated_node(self):
         graph = FlowGraph()
@@ -116,6 +172,17 @@ class TestBuildFlowGraph:
         assert len(graph.nodes) > 10
         assert len(graph.edges) > 10
 
+    def test_extending_a_built_graph_leaves_others_alone(self):
+        graph_a = build_flow_graph(_make_profile())
+        graph_b = build_flow_graph(_make_profile())
+        tank = next(n for n in graph_a.nodes.values()
+                    if n.node_type == NodeType.TANK_RETURN)
+        graph_a.add_node(FlowNode("extra", NodeType.PIPELINE, "Extra"))
+        graph_a.add_edge(FlowEdge(tank.node_id, "extra", FlowPath.DIVERT))
+        assert [n.node_id for n in graph_a.get_downstream(tank.node_id)] == ["extra"]
+        assert graph_b.get_downstream(tank.node_id) == []
+        assert build_flow_graph(_make_profile()).get_downstream(tank.node_id) == []
+
     def test_has_inlet_and_outlet(self):
         profile = _make_profile()
         graph = build_flow_graph(profile)
@@ -164,6 +231,33 @@ class TestBuildFlowGraph:
         assert len(pump_nodes) == 1
         assert "DO_PUMP_START" in pump_nodes[0].io_tags
 
+    def test_same_components_get_independent_graphs(self):
+        profile_a = _make_profile()
+        profile_b = _make_profile()
+        profile_b.unit_id = "TEST-GRAPH-B"
+        graph_a = build_flow_graph(profile_a)
+        graph_b = build_flow_graph(profile_b)
+        assert graph_a is not graph_b
+        assert graph_b.unit_id == "TEST-GRAPH-B"
+        graph_a.add_node(FlowNode("extra", NodeType.JUNCTION, "Extra"))
+        assert "extra" not in graph_b.nodes
+        assert "extra" not in build_flow_graph(profile_a).nodes
+
+    def test_shared_nodes_cannot_leak_between_units(self):
+        graph_a = build_flow_graph(_make_profile())
+        graph_b = build_flow_graph(_make_profile())
+        pump = next(n for n in graph_a.nodes.values()
+                    if n.node_type == NodeType.PUMP)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pump.label = "Renamed Pump"
+        with pytest.raises(TypeError):
+            pump.properties["hp"] = 40
+        graph_a.add_node(dataclasses.replace(pump, label="Renamed Pump"))
+        assert "Renamed Pump" in graph_a.to_ascii()
+        assert "Renamed Pump" not in graph_b.to_ascii()
+        assert graph_b.nodes[pump.node_id].label == "Transfer Pump"
+        assert "Renamed Pump" not in build_flow_graph(_make_profile()).to_ascii()
+
     def test_ascii_representation(self):
         profile = _make_profile()
         graph = build_flow_graph(profile)
@@ -190,3 +284,16 @@ class TestFlowGraphComparison:
         diff = graph_a.compare(graph_b)
         assert diff["topologically_equivalent"] is False
         assert diff["self_node_count"] > diff["other_node_count"]
+
+    def test_compare_sees_edge_differences(self):
+        def graph(path):
+            g = FlowGraph()
+            g.add_node(FlowNode("a", NodeType.PUMP, "Pump"))
+            g.add_node(FlowNode("b", NodeType.METER, "Meter"))
+            g.add_edge(FlowEdge("a", "b", path))
+            return g
+        graph_a, graph_b = graph(FlowPath.MAIN), graph(FlowPath.MAIN)
+        assert graph_a.compare(graph_b)["topologically_equivalent"] is True
+        graph_b.add_edge(FlowEdge("b", "a", FlowPath.DIVERT))
+        assert graph_a.compare(graph_b)["topologically_equivalent"] is False
+        assert graph_a.compare(graph(FlowPath.SALES))["topologically_equivalent"] is False
@@ -1,10 +1,14 @@
 """Tests for the unit intake form system."""
 
+import logging
+
 import pytest
+from plc.fleet import intake
 from plc.fleet.intake import (
     IntakeForm, quick_intake_scs_3inch, quick_intake_4inch,
+    flush_pending_saves, AUDIT_LOG_SIZE,
 )
-from plc.fleet.unit_profile import UnitStatus
+from plc.fleet.unit_profile import PhotoRecord, UnitStatus
 
 
 class TestIntakeForm:
@@ -110,11 +114,69 @@ class TestIntakeForm:
         assert log[0]["step"] == "identity"
         assert log[1]["step"] == "components"
 
+    def test_audit_log_is_bounded(self):
+        form = IntakeForm(unit_id="LACT-001")
+        for i in range(AUDIT_LOG_SIZE + 10):
+            form.log_step("note", str(i))
+        entries = list(form.iter_audit_log())
+        assert len(entries) == AUDIT_LOG_SIZE
+        assert entries[0].detail == "10"
+        assert form.get_audit_log()[-1]["detail"] == str(AUDIT_LOG_SIZE + 9)
+
     def test_setpoint_overrides(self):
         form = IntakeForm(unit_id="LACT-001")
         form.set_overrides({"bsw_divert_pct": 0.8, "meter_k_factor": 105.0})
         assert form.profile.setpoint_overrides["bsw_divert_pct"] == 0.8
 
+    def test_photo_suggestions_from_tags(self):
+        form = IntakeForm(unit_id="LACT-001")
+        form.profile.photos.append(PhotoRecord(tags=["Smith E3 nameplate"]))
+        form.profile.photos.append(PhotoRecord(tags=["phase_dynamics 4528 probe"]))
+        suggestions = form.get_photo_suggestions()
+        assert suggestions["meter"] == [
+            "smith_e3s1_3in", "smith_e3s1_4in", "smith_g6_2in",
+        ]
+        assert suggestions["bsw_probe"] == [
+            "phase_dynamics_4528", "phase_dynamics_analyzer",
+        ]
+        assert "sampler" not in suggestions
+
+    def test_save_progress_and_resume(self, tmp_path):
+        form = IntakeForm(unit_id="LACT-001")
+        form.set_identity(unit_id="LACT-001", manufacturer="SCS")
+        form.save_progress(str(tmp_path))
+        form.set_identity(unit_id="LACT-001", manufacturer="SCS Technologies")
+        form.save_progress(str(tmp_path))
+        flush_pending_saves()
+        assert [p.name for p in tmp_path.iterdir()] == ["LACT-001.json"]
+        resumed = IntakeForm.resume(str(tmp_path / "LACT-001.json"))
+        assert resumed.profile.manufacturer == "SCS Technologies"
+
+    def test_failed_save_is_raised_and_kept(self, tmp_path):
+        blocker = tmp_path / "units"
+        blocker.write_text("not a directory")
+        form = IntakeForm(unit_id="LACT-001")
+        form.save_progress(str(blocker))
+        with pytest.raises(OSError):
+            flush_pending_saves()
+
+        blocker.unlink()
+        flush_pending_saves()  # the kept snapshot is retried
+        assert (blocker / "LACT-001.json").exists()
+
+    def test_background_save_failure_is_logged(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr(intake, "SAVE_DEBOUNCE_S", 0.0)
+        blocker = tmp_path / "units"
+        blocker.write_text("not a directory")
+        IntakeForm(unit_id="LACT-001").save_progress(str(blocker))
+        with caplog.at_level(logging.ERROR, logger="plc.fleet.intake"):
+            intake._WRITER.submit(lambda: None).result()  # drain the writer
+        assert "LACT-001.json" in caplog.text
+
+        blocker.unlink()
+        flush_pending_saves()
+        assert (blocker / "LACT-001.json").exists()
+
 
 class TestQuickIntake:
     def test_scs_3inch_template(self):
@@ -132,6 +194,16 @@ class TestQuickIntake:
         issues = form.validate()
         assert len(issues) == 0
 
+    def test_templates_share_components_not_profiles(self):
+        form_a = quick_intake_scs_3inch("LACT-A")
+        form_b = quick_intake_scs_3inch("LACT-B", location_state="NM")
+        assert form_a.profile.components is form_b.profile.components
+        assert form_a.profile.location.state == "TX"
+        assert form_b.profile.location.state == "NM"
+        assert [e.step for e in form_a.iter_audit_log()] == [
+            "identity", "components", "location",
+        ]
+
     def test_quick_intake_is_finalizable(self):
         form = quick_intake_scs_3inch("LACT-QUICK")
         profile = form.finalize()
@@ -6,9 +6,7 @@ import time
 import pytest
 
 from plc.drivers.io_handler import IOHandler
-from plc.drivers.simulator import HardwareSimulator
-from plc.core.data_store import DataStore
-from plc.config.io_map import IOMap, IOPoint, SignalType
+from plc.config.io_map import IOPoint, SignalType
 
 
 class TestIOHandler:
@@ -31,6 +29,44 @@ class TestIOHandler:
         # Simulator should now have pump on
         assert simulator._pump_on is True
 
+    def test_contiguous_inputs_read_in_one_block(self, data_store, io_map, simulator, monkeypatch):
+        calls = []
+        read_block = simulator.read_digital_block
+        monkeypatch.setattr(simulator, "read_digital_block",
+                            lambda start, count: calls.append((start, count)) or read_block(start, count))
+        IOHandler(simulator).read_inputs(data_store, io_map)
+        assert calls == [(0, len(io_map.digital_inputs))]
+        assert data_store.read("DI_OUTLET_VLV_OPEN") is True
+
+    def test_readdressed_point_rebuilds_runs(self, io_map, simulator):
+        inputs = dict(io_map.digital_inputs)
+        handler = IOHandler(simulator)
+        old = inputs["DI_INLET_VLV_OPEN"]
+        runs = handler._section_runs("DI", inputs)
+        inputs["DI_INLET_VLV_OPEN"] = IOPoint(
+            tag=old.tag, signal_type=old.signal_type,
+            address=old.address + 100, description=old.description,
+        )
+        assert handler._section_runs("DI", inputs) != runs
+        starts = [start for start, _ in handler._section_runs("DI", inputs)]
+        assert old.address + 100 in starts
+
+    def test_point_backend_isolates_failures(self, data_store, io_map):
+        class PointBackend:
+            def read_digital(self, address):
+                if address == 3:
+                    raise OSError("bus timeout")
+                return address == 0
+            def write_digital(self, address, value): pass
+            def read_analog(self, address): return 2048
+            def write_analog(self, address, value): pass
+            def read_pulse_count(self, address): return 0
+
+        IOHandler(PointBackend()).read_inputs(data_store, io_map)
+        assert data_store.read("DI_INLET_VLV_OPEN") is True
+        assert data_store.read_with_quality("DI_PUMP_RUNNING").quality == "BAD"
+        assert data_store.read_with_quality("DI_PUMP_OVERLOAD").quality == "GOOD"
+
     def test_analog_scaling_input(self):
         point = IOPoint(
             tag="TEST",
@@ -54,6 +90,24 @@ class TestIOHandler:
         result = IOHandler._scale_input(4095, point)
         assert abs(result - 100.0) < 0.1
 
+    def test_analog_scaling_input_live_zero(self):
+        # 4-20 mA on a 12-bit card: 4 mA = 819 counts
+        point = IOPoint(
+            tag="TEST",
+            signal_type=SignalType.ANALOG_IN,
+            address=0,
+            description="test",
+            raw_min=819.0,
+            raw_max=4095.0,
+            eng_min=-10.0,
+            eng_max=50.0,
+        )
+        assert IOHandler._scale_input(819, point) == pytest.approx(-10.0)
+        assert IOHandler._scale_input(2457, point) == pytest.approx(20.0)
+        flat = IOPoint(tag="T", signal_type=SignalType.ANALOG_IN, address=0,
+                       description="", raw_min=5.0, raw_max=5.0, eng_min=7.0)
+        assert IOHandler._scale_input(100, flat) == 7.0
+
     def test_analog_scaling_output(self):
         point = IOPoint(
             tag="TEST",
@@ -130,3 +184,13 @@ class TestHardwareSimulator:
 
         final = simulator._pulse_count
         assert final > initial
+
+    def test_pulses_not_lost_to_short_ticks(self, simulator, monkeypatch):
+        # 400 BPH at K=100 is ~11 pulses/s; one second in 1 ms ticks
+        simulator._flow_rate_bph = 400.0
+        simulator._pump_on = simulator._pump_run_feedback = True
+        start = simulator._last_pulse_time
+        for i in range(1, 1001):
+            monkeypatch.setattr(time, "time", lambda: start + i * 0.001)
+            simulator._update_simulation()
+        assert 10 <= simulator._pulse_count <= 12
@@ -2,12 +2,40 @@
 
 import pytest
 import struct
-import tempfile
 import os
-from plc.fleet.photo_analyzer import PhotoAnalyzer
+from plc.fleet.photo_analyzer import PhotoAnalyzer, PARALLEL_MIN_PHOTOS
 from plc.fleet.unit_profile import PhotoRecord
 
 
+def _exif_jpeg(padding: int = 0) -> bytes:
+    """Minimal JPEG with a JFIF APP0 and an EXIF APP1 (model + GPS)."""
+    model = b"TestCam\x00"
+    ifd0 = 8
+    model_off = ifd0 + 2 + 2 * 12 + 4
+    gps_off = model_off + len(model)
+    lat_off = gps_off + 2 + 4 * 12 + 4
+    lon_off = lat_off + 24
+    tiff = b"MM\x00\x2a" + struct.pack(">I", ifd0)
+    tiff += struct.pack(">H", 2)
+    tiff += struct.pack(">HHII", 0x0110, 2, len(model), model_off)
+    tiff += struct.pack(">HHII", 0x8825, 4, 1, gps_off)
+    tiff += struct.pack(">I", 0) + model
+    tiff += struct.pack(">H", 4)
+    tiff += struct.pack(">HHI", 1, 2, 2) + b"N\x00\x00\x00"
+    tiff += struct.pack(">HHII", 2, 5, 3, lat_off)
+    tiff += struct.pack(">HHI", 3, 2, 2) + b"W\x00\x00\x00"
+    tiff += struct.pack(">HHII", 4, 5, 3, lon_off)
+    tiff += struct.pack(">I", 0)
+    tiff += struct.pack(">6I", 32, 1, 18, 1, 18, 1)
+    tiff += struct.pack(">6I", 101, 1, 55, 1, 12, 1)
+    app1 = b"Exif\x00\x00" + tiff
+    app0 = b"JFIF\x00" + b"\x00" * (9 + padding)
+    return (b"\xff\xd8"
+            + b"\xff\xe0" + struct.pack(">H", len(app0) + 2) + app0
+            + b"\xff\xe1" + struct.pack(">H", len(app1) + 2) + app1
+            + b"\xff\xd9")
+
+
 class TestPhotoAnalyzer:
     @pytest.fixture
     def analyzer(self):
@@ -49,6 +77,33 @@ class TestPhotoAnalyzer:
         record = analyzer.analyze(str(jpeg_file))
         assert record.camera_model == ""
 
+    def test_analyze_jpeg_with_exif(self, analyzer, tmp_path):
+        jpeg_file = tmp_path / "exif.jpg"
+        jpeg_file.write_bytes(_exif_jpeg())
+        record = analyzer.analyze(str(jpeg_file))
+        assert record.camera_model == "TestCam"
+        assert record.gps_lat == pytest.approx(32.305)
+        assert record.gps_lon == pytest.approx(-101.92)
+
+    def test_analyze_jpeg_with_exif_past_scan_window(self, analyzer, tmp_path):
+        jpeg_file = tmp_path / "late_exif.jpg"
+        jpeg_file.write_bytes(_exif_jpeg(padding=65000))
+        record = analyzer.analyze(str(jpeg_file))
+        assert record.camera_model == "TestCam"
+        assert record.has_gps
+
+    def test_complete_exif_skips_pillow(self, analyzer, tmp_path, monkeypatch):
+        from plc.fleet import photo_analyzer
+        calls = []
+        monkeypatch.setattr(photo_analyzer, "HAS_PILLOW", True)
+        monkeypatch.setattr(analyzer, "_try_pillow_extraction",
+                            lambda path, record: calls.append(path))
+        jpeg_file = tmp_path / "exif.jpg"
+        jpeg_file.write_bytes(_exif_jpeg())
+        record = analyzer.analyze(str(jpeg_file))
+        assert record.orientation == 1
+        assert calls == []
+
     def test_analyze_batch_empty_dir(self, analyzer, tmp_path):
         records = analyzer.analyze_batch(str(tmp_path))
         assert len(records) == 0
@@ -61,6 +116,31 @@ class TestPhotoAnalyzer:
         records = analyzer.analyze_batch(str(tmp_path))
         assert len(records) == 2  # Only jpg files
 
+    def test_analyze_batch_skips_directories(self, analyzer, tmp_path):
+        (tmp_path / "photo1.JPG").write_bytes(b"\xff\xd8\xff\xd9")
+        (tmp_path / "album.jpg").mkdir()
+        records = analyzer.analyze_batch(str(tmp_path))
+        assert [os.path.basename(r.file_path) for r in records] == ["photo1.JPG"]
+
+    def test_analyze_many_keeps_input_order(self, analyzer, tmp_path):
+        paths = []
+        for i in range(12):
+            photo = tmp_path / f"p{i:02d}.jpg"
+            photo.write_bytes(_exif_jpeg(padding=i))
+            paths.append(str(photo))
+        paths.reverse()
+        records = analyzer.analyze_many(paths)
+        assert [r.file_path for r in records] == paths
+        assert all(r.camera_model == "TestCam" for r in records)
+        assert records == analyzer.analyze_many(paths, parallel=False)
+
+    def test_analyze_batch_in_processes(self, analyzer, tmp_path):
+        for i in range(PARALLEL_MIN_PHOTOS):
+            (tmp_path / f"p{i}.jpg").write_bytes(_exif_jpeg(padding=i))
+        records = analyzer.analyze_batch(str(tmp_path), processes=True)
+        assert all(r.camera_model == "TestCam" for r in records)
+        assert records == analyzer.analyze_batch(str(tmp_path))
+
     def test_analyze_batch_nonexistent_dir(self, analyzer):
         records = analyzer.analyze_batch("/nonexistent/dir")
         assert records == []
@@ -71,6 +151,42 @@ class TestPhotoAnalyzer:
         record = analyzer.analyze(str(heic_file))
         assert "HEIC" in record.description
 
+    def test_repeat_analysis_returns_independent_copies(self, analyzer, tmp_path):
+        heic_file = tmp_path / "cached.heic"
+        heic_file.write_bytes(b"heic data")
+        first = analyzer.analyze(str(heic_file))
+        first.tags.append("pump")
+        first.description = "edited"
+        second = analyzer.analyze(str(heic_file))
+        assert second is not first
+        assert second.tags == []
+        assert "HEIC" in second.description
+
+    def test_analyze_png_itxt_description(self, analyzer, tmp_path):
+        def chunk(kind, data):
+            return struct.pack(">I", len(data)) + kind + data + b"\x00" * 4
+        itxt = b"Description\x00\x00\x00en\x00\x00" + "Zähler skid".encode("utf-8")
+        late = b"Comment\x00after image data"
+        png_file = tmp_path / "itxt.png"
+        png_file.write_bytes(
+            b"\x89PNG\r\n\x1a\n" + chunk(b"iTXt", itxt)
+            + chunk(b"IDAT", b"\x00" * 64) + chunk(b"tEXt", late)
+        )
+        record = analyzer.analyze(str(png_file))
+        assert record.description == "Zähler skid"
+
+    def test_modified_file_is_reanalyzed(self, analyzer, tmp_path):
+        def png_with_description(text):
+            data = b"Description\x00" + text.encode("latin-1")
+            chunk = struct.pack(">I", len(data)) + b"tEXt" + data + b"\x00" * 4
+            return b"\x89PNG\r\n\x1a\n" + chunk
+
+        photo = tmp_path / "changing.png"
+        photo.write_bytes(png_with_description("first"))
+        assert analyzer.analyze(str(photo)).description == "first"
+        photo.write_bytes(png_with_description("second shot"))
+        assert analyzer.analyze(str(photo)).description == "second shot"
+
     def test_gps_parsing_from_rational(self, analyzer):
         """Test GPS rational number parsing."""
         # Build synthetic EXIF with GPS data
@@ -86,3 +202,8 @@ class TestPhotoAnalyzer:
         assert values[0] == 32.0
         assert values[1] == 18.0
         assert values[2] == 18.0
+
+    def test_gps_rational_truncated(self, analyzer):
+        # Seconds run past the end of the buffer; zero denominators too
+        data = struct.pack("<IIII", 32, 1, 30, 0) + b"\x00\x00"
+        assert analyzer._read_gps_rational(data, 0, "<") == [32.0, 0.0, 0.0]
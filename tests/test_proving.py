@@ -5,9 +5,7 @@ Tests for the Meter Proving module.
 import time
 import pytest
 
-from plc.modules.proving import ProvingManager, ProvingState
-from plc.core.data_store import DataStore
-from plc.config.setpoints import Setpoints
+from plc.modules.proving import ProvingManager, ProvingRun, ProvingState
 
 
 class TestProvingManager:
@@ -39,23 +37,66 @@ class TestProvingManager:
         proving.execute()
         assert proving.state == ProvingState.RUNNING
 
-    def test_setup_timeout(self, proving, data_store):
+    def test_setup_timeout(self, fake_clock, proving, data_store):
         proving.start_proving()
-        proving._state_entry_time = time.time() - 31.0
+        fake_clock.advance(31.0)
         proving.execute()
         assert proving.state == ProvingState.FAILED
 
+    def test_calculating_applies_average_meter_factor(self, proving, data_store):
+        proving.runs = [ProvingRun(meter_factor=mf) for mf in (1.0001, 1.0003, 1.0002)]
+        proving._set_state(ProvingState.CALCULATING)
+        proving.execute()
+        assert proving.state == ProvingState.COMPLETE
+        assert proving.result_meter_factor == pytest.approx(1.0002)
+        assert proving.result_repeatability == pytest.approx(0.02, abs=1e-4)
+        assert data_store.read("METER_FACTOR") == pytest.approx(1.0002)
+
+    def test_calculating_sees_replaced_runs(self, proving, data_store):
+        proving.runs = [ProvingRun(meter_factor=mf) for mf in (1.0001, 1.0003, 1.0002)]
+        proving._set_state(ProvingState.CALCULATING)
+        proving.execute()
+        proving.runs = [ProvingRun(meter_factor=mf) for mf in (0.9901, 0.9903, 0.9902)]
+        proving._set_state(ProvingState.CALCULATING)
+        proving.execute()
+        assert data_store.read("METER_FACTOR") == pytest.approx(0.9902)
+
+    def test_run_columns(self, proving):
+        proving.runs = [ProvingRun(meter_pulses=1000, meter_factor=1.0001),
+                        ProvingRun(meter_pulses=1002, meter_factor=0.9999)]
+        columns = proving.get_run_columns()
+        assert list(columns["meter_pulses"]) == [1000.0, 1002.0]
+        assert list(columns["meter_factor"]) == [1.0001, 0.9999]
+        assert set(columns) >= {"start_time", "temperature_f", "pressure_psi"}
+
     def test_status_report(self, proving):
         status = proving.get_status()
         assert status["state"] == "IDLE"
         assert status["runs_completed"] == 0
 
-    def test_complete_transitions_close_valve(self, proving, data_store):
-        proving.state = ProvingState.COMPLETE
+    @pytest.mark.parametrize("final", [ProvingState.COMPLETE, ProvingState.FAILED])
+    def test_final_states_close_valve(self, proving, data_store, final):
+        data_store.write("DO_PROVER_VLV_CMD", True)
+        proving._set_state(final)
         proving.execute()
         assert data_store.read("DO_PROVER_VLV_CMD") is False
 
-    def test_failed_transitions_close_valve(self, proving, data_store):
-        proving.state = ProvingState.FAILED
+    def test_set_state_restarts_timer(self, fake_clock, proving):
+        proving.start_proving()
+        fake_clock.advance(20.0)
+        proving._set_state(ProvingState.SETUP)
+        fake_clock.advance(20.0)
+        proving.execute()
+        assert proving.state == ProvingState.SETUP
+
+    def test_run_timed_across_wall_clock_step(self, fake_clock, proving,
+                                              data_store, monkeypatch):
+        proving.start_proving()
+        data_store.write("DI_PROVER_VLV_OPEN", True)
         proving.execute()
-        assert data_store.read("DO_PROVER_VLV_CMD") is False
+        wall = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall - 3600.0)
+        fake_clock.advance(60.0)
+        proving.execute()
+        assert len(proving.runs) == 1
+        assert proving.runs[0].end_time == wall - 3600.0
@@ -6,8 +6,6 @@ import time
 import pytest
 
 from plc.modules.pump_control import PumpControl
-from plc.core.data_store import DataStore
-from plc.config.setpoints import Setpoints
 
 
 class TestPumpControl:
@@ -41,17 +39,31 @@ class TestPumpControl:
         # Should still be off during lockout
         assert data_store.read("DO_PUMP_START") is False
 
-    def test_lockout_expires(self, pump, data_store, setpoints):
+    def test_lockout_expires(self, fake_clock, pump, data_store, setpoints):
         setpoints.pump_restart_lockout_sec = 0.0  # Immediate expiry
         data_store.write("DO_PUMP_START", True)
         data_store.write("DI_PUMP_OVERLOAD", True)
         pump.execute()
 
         data_store.write("DI_PUMP_OVERLOAD", False)
-        pump._last_trip_time = time.time() - 1.0
+        fake_clock.advance(1.0)
         pump.execute()
         assert not pump.is_locked_out
 
+    def test_lockout_ignores_wall_clock_jump(self, fake_clock, pump, data_store,
+                                             setpoints, monkeypatch):
+        setpoints.pump_restart_lockout_sec = 30.0
+        data_store.write("DO_PUMP_START", True)
+        data_store.write("DI_PUMP_OVERLOAD", True)
+        pump.execute()
+
+        # Wall clock steps forward an hour; the lockout still holds
+        wall = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall + 3600.0)
+        data_store.write("DI_PUMP_OVERLOAD", False)
+        pump.execute()
+        assert pump.is_locked_out
+
     def test_max_starts_protection(self, pump, setpoints):
         setpoints.pump_max_starts_per_hour = 4
         assert pump.record_start()  # 1st: count=1 < 4, OK
@@ -64,6 +76,20 @@ class TestPumpControl:
         pump.record_start()
         assert pump.starts_this_hour == 2
 
+    def test_starts_age_out_after_an_hour(self, fake_clock, pump, setpoints):
+        setpoints.pump_max_starts_per_hour = 2
+        assert pump.record_start()
+        fake_clock.advance(3700.0)  # first start now > 1 h old
+        assert pump.record_start()
+        assert len(pump._start_times) == 1
+
+    def test_starts_ignore_wall_clock_steps(self, fake_clock, pump, monkeypatch):
+        pump.record_start()
+        monkeypatch.setattr(time, "time", lambda: 0.0)  # wall clock jumps back
+        fake_clock.advance(1.0)
+        pump.record_start()
+        assert pump.starts_this_hour == 2
+
     def test_running_status(self, pump, data_store):
         assert not pump.is_running
         data_store.write("DI_PUMP_RUNNING", True)
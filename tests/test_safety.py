@@ -2,123 +2,106 @@
 Tests for the Safety Interlock Manager.
 """
 
-import time
 import pytest
 
-from plc.core.safety import SafetyManager
-from plc.core.data_store import DataStore
 from plc.config.setpoints import Setpoints
-from plc.config.alarms import AlarmConfig, AlarmPriority
+from plc.config.alarms import AlarmPriority
+
+
+# Trip points are computed once, at import, from the same defaults the
+# setpoints fixture returns
+_SP = Setpoints()
+
+# (tag writes, expected alarm, request raised)
+ALARM_CASES = [
+    pytest.param({"DI_ESTOP": True},
+                 "ALM_ESTOP", "shutdown", id="estop"),
+    pytest.param({"DI_PUMP_OVERLOAD": True},
+                 "ALM_PUMP_OVERLOAD", "shutdown", id="pump_overload"),
+    pytest.param({"AI_BSW_PROBE": _SP.bsw_alarm_pct + 0.1},
+                 "ALM_BSW_HIGH", None, id="bsw_high"),
+    pytest.param({"AI_BSW_PROBE": _SP.bsw_divert_pct + 0.1},
+                 "ALM_BSW_DIVERT", "divert", id="bsw_divert"),
+    pytest.param({"DI_PUMP_RUNNING": True,
+                  "AI_INLET_PRESS": _SP.inlet_press_lo_psi - 1},
+                 "ALM_INLET_PRESS_LO", None, id="inlet_pressure_low"),
+    pytest.param({"AI_INLET_PRESS": _SP.inlet_press_hi_psi + 10},
+                 "ALM_INLET_PRESS_HI", None, id="inlet_pressure_high"),
+    pytest.param({"AI_METER_TEMP": _SP.temp_lo_alarm_f - 5},
+                 "ALM_TEMP_LO", None, id="temperature_low"),
+    pytest.param({"AI_METER_TEMP": 80.0,
+                  "AI_TEST_THERMO": 80.0 + _SP.temp_max_delta_f + 1},
+                 "ALM_TEMP_DELTA", None, id="temperature_delta"),
+    pytest.param({"AI_STRAINER_DP": _SP.strainer_dp_hi_psi + 5},
+                 "ALM_STRAINER_DP_HI", None, id="strainer_dp"),
+    pytest.param({"DI_SAMPLE_POT_HI": True},
+                 "ALM_SAMPLE_POT_FULL", None, id="sample_pot_full"),
+    pytest.param({"DI_AIR_ELIM_FLOAT": True},
+                 "ALM_GAS_DETECTED", None, id="gas_detected"),
+]
 
 
 class TestSafetyManager:
     """Test safety interlock evaluation and alarm management."""
 
-    def test_no_alarms_on_init(self, safety_manager):
+    @pytest.fixture
+    def active_tags(self, safety_manager):
+        """Call for the set of currently active alarm tags."""
+        return lambda: {a.definition.tag for a in safety_manager.get_active_alarms()}
+
+    def test_no_alarms_on_init(self, safety_manager, active_tags):
         safety_manager.execute()
-        assert len(safety_manager.get_active_alarms()) == 0
+        assert active_tags() == set()
 
-    def test_estop_alarm(self, safety_manager, data_store):
-        data_store.write("DI_ESTOP", True)
+    @pytest.mark.parametrize("writes, expected_alarm, raises", ALARM_CASES)
+    def test_alarm_fires(self, safety_manager, data_store,
+                         writes, expected_alarm, raises):
+        data_store.write_multiple(writes)
         safety_manager.execute()
-        active = safety_manager.get_active_alarms()
-        tags = [a.definition.tag for a in active]
-        assert "ALM_ESTOP" in tags
-        assert safety_manager.shutdown_requested
+        assert safety_manager.is_alarm_active(expected_alarm)
+        if raises == "shutdown":
+            assert safety_manager.shutdown_requested
+        elif raises == "divert":
+            assert safety_manager.divert_requested
 
-    def test_estop_clears(self, safety_manager, data_store):
+    def test_estop_clears(self, safety_manager, data_store, active_tags):
         data_store.write("DI_ESTOP", True)
         safety_manager.execute()
-        assert len(safety_manager.get_active_alarms()) > 0
+        assert active_tags() == {"ALM_ESTOP"}
 
         # Acknowledge and clear
         safety_manager.acknowledge_alarm("ALM_ESTOP")
         data_store.write("DI_ESTOP", False)
         safety_manager.execute()
-        assert not any(
-            a.definition.tag == "ALM_ESTOP"
-            for a in safety_manager.get_active_alarms()
-        )
-
-    def test_pump_overload_alarm(self, safety_manager, data_store):
-        data_store.write("DI_PUMP_OVERLOAD", True)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_PUMP_OVERLOAD" in tags
-        assert safety_manager.shutdown_requested
-
-    def test_bsw_high_alarm(self, safety_manager, data_store, setpoints):
-        data_store.write("AI_BSW_PROBE", setpoints.bsw_alarm_pct + 0.1)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_BSW_HIGH" in tags
-
-    def test_bsw_divert_alarm(self, safety_manager, data_store, setpoints):
-        data_store.write("AI_BSW_PROBE", setpoints.bsw_divert_pct + 0.1)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_BSW_DIVERT" in tags
-        assert safety_manager.divert_requested
+        assert not safety_manager.is_alarm_active("ALM_ESTOP")
 
     def test_bsw_probe_failure(self, safety_manager, data_store):
         data_store.write("AI_BSW_PROBE", 0.5, quality="BAD")
         safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_BSW_PROBE_FAIL" in tags
+        assert safety_manager.is_alarm_active("ALM_BSW_PROBE_FAIL")
 
-    def test_inlet_pressure_low(self, safety_manager, data_store, setpoints):
-        data_store.write("DI_PUMP_RUNNING", True)
-        data_store.write("AI_INLET_PRESS", setpoints.inlet_press_lo_psi - 1)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_INLET_PRESS_LO" in tags
-
-    def test_inlet_pressure_high(self, safety_manager, data_store, setpoints):
-        data_store.write("AI_INLET_PRESS", setpoints.inlet_press_hi_psi + 10)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_INLET_PRESS_HI" in tags
-
-    def test_temperature_alarms(self, safety_manager, data_store, setpoints):
-        # Low temp
-        data_store.write("AI_METER_TEMP", setpoints.temp_lo_alarm_f - 5)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_TEMP_LO" in tags
-
-    def test_temperature_delta_alarm(self, safety_manager, data_store, setpoints):
-        data_store.write("AI_METER_TEMP", 80.0)
-        data_store.write("AI_TEST_THERMO", 80.0 + setpoints.temp_max_delta_f + 1)
+    def test_acknowledge_all(self, safety_manager, data_store):
+        data_store.write_multiple({"DI_ESTOP": True, "DI_PUMP_OVERLOAD": True})
         safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_TEMP_DELTA" in tags
+        assert safety_manager.unacknowledged_count() >= 2
 
-    def test_strainer_dp_alarm(self, safety_manager, data_store, setpoints):
-        data_store.write("AI_STRAINER_DP", setpoints.strainer_dp_hi_psi + 5)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_STRAINER_DP_HI" in tags
+        safety_manager.acknowledge_all()
+        assert safety_manager.unacknowledged_count() == 0
 
-    def test_sample_pot_full_alarm(self, safety_manager, data_store):
-        data_store.write("DI_SAMPLE_POT_HI", True)
+    def test_alarm_lists_track_changes(self, safety_manager, data_store, active_tags):
+        data_store.write("DI_ESTOP", True)
         safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_SAMPLE_POT_FULL" in tags
+        safety_manager.get_active_alarms().clear()  # caller's copy only
+        assert active_tags() == {"ALM_ESTOP"}
+        assert safety_manager.unacknowledged_count() == 1
 
-    def test_gas_detected_alarm(self, safety_manager, data_store):
-        data_store.write("DI_AIR_ELIM_FLOAT", True)
-        safety_manager.execute()
-        tags = [a.definition.tag for a in safety_manager.get_active_alarms()]
-        assert "ALM_GAS_DETECTED" in tags
+        safety_manager.acknowledge_alarm("ALM_ESTOP")
+        assert safety_manager.get_unacknowledged_alarms() == []
+        assert safety_manager.is_alarm_active("ALM_ESTOP")
 
-    def test_acknowledge_all(self, safety_manager, data_store):
-        data_store.write("DI_ESTOP", True)
-        data_store.write("DI_PUMP_OVERLOAD", True)
+        data_store.write("DI_ESTOP", False)
         safety_manager.execute()
-        assert len(safety_manager.get_unacknowledged_alarms()) >= 2
-
-        safety_manager.acknowledge_all()
-        assert len(safety_manager.get_unacknowledged_alarms()) == 0
+        assert active_tags() == set()
 
     def test_alarm_beacon_on_unack(self, safety_manager, data_store):
         data_store.write("DI_ESTOP", True)
@@ -135,9 +118,24 @@ class TestSafetyManager:
         assert data_store.read("DO_ALARM_HORN") is False
 
     def test_alarm_summary_updates(self, safety_manager, data_store):
-        data_store.write("DI_ESTOP", True)
-        data_store.write("DI_PUMP_OVERLOAD", True)
+        data_store.write_multiple({"DI_ESTOP": True, "DI_PUMP_OVERLOAD": True})
+        safety_manager.execute()
+        summary = data_store.read_multiple(
+            ["ALARM_ACTIVE_COUNT", "ALARM_UNACK_COUNT", "HIGHEST_ALARM_PRI"]
+        )
+        assert summary["ALARM_ACTIVE_COUNT"] >= 2
+        assert summary["ALARM_UNACK_COUNT"] >= 2
+        assert summary["HIGHEST_ALARM_PRI"] >= AlarmPriority.CRITICAL
+
+    def test_alarm_summary_written_on_change(self, safety_manager, data_store):
+        data_store.write("DI_SAMPLE_POT_HI", True)
+        safety_manager.execute()
+        stamp = data_store.read_with_quality("HIGHEST_ALARM_PRI").timestamp
+        safety_manager.execute()  # nothing changed
+        assert data_store.read_with_quality("HIGHEST_ALARM_PRI").timestamp == stamp
+
+        safety_manager.acknowledge_all()
+        data_store.write("DI_SAMPLE_POT_HI", False)
         safety_manager.execute()
-        assert data_store.read("ALARM_ACTIVE_COUNT") >= 2
-        assert data_store.read("ALARM_UNACK_COUNT") >= 2
-        assert data_store.read("HIGHEST_ALARM_PRI") >= AlarmPriority.CRITICAL
+        assert data_store.read("ALARM_ACTIVE_COUNT") == 0
+        assert data_store.read("HIGHEST_ALARM_PRI") == AlarmPriority.INFO
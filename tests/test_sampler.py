@@ -6,9 +6,7 @@ import time
 import pytest
 
 from plc.modules.sampler import Sampler
-from plc.core.data_store import DataStore
 from plc.core.state_machine import LACTState
-from plc.config.setpoints import Setpoints
 
 
 class TestSampler:
@@ -60,3 +58,64 @@ class TestSampler:
         sampler.reset_totals()
         assert data_store.read("SAMPLE_TOTAL_GRABS") == 0
         assert data_store.read("SAMPLE_TOTAL_ML") == 0.0
+
+    def test_mixing_cycle_edges(self, sampler, data_store, setpoints):
+        setpoints.sample_mix_time_sec = 30.0
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        for now, expected in [(3000.0, True), (3029.0, True), (3030.0, False),
+                              (3299.0, False), (3300.0, True)]:
+            sampler.execute(LACTState.RUNNING, now)
+            assert data_store.read("DO_SAMPLE_MIX_PUMP") is expected, now
+
+    def test_grab_waits_for_interval(self, sampler, data_store, setpoints):
+        setpoints.sample_rate_sec = 15.0
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        sampler.execute(LACTState.RUNNING, 1000.0)
+        sampler.execute(LACTState.RUNNING, 1001.0)  # closes the pulse
+        sampler.execute(LACTState.RUNNING, 1014.0)
+        assert data_store.read("SAMPLE_TOTAL_GRABS") == 1
+        sampler.execute(LACTState.RUNNING, 1015.0)
+        assert data_store.read("SAMPLE_TOTAL_GRABS") == 2
+
+    def test_pot_full_closes_open_pulse(self, sampler, data_store):
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        sampler.execute(LACTState.RUNNING, 1000.0)
+        assert data_store.read("DO_SAMPLE_SOL") is True
+        data_store.write("DI_SAMPLE_POT_HI", True)
+        sampler.execute(LACTState.RUNNING, 1000.1)
+        assert data_store.read("DO_SAMPLE_SOL") is False
+
+    def test_solenoid_closed_once_while_not_running(self, sampler, data_store):
+        sampler.execute(LACTState.IDLE, 1000.0)
+        stamp = data_store.read_with_quality("DO_SAMPLE_SOL").timestamp
+        sampler.execute(LACTState.IDLE, 1001.0)
+        assert data_store.read_with_quality("DO_SAMPLE_SOL").timestamp == stamp
+
+    def test_sample_total_does_not_drift(self, sampler, data_store, setpoints):
+        setpoints.sample_volume_ml = 0.1
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        for i in range(1000):
+            sampler.execute(LACTState.RUNNING, 1000.0 + i)
+        assert data_store.read("SAMPLE_TOTAL_ML") == 100.0
+
+    def test_solenoid_reopens_after_external_close(self, sampler, data_store):
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        sampler.execute(LACTState.RUNNING, 1000.0)
+        data_store.write("DO_SAMPLE_SOL", False)  # e.g. state machine
+        sampler.execute(LACTState.RUNNING, 1001.0)
+        assert data_store.read("DO_SAMPLE_SOL") is True
+
+    def test_pulse_closes_across_wall_clock_step(self, fake_clock, sampler,
+                                                 data_store, setpoints, monkeypatch):
+        setpoints.sample_rate_sec = 1.0
+        data_store.write("FLOW_RATE_BPH", 400.0)
+        sampler.execute(LACTState.RUNNING)
+        assert data_store.read("DO_SAMPLE_SOL") is True
+        wall = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall - 3600.0)
+        fake_clock.advance(0.6)
+        sampler.execute(LACTState.RUNNING)
+        assert data_store.read("DO_SAMPLE_SOL") is False
+        fake_clock.advance(1.0)
+        sampler.execute(LACTState.RUNNING)
+        assert data_store.read("SAMPLE_TOTAL_GRABS") == 2
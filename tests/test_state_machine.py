@@ -2,17 +2,19 @@
 Tests for the LACT State Machine.
 """
 
-import time
 import pytest
 
-from plc.core.state_machine import LACTStateMachine, LACTState
-from plc.core.data_store import DataStore
-from plc.config.setpoints import Setpoints
+from plc.core.state_machine import LACTStateMachine, LACTState, _TRANSITIONS
 
 
 class TestLACTStateMachine:
     """Test state transitions and state handler behavior."""
 
+    @pytest.fixture
+    def running_sm(self, state_machine):
+        state_machine.state = LACTState.RUNNING
+        return state_machine
+
     def test_initial_state_is_idle(self, state_machine):
         assert state_machine.state == LACTState.IDLE
 
@@ -27,6 +29,13 @@ class TestLACTStateMachine:
         # Should remain IDLE because IDLE->RUNNING is not allowed
         assert state_machine.state == LACTState.IDLE
 
+    @pytest.mark.parametrize("src", list(LACTState))
+    def test_legality_masks_match_transition_table(self, data_store, setpoints, src):
+        for dst in LACTState:
+            sm = LACTStateMachine(data_store, setpoints)
+            sm.state = src
+            assert sm._transition(dst) == (dst in _TRANSITIONS[src])
+
     def test_estop_from_any_state(self, state_machine, data_store):
         # Go to STARTUP first
         state_machine.request_transition(LACTState.STARTUP)
@@ -44,10 +53,11 @@ class TestLACTStateMachine:
         state_machine.execute()  # Transitions
         state_machine.execute()  # Runs E_STOP handler
         # E-stop handler should clear pump
-        assert data_store.read("DO_PUMP_START") is False
-        assert data_store.read("DO_SAMPLE_SOL") is False
+        assert data_store.read_multiple(["DO_PUMP_START", "DO_SAMPLE_SOL"]) == {
+            "DO_PUMP_START": False, "DO_SAMPLE_SOL": False,
+        }
 
-    def test_estop_recovery_to_idle(self, state_machine, data_store):
+    def test_estop_recovery_to_idle(self, fake_clock, state_machine, data_store):
         # Enter E-Stop
         data_store.write("DI_ESTOP", True)
         state_machine.request_transition(LACTState.STARTUP)
@@ -57,14 +67,12 @@ class TestLACTStateMachine:
         # The transition goes: request STARTUP → transition to STARTUP → skip handler
         # But E-Stop is checked too... let me just force E_STOP state
         state_machine.state = LACTState.E_STOP
-        state_machine._state_entry_time = time.time() - 3.0
+        fake_clock.advance(3.0)
 
         # Release E-Stop
         data_store.write("DI_ESTOP", False)
-        state_machine.execute()  # Runs handler, transitions to IDLE
-        # After transition, one more execute to confirm
-        state_machine.execute()
-        assert state_machine.state == LACTState.IDLE
+        # Handler sees the release and transitions on the same scan
+        assert state_machine.run_until(LACTState.IDLE) == 1
 
     def test_startup_aborts_without_valves(self, state_machine, data_store):
         # Valves are closed (default False)
@@ -72,56 +80,45 @@ class TestLACTStateMachine:
         state_machine.execute()  # Transition (handler skipped)
         assert state_machine.state == LACTState.STARTUP
 
-        # Next scan: startup checks valves and aborts
-        state_machine.execute()  # Handler runs, valves not open → IDLE
-        # Transition back to IDLE (handler skipped), next scan confirms
-        state_machine.execute()
-        assert state_machine.state == LACTState.IDLE
+        # Next scan: startup checks valves and aborts → IDLE
+        assert state_machine.run_until(LACTState.IDLE) == 1
 
     def test_idle_handler_clears_outputs(self, state_machine, data_store):
         data_store.write("DO_PUMP_START", True)
         data_store.write("DO_STATUS_GREEN", True)
         state_machine.execute()  # In IDLE state, handler runs
-        assert data_store.read("DO_PUMP_START") is False
-        assert data_store.read("DO_STATUS_GREEN") is False
+        assert data_store.read_multiple(["DO_PUMP_START", "DO_STATUS_GREEN"]) == {
+            "DO_PUMP_START": False, "DO_STATUS_GREEN": False,
+        }
 
     def test_state_writes_to_datastore(self, state_machine, data_store):
         assert data_store.read("LACT_STATE") == "IDLE"
         state_machine.request_transition(LACTState.STARTUP)
         state_machine.execute()  # Transition writes to DS
-        assert data_store.read("LACT_STATE") == "STARTUP"
+        assert LACTState(data_store.read("LACT_STATE")) == LACTState.STARTUP
+        assert data_store.read("PREV_STATE") == "IDLE"
 
-    def test_running_to_divert_transition(self, data_store, setpoints):
-        sm = LACTStateMachine(data_store, setpoints)
-        sm.state = LACTState.RUNNING
-        sm._state_entry_time = time.time()
+    def test_running_to_divert_transition(self, running_sm):
+        running_sm.request_transition(LACTState.DIVERT)
+        running_sm.execute()
+        assert running_sm.state == LACTState.DIVERT
 
-        sm.request_transition(LACTState.DIVERT)
-        sm.execute()
-        assert sm.state == LACTState.DIVERT
+    def test_running_to_proving_transition(self, running_sm):
+        running_sm.request_transition(LACTState.PROVING)
+        running_sm.execute()
+        assert running_sm.state == LACTState.PROVING
 
-    def test_running_to_proving_transition(self, data_store, setpoints):
-        sm = LACTStateMachine(data_store, setpoints)
-        sm.state = LACTState.RUNNING
-        sm._state_entry_time = time.time()
-
-        sm.request_transition(LACTState.PROVING)
-        sm.execute()
-        assert sm.state == LACTState.PROVING
-
-    def test_divert_clears_when_bsw_drops(self, data_store, setpoints):
+    def test_divert_clears_when_bsw_drops(self, fake_clock, data_store, setpoints):
         sm = LACTStateMachine(data_store, setpoints)
         sm.state = LACTState.DIVERT
-        sm._state_entry_time = time.time() - 10.0  # Well past delay
+        fake_clock.advance(10.0)  # Well past delay
 
         data_store.write("AI_BSW_PROBE", 0.1)  # Below divert setpoint
         sm.execute()  # Handler runs, transitions to RUNNING
         assert sm.state == LACTState.RUNNING
 
-    def test_shutdown_sequence(self, data_store, setpoints):
-        sm = LACTStateMachine(data_store, setpoints)
-        sm.state = LACTState.RUNNING
-        sm._state_entry_time = time.time()
+    def test_shutdown_sequence(self, fake_clock, running_sm, data_store):
+        sm = running_sm
 
         # Request shutdown
         sm.request_transition(LACTState.SHUTDOWN)
@@ -133,9 +130,11 @@ class TestLACTStateMachine:
         assert data_store.read("DO_DIVERT_CMD") is True
 
         # Step 1->2: pump stops after delay
-        sm._state_entry_time = time.time() - 10.0
+        fake_clock.advance(10.0)
         data_store.write("DI_PUMP_RUNNING", False)
-        sm.execute()  # Step 1 -> step 2 (pump off)
-        sm.execute()  # Step 2 -> transition to IDLE
-        sm.execute()  # Confirm IDLE
-        assert sm.state == LACTState.IDLE
+        # Step 1 -> step 2 (pump off), then step 2 -> IDLE
+        assert sm.run_until(LACTState.IDLE) == 2
+
+    def test_run_until_gives_up(self, state_machine):
+        assert state_machine.run_until(LACTState.RUNNING, max_scans=3) == 0
+        assert state_machine.state == LACTState.IDLE
@@ -0,0 +1,40 @@
+"""
+Tests for the Temperature Monitoring module.
+"""
+
+import pytest
+
+from plc.modules.temperature import TemperatureMonitor, _ctl_from_offset
+
+
+class TestTemperatureMonitor:
+    """Test CTL computation and published temperature values."""
+
+    @pytest.fixture
+    def temp(self, data_store, setpoints):
+        return TemperatureMonitor(data_store, setpoints)
+
+    def test_base_temperature_is_unity(self, temp):
+        assert temp._compute_ctl(60.0) == 1.0
+
+    @pytest.mark.parametrize("observed", [20.0, 33.37, 59.5, 60.05, 85.0, 179.99, 10.0, 200.0])
+    def test_ctl_matches_formula(self, temp, observed):
+        expected = max(0.9, min(1.1, _ctl_from_offset(observed - 60.0)))
+        assert temp._compute_ctl(observed) == pytest.approx(expected, abs=1e-9)
+
+    def test_execute_publishes_ctl(self, temp, data_store):
+        data_store.write("AI_METER_TEMP", 80.0)
+        temp.execute()
+        assert data_store.read("CTL_FACTOR") == round(_ctl_from_offset(20.0), 6)
+        assert data_store.read("TEMP_CORRECTED_F") == 80.0
+
+    def test_unchanged_values_not_rewritten(self, temp, data_store):
+        data_store.write("AI_METER_TEMP", 80.0)
+        temp.execute()
+        stamp = data_store.read_with_quality("CTL_FACTOR").timestamp
+        temp.execute()
+        assert data_store.read_with_quality("CTL_FACTOR").timestamp == stamp
+
+    def test_reprocess_history(self, temp):
+        temps = [55.0, 60.0, 72.5]
+        assert temp.reprocess_history(temps) == [temp._compute_ctl(t) for t in temps]
@@ -37,6 +37,29 @@ class TestUnitProfile:
         assert comp.has_strainer is True
         assert comp.has_air_eliminator is True
 
+    def test_component_selection_hashable(self):
+        a = ComponentSelection(meter_key="smith_e3s1_3in", strainer_mesh=8)
+        b = ComponentSelection(meter_key="smith_e3s1_3in", strainer_mesh=8)
+        assert a.signature_tuple == b.signature_tuple
+        assert {a: "cached"}[b] == "cached"
+
+    def test_component_selection_is_slotted(self):
+        comp = ComponentSelection(meter_key="smith_e3s1_3in")
+        assert not hasattr(comp, "__dict__")
+        assert comp.signature_tuple[0] == "smith_e3s1_3in"
+        assert "_sig" not in UnitProfile(components=comp)._to_dict()["components"]
+
+    @pytest.mark.parametrize("cls", [
+        UnitProfile, GeoLocation, ElectricalConfig, PhotoRecord, ComponentSelection,
+    ])
+    def test_profile_records_are_slotted(self, cls):
+        assert not hasattr(cls(), "__dict__")
+
+    def test_component_selection_is_immutable(self):
+        comp = ComponentSelection()
+        with pytest.raises(AttributeError):
+            comp.meter_key = "smith_e3s1_3in"
+
     def test_geo_location(self):
         loc = GeoLocation(
             latitude=32.305,
@@ -80,7 +103,7 @@ class TestUnitProfile:
         issues = profile.validate()
         assert any("unit_id" in i for i in issues)
 
-    def test_save_and_load(self):
+    def test_bytes_round_trip(self):
         profile = UnitProfile(
             unit_id="LACT-TEST",
             manufacturer="Test MFG",
@@ -98,17 +121,84 @@ class TestUnitProfile:
             gps_lon=-101.0,
         ))
 
+        loaded = UnitProfile.from_bytes(profile.to_bytes())
+        assert loaded.unit_id == "LACT-TEST"
+        assert loaded.manufacturer == "Test MFG"
+        assert loaded.components.meter_key == "smith_e3s1_3in"
+        assert loaded.location.state == "TX"
+        assert len(loaded.photos) == 1
+        assert loaded.photos[0].gps_lat == 32.0
+
+    def test_save_writes_to_bytes_document(self, tmp_path):
+        profile = UnitProfile(unit_id="LACT-TEST", updated_at=1.0)
+        path = tmp_path / "LACT-TEST.json"
+        profile.save(str(path))
+        assert path.read_bytes() == profile.to_bytes()
+        assert UnitProfile.load(str(path)).unit_id == "LACT-TEST"
+
+    def test_save_and_load_stdlib_json(self, monkeypatch):
+        from plc.fleet import jsonio
+        monkeypatch.setattr(jsonio, "HAS_ORJSON", False)
+        profile = UnitProfile(unit_id="LACT-JSON", notes="Odessa — yard 2")
         with tempfile.TemporaryDirectory() as tmpdir:
             path = os.path.join(tmpdir, "test_unit.json")
             profile.save(path)
+            loaded = UnitProfile.load(path)
+            assert loaded.unit_id == "LACT-JSON"
+            assert loaded.notes == "Odessa — yard 2"
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_saved_file_matches_to_dict(self, monkeypatch, tmp_path, has_orjson):
+        from plc.fleet import jsonio
+        if has_orjson and not jsonio.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+        profile = UnitProfile(
+            unit_id="LACT-DC", status=UnitStatus.CONFIGURED,
+            components=ComponentSelection(meter_key="smith_e3s1_3in"),
+        )
+        path = tmp_path / "LACT-DC.json"
+        profile.save(str(path))
+        assert json.loads(path.read_text()) == profile._to_dict()
 
+    def test_save_and_load_numeric_override_keys(self):
+        profile = UnitProfile(unit_id="LACT-KEYS")
+        profile.setpoint_overrides = {1: 0.5}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "test_unit.json")
+            profile.save(path)
             loaded = UnitProfile.load(path)
-            assert loaded.unit_id == "LACT-TEST"
-            assert loaded.manufacturer == "Test MFG"
-            assert loaded.components.meter_key == "smith_e3s1_3in"
-            assert loaded.location.state == "TX"
-            assert len(loaded.photos) == 1
-            assert loaded.photos[0].gps_lat == 32.0
+            assert loaded.setpoint_overrides == {"1": 0.5}
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_save_and_load_binary(self, monkeypatch, tmp_path, has_orjson):
+        from plc.fleet import jsonio
+        if has_orjson and not jsonio.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "HAS_ORJSON", has_orjson)
+        profile = UnitProfile(unit_id="LACT-BIN", manufacturer="SCS")
+        profile.photos.append(PhotoRecord(file_path="/tmp/a.jpg", tags=["meter"]))
+        path = tmp_path / "LACT-BIN.snapshot"
+        profile.save_binary(str(path))
+        loaded = UnitProfile.load_binary(str(path))
+        assert loaded.manufacturer == "SCS"
+        assert loaded.photos[0].tags == ["meter"]
+
+    def test_save_recreates_removed_directory(self, tmp_path):
+        unit_dir = tmp_path / "units"
+        path = unit_dir / "LACT-001.json"
+        UnitProfile(unit_id="LACT-001").save(str(path))
+        path.unlink()
+        unit_dir.rmdir()
+        UnitProfile(unit_id="LACT-001").save(str(path))
+        assert UnitProfile.load(str(path)).unit_id == "LACT-001"
+
+    def test_save_many(self, tmp_path):
+        profiles = [UnitProfile(unit_id=f"LACT-{i:03d}") for i in range(3)]
+        UnitProfile.save_many(profiles, str(tmp_path / "units"))
+        names = sorted(p.name for p in (tmp_path / "units").iterdir())
+        assert names == ["LACT-000.json", "LACT-001.json", "LACT-002.json"]
+        assert UnitProfile.load(str(tmp_path / "units" / "LACT-002.json")).unit_id == "LACT-002"
 
     def test_setpoint_overrides(self):
         profile = UnitProfile(unit_id="LACT-001")